@@ -0,0 +1,42 @@
+"""Add response_style to person_profiles table
+
+Revision ID: 20261016_add_profile_response_style
+Revises: 20260126_add_max_tier
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261016_add_profile_response_style'
+down_revision = '20260126_add_max_tier'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Reuse the responsestyle enum created for the users table
+    op.add_column(
+        'person_profiles',
+        sa.Column(
+            'response_style',
+            postgresql.ENUM('supportive', 'balanced', 'direct', name='responsestyle', create_type=False),
+            nullable=False,
+            server_default='balanced'
+        )
+    )
+
+    # Carry over the user's existing preference
+    op.execute("""
+        UPDATE person_profiles
+        SET response_style = users.response_style
+        FROM users
+        WHERE person_profiles.user_id = users.id
+          AND users.response_style IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('person_profiles', 'response_style')
@@ -0,0 +1,54 @@
+"""Store chart_snapshots.input_hash as raw SHA-256 bytes
+
+Revision ID: 20261016_chart_input_hash_bytes
+Revises: 20261016_primary_profile_index
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_chart_input_hash_bytes'
+down_revision = '20261016_primary_profile_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 64 hex chars -> 32 raw bytes
+    op.alter_column(
+        'chart_snapshots',
+        'input_hash',
+        type_=sa.LargeBinary(32),
+        existing_type=sa.String(64),
+        existing_nullable=True,
+        postgresql_using="decode(input_hash, 'hex')",
+    )
+
+    # Build without locking writes on the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_chart_snapshots_input_lookup',
+            'chart_snapshots',
+            ['user_id', 'person_profile_id', 'mode', 'input_hash'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_chart_snapshots_input_lookup',
+            'chart_snapshots',
+            postgresql_concurrently=True,
+        )
+
+    op.alter_column(
+        'chart_snapshots',
+        'input_hash',
+        type_=sa.String(64),
+        existing_type=sa.LargeBinary(32),
+        existing_nullable=True,
+        postgresql_using="encode(input_hash, 'hex')",
+    )
@@ -0,0 +1,36 @@
+"""Add partial index for live OTP lookups
+
+Revision ID: 20261016_otp_live_index
+Revises: 20261016_chart_input_hash_bytes
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_otp_live_index'
+down_revision = '20261016_chart_input_hash_bytes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build without locking writes on the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_otps_live',
+            'otps',
+            ['target', 'purpose', 'created_at'],
+            postgresql_where=sa.text('is_used = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_otps_live',
+            'otps',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""Add unique partial index for primary person profiles
+
+Revision ID: 20261016_primary_profile_index
+Revises: 20261016_add_profile_response_style
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261016_primary_profile_index'
+down_revision = '20261016_add_profile_response_style'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the oldest active primary profile per user before enforcing uniqueness
+    op.execute("""
+        UPDATE person_profiles
+        SET is_primary = false
+        WHERE is_primary AND is_active
+          AND id NOT IN (
+              SELECT DISTINCT ON (user_id) id
+              FROM person_profiles
+              WHERE is_primary AND is_active
+              ORDER BY user_id, created_at, id
+          )
+    """)
+
+    # Build without locking writes on the table
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_person_profiles_primary',
+            'person_profiles',
+            ['user_id'],
+            unique=True,
+            postgresql_where=sa.text('is_primary AND is_active'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_person_profiles_primary',
+            'person_profiles',
+            postgresql_concurrently=True,
+        )
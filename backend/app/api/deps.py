@@ -1,16 +1,51 @@
 """API dependencies - database sessions, auth, etc."""
 
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 
-from fastapi import Depends, HTTPException, status
+import orjson
+from fastapi import Depends, HTTPException, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 from app.core.security import decode_access_token
 
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values with orjson.
+
+    OPT_NON_STR_KEYS keeps json.dumps' behaviour of accepting int keys.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# asyncpg's own statement cache plus SQLAlchemy's prepared statement cache,
+# so repeated queries skip parse/plan on the server. Both are asyncpg-only
+# connect args, so other drivers (e.g. aiosqlite in tests) get none.
+_connect_args = (
+    {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if make_url(settings.ASYNC_DATABASE_URL).drivername == "postgresql+asyncpg"
+    else {}
+)
+
 # Database engine and session
-engine = create_async_engine(settings.ASYNC_DATABASE_URL, echo=settings.DEBUG)
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=settings.DEBUG,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    # JSONType columns are (de)serialized through orjson rather than stdlib json
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args=_connect_args,
+)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 # Security scheme
@@ -26,16 +61,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
+async def _load_current_user(
+    credentials: HTTPAuthorizationCredentials,
+    db: AsyncSession,
+    *options,
 ):
-    """
-    Get current authenticated user from JWT token.
-
-    Raises HTTPException if token is invalid or user not found.
-    """
+    """Decode the JWT and fetch its user, applying extra loader options."""
     from sqlalchemy import select
+    from sqlalchemy.orm import raiseload
     from app.models.user import User
 
     token = credentials.credentials
@@ -56,8 +89,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Fetch user from database
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Fetch user from database. In debug/test runs, refuse any relationship
+    # not asked for via options so hidden lazy queries fail loudly there
+    # instead of reaching production.
+    if settings.DEBUG:
+        options = (*options, raiseload("*"))
+    result = await db.execute(
+        select(User).options(*options).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -70,6 +109,38 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get current authenticated user from JWT token.
+
+    Raises HTTPException if token is invalid or user not found.
+    """
+    return await _load_current_user(credentials, db)
+
+
+async def get_current_user_with_primary_profile(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the current user with `primary_profile` joined in the same query.
+
+    Only the columns served by /users/profile are loaded on the profile.
+    """
+    from sqlalchemy.orm import joinedload
+    from app.models.user import User
+    from app.services.person_profile_service import PROFILE_PUBLIC_COLUMNS
+
+    return await _load_current_user(
+        credentials,
+        db,
+        joinedload(User.primary_profile).load_only(*PROFILE_PUBLIC_COLUMNS),
+    )
+
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
@@ -128,3 +199,18 @@ async def get_current_tier(
             return SubscriptionTier.FREE
 
     return SubscriptionTier.FREE
+
+
+def cache_control(max_age: int, private: bool = True) -> Callable[[Response], None]:
+    """
+    Build a dependency that sets Cache-Control on the response.
+
+    Use as `dependencies=[Depends(cache_control(30))]`. Only applies when the
+    endpoint returns data; a Response returned directly must set its own header.
+    """
+    value = f"{'private' if private else 'public'}, max-age={max_age}"
+
+    def _set_cache_control(response: Response) -> None:
+        response.headers["Cache-Control"] = value
+
+    return _set_cache_control
@@ -6,6 +6,7 @@ from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy import func, select, or_
+from sqlalchemy.orm import contains_eager, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_admin_user
@@ -227,7 +228,14 @@ async def get_admin_users(
     total = total_result.scalar() or 0
 
     # Get users with pagination
-    users_query = base_query.order_by(User.created_at.desc()).offset(offset).limit(page_size)
+    # Profile is already outer-joined - populate user.profile from that join
+    users_query = (
+        base_query
+        .options(contains_eager(User.profile))
+        .order_by(User.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
     users_result = await db.execute(users_query)
     users = users_result.scalars().all()
 
@@ -288,7 +296,7 @@ async def get_admin_user_detail(
 ):
     """Get single user details."""
     result = await db.execute(
-        select(User).where(User.id == user_id)
+        select(User).options(joinedload(User.profile)).where(User.id == user_id)
     )
     user = result.scalar_one_or_none()
 
@@ -458,7 +466,10 @@ async def get_admin_subscriptions(
     for sub in subscriptions:
         # Get user info
         user_result = await db.execute(
-            select(User).outerjoin(Profile).where(User.id == sub.user_id)
+            select(User)
+            .outerjoin(Profile)
+            .options(contains_eager(User.profile))
+            .where(User.id == sub.user_id)
         )
         user = user_result.scalar_one_or_none()
 
@@ -3,6 +3,7 @@
 from datetime import date, time
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -393,7 +394,8 @@ async def get_birth_chart(
 
     response["vedic_features"] = vedic_features
 
-    return response
+    # Plain JSON types only - hand straight to orjson, skipping jsonable_encoder
+    return ORJSONResponse(response)
 
 
 @router.get("/current", response_model=ChartSnapshotResponse)
@@ -542,7 +544,7 @@ async def get_dasha_periods(
     current_dasha = VimshottariDasha.get_current_dasha(dasha_periods)
 
     # Format response
-    return {
+    return ORJSONResponse({
         "profile_name": profile.name,
         "moon_nakshatra": astrology_data.moon_nakshatra,
         "moon_sign": astrology_data.moon_sign.sign,
@@ -566,7 +568,7 @@ async def get_dasha_periods(
             }
             for d in dasha_periods
         ],
-    }
+    })
 
 
 @router.get("/yogas")
@@ -644,7 +646,7 @@ async def get_yogas(
         houses=astrology_data.houses,
     )
 
-    return {
+    return ORJSONResponse({
         "profile_name": profile.name,
         "ascendant": ascendant_sign,
         "yogas": [
@@ -663,7 +665,7 @@ async def get_yogas(
         ],
         "total_yogas": len(yogas),
         "benefic_yogas": len([y for y in yogas if y.is_benefic]),
-    }
+    })
 
 
 # Planet information for the visualization
@@ -1,6 +1,6 @@
 """Guidance routes - the core /ask endpoint."""
 
-import uuid
+from uuid import uuid4
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,11 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.guidance import GuidanceRequest, GuidanceResponse
 from app.schemas.subscription import UsageCheckResponse
 from app.api.deps import get_db, get_current_user
-from app.services.credits_service import CreditsService
+from app.services.credits_service import CreditsService, invalidate_usage_cache
 from app.services.guidance_service import GuidanceService, is_greeting, get_greeting_response
 from app.services.chart_filter_service import compute_chart_for_tier
 from app.services.person_profile_service import PersonProfileService
-from app.models.user import Language, ResponseStyle
+from app.models.user import GuidanceMode, Language
 
 router = APIRouter()
 
@@ -40,6 +40,7 @@ async def ask_guidance(
     6. Get LLM response with tier-specific prompt restrictions
     7. Validate response (Pro tier only - Generator + Validator pipeline)
     8. Deduct credit and save to profile's conversation history
+       (skipped when the answer is served from the response cache)
     9. Return structured response
 
     **Cost per chat:**
@@ -72,7 +73,7 @@ async def ask_guidance(
             )
 
     # Step 2: Check usage limits
-    usage_status = await credits_service.check_can_ask(current_user.id)
+    usage_status = await credits_service.check_can_ask(current_user.id, use_cache=False)
 
     if not usage_status.can_ask_question:
         raise HTTPException(
@@ -106,10 +107,9 @@ async def ask_guidance(
 
     language = request.language or Language.ENGLISH
 
-    # Get response style from profile (defaults to BALANCED if not set)
-    response_style = getattr(profile, 'response_style', ResponseStyle.BALANCED) or ResponseStyle.BALANCED
+    response_style = profile.response_style
 
-    response = await guidance_service.get_guidance(
+    response, cache_hit = await guidance_service.get_guidance(
         request=request,
         chart=chart,
         language=language,
@@ -118,12 +118,26 @@ async def ask_guidance(
         response_style=response_style,
     )
 
-    # Step 8: Deduct usage
-    message_id = str(uuid.uuid4())
-    await credits_service.deduct_usage(current_user.id, message_id)
-
-    # TODO: Save to conversation history for this profile
-    # This enables context continuity for future guidance sessions
+    # A repeat of an already-answered question costs nothing and is already
+    # in the history, so there is nothing to charge or record
+    if cache_hit:
+        return response
+
+    # Step 8: Deduct usage and save to the profile's conversation history
+    # Both are committed together so usage is never charged without history
+    message_id = uuid4().hex
+    await credits_service.deduct_usage(current_user.id, message_id, commit=False)
+    profile_service.add_conversation_turn(
+        user_id=current_user.id,
+        profile_id=profile.id,
+        question=request.question,
+        response=response,
+        mode=request.mode or GuidanceMode.BOTH,
+        language=language,
+        message_id=message_id,
+    )
+    await db.commit()
+    invalidate_usage_cache(current_user.id)
 
     return response
 
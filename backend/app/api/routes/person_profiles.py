@@ -1,7 +1,7 @@
 """Person Profile routes - manage profiles for self and others."""
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.person_profile import (
@@ -100,11 +100,13 @@ async def list_profiles(
 
     max_profiles = PersonProfileService.PROFILE_LIMITS.get(tier, 1)
 
-    return PersonProfileListResponse(
+    # Serialize directly - skips FastAPI's validate-then-dump pass on response_model
+    body = PersonProfileListResponse(
         profiles=summaries,
         total=len(summaries),
         max_profiles=max_profiles,
     )
+    return Response(content=body.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -1,20 +1,43 @@
 """Subscription routes."""
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from app.schemas.subscription import SubscriptionResponse, CreditBalance, UsageStatus
 from app.models.subscription import SubscriptionTier, SubscriptionStatus
-from app.api.deps import get_db, get_current_user
+from app.api.deps import cache_control, get_db, get_current_user
 from app.services.credits_service import CreditsService
 from app.services.payment_service import PaymentService
-from app.core.tier_config import get_tier_config, get_tier_display_info, TIER_CONFIGS
+from app.core.tier_config import get_tier_config, get_tier_display_info, TIER_CONFIGS, TIER_ORDER
 from app.core.config import settings
 
 router = APIRouter()
 
+# Upgrade suggestions shown when a user hits their limit, keyed by current tier
+UPGRADE_TIERS = {
+    "free": (
+        {"tier": "starter", "price_display": "₹99/month"},
+        {"tier": "pro", "price_display": "₹699/month"},
+    ),
+    "starter": (
+        {"tier": "pro", "price_display": "₹699/month"},
+        {"tier": "max", "price_display": "₹1,999/month"},
+    ),
+    "pro": (
+        {"tier": "max", "price_display": "₹1,999/month"},
+    ),
+    "max": (),
+}
+
+# Plan listing never changes at runtime, so the /plans body is encoded once
+PLANS_BODY = to_json({"plans": [get_tier_display_info(tier) for tier in TIER_ORDER]})
+
+# Plans only change on deploy - let browsers and CDNs hold them for an hour
+PLANS_CACHE_MAX_AGE = 3600
+
 
 class PaymentVerification(BaseModel):
     """Request body for payment verification."""
@@ -160,7 +183,7 @@ async def verify_payment(
 
     # Get tier from order (stored in notes)
     try:
-        order = payment_service.client.order.fetch(verification.razorpay_order_id)
+        order = await payment_service.fetch_order(verification.razorpay_order_id)
         tier_value = order.get("notes", {}).get("tier")
         if not tier_value:
             raise ValueError("Tier not found in order")
@@ -253,14 +276,14 @@ async def get_available_plans():
 
     Returns tier information from centralized tier_config.py
     """
-    plans = []
-    for tier in [SubscriptionTier.FREE, SubscriptionTier.STARTER, SubscriptionTier.PRO, SubscriptionTier.MAX]:
-        plans.append(get_tier_display_info(tier))
-
-    return {"plans": plans}
+    return Response(
+        content=PLANS_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={PLANS_CACHE_MAX_AGE}"},
+    )
 
 
-@router.get("/plans/{tier_name}")
+@router.get("/plans/{tier_name}", dependencies=[Depends(cache_control(PLANS_CACHE_MAX_AGE, private=False))])
 async def get_plan_details(tier_name: str):
     """Get detailed information about a specific plan (case-insensitive)."""
     try:
@@ -290,20 +313,7 @@ async def check_can_ask_question(
     # Suggest upgrade tiers based on current tier (use lowercase for frontend consistency)
     upgrade_tiers = []
     if not usage.can_ask_question:
-        if usage.tier.upper() == SubscriptionTier.FREE.value:
-            upgrade_tiers = [
-                {"tier": "starter", "price_display": "₹99/month"},
-                {"tier": "pro", "price_display": "₹699/month"},
-            ]
-        elif usage.tier.upper() == SubscriptionTier.STARTER.value:
-            upgrade_tiers = [
-                {"tier": "pro", "price_display": "₹699/month"},
-                {"tier": "max", "price_display": "₹1,999/month"},
-            ]
-        elif usage.tier.upper() == SubscriptionTier.PRO.value:
-            upgrade_tiers = [
-                {"tier": "max", "price_display": "₹1,999/month"},
-            ]
+        upgrade_tiers = UPGRADE_TIERS.get(usage.tier.lower(), ())
 
     return {
         "can_ask": usage.can_ask_question,
@@ -1,22 +1,77 @@
 """User routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schemas.user import ProfileCreate, ProfileUpdate, ProfileResponse, UserResponse
-from app.api.deps import get_db, get_current_user
+from app.schemas.user import ProfileCreate, ProfileUpdate, ProfileResponse, ProfilePublic, UserResponse
+from app.api.deps import (
+    cache_control,
+    get_db,
+    get_current_user,
+    get_current_user_with_primary_profile,
+)
 from app.models.person_profile import PersonProfile
+from app.services.person_profile_service import (
+    PRIMARY_PROFILE_PUBLIC_STMT,
+    PROFILE_PUBLIC_COLUMNS,
+    cache_primary_profile,
+    get_cached_primary_profile,
+    invalidate_primary_profile_cache,
+    primary_profile_etag,
+)
 
 router = APIRouter()
 
+# ProfileUpdate field -> PersonProfile column
+FIELD_MAP = {
+    "full_name": "name",
+    "display_name": "nickname",
+    "time_of_birth": "time_of_birth",
+    "place_of_birth": "place_of_birth",
+    "response_style": "response_style",
+}
 
-@router.get("/me", response_model=UserResponse)
+
+async def _load_primary_profile(db: AsyncSession, user_id) -> PersonProfile:
+    """Fetch the public columns of the user's primary profile or raise 404."""
+    result = await db.execute(PRIMARY_PROFILE_PUBLIC_STMT, {"user_id": user_id})
+    profile = result.scalar_one_or_none()
+
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No profile found. Please complete onboarding.",
+        )
+    return profile
+
+
+def _require_primary_profile(user) -> PersonProfile:
+    """Return the user's joined-in primary profile or raise 404."""
+    profile = user.primary_profile
+
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No profile found. Please complete onboarding.",
+        )
+    return profile
+
+
+@router.get("/me", response_model=UserResponse, dependencies=[Depends(cache_control(30))])
 async def get_current_user_info(
     current_user=Depends(get_current_user),
 ):
     """Get current user information."""
-    return current_user
+    # Built explicitly - UserResponse.is_verified maps to User.email_verified
+    return UserResponse(
+        id=current_user.id,
+        email=current_user.email,
+        phone_number=current_user.phone_number,
+        is_active=current_user.is_active,
+        is_verified=current_user.email_verified,
+        is_phone_verified=current_user.is_phone_verified or False,
+    )
 
 
 @router.post("/profile", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
@@ -41,95 +96,101 @@ async def create_profile(
     )
 
 
-@router.get("/profile")
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match covers the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
+@router.get("/profile", response_model=ProfilePublic)
 async def get_profile(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get current user's primary profile."""
-    # Get the primary person profile for this user
-    result = await db.execute(
-        select(PersonProfile).where(
-            PersonProfile.user_id == current_user.id,
-            PersonProfile.is_primary == True,
-            PersonProfile.is_active == True,
-        )
-    )
-    profile = result.scalar_one_or_none()
-
-    if not profile:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No profile found. Please complete onboarding.",
-        )
-
-    # Return in the format expected by frontend
-    return {
-        "id": profile.id,
-        "user_id": current_user.id,  # For localStorage key consistency
-        "full_name": profile.name,
-        "display_name": profile.nickname or profile.name,
-        "date_of_birth": profile.date_of_birth.isoformat() if profile.date_of_birth else None,
-        "time_of_birth": profile.time_of_birth.isoformat() if profile.time_of_birth else None,
-        "place_of_birth": profile.place_of_birth,
-        "guidance_mode": "both",  # Default
-        "language": "hinglish",  # Default
-        "has_birth_time": profile.time_of_birth is not None,
-    }
-
+    """
+    Get current user's primary profile.
 
-@router.patch("/profile")
+    Sends a weak ETag and answers 304 when If-None-Match already matches it.
+    """
+    cached = get_cached_primary_profile(current_user.id)
+    if cached is not None:
+        payload, etag = cached
+    else:
+        # Only a cache miss touches the profile table
+        profile = await _load_primary_profile(db, current_user.id)
+        payload = ProfilePublic.from_profile(profile, current_user.id)
+        etag = primary_profile_etag(profile)
+        cache_primary_profile(current_user.id, payload, etag)
+
+    # no-cache: the browser keeps the body but revalidates with the ETag
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return payload
+
+
+@router.patch("/profile", response_model=ProfilePublic)
 async def update_profile(
     profile_data: ProfileUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user=Depends(get_current_user),
+    current_user=Depends(get_current_user_with_primary_profile),
 ):
     """
     Update user profile.
 
     Note: Changing birth details will trigger chart recomputation.
     """
-    # Get the primary person profile for this user
-    result = await db.execute(
-        select(PersonProfile).where(
-            PersonProfile.user_id == current_user.id,
-            PersonProfile.is_primary == True,
-            PersonProfile.is_active == True,
-        )
+    where_primary = (
+        PersonProfile.user_id == current_user.id,
+        PersonProfile.is_primary == True,
+        PersonProfile.is_active == True,
     )
-    profile = result.scalar_one_or_none()
 
-    if not profile:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No profile found. Please complete onboarding.",
-        )
-
-    # Update fields if provided
+    # Map provided fields onto model columns
     update_data = profile_data.model_dump(exclude_unset=True)
+    mapped_updates = {
+        FIELD_MAP[field]: value
+        for field, value in update_data.items()
+        if field in FIELD_MAP
+    }
+
+    if not mapped_updates:
+        # Nothing to write - skip the UPDATE and the commit
+        profile = _require_primary_profile(current_user)
+        response.headers["ETag"] = primary_profile_etag(profile)
+        return ProfilePublic.from_profile(profile, current_user.id)
 
-    if "full_name" in update_data:
-        profile.name = update_data["full_name"]
-    if "display_name" in update_data:
-        profile.nickname = update_data["display_name"]
-    if "time_of_birth" in update_data:
-        profile.time_of_birth = update_data["time_of_birth"]
-    if "place_of_birth" in update_data:
-        profile.place_of_birth = update_data["place_of_birth"]
+    # Only match the row if at least one value actually changes
+    changed = or_(*(
+        getattr(PersonProfile, column).is_distinct_from(value)
+        for column, value in mapped_updates.items()
+    ))
+
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh;
+    # only the columns the response needs come back
+    result = await db.execute(
+        update(PersonProfile)
+        .where(*where_primary, changed)
+        .values(**mapped_updates)
+        .returning(*PROFILE_PUBLIC_COLUMNS)
+    )
+    profile = result.one_or_none()
+
+    if not profile:
+        # Either there is no profile or the PATCH re-sent the stored values
+        profile = _require_primary_profile(current_user)
+        response.headers["ETag"] = primary_profile_etag(profile)
+        return ProfilePublic.from_profile(profile, current_user.id)
 
     await db.commit()
-    await db.refresh(profile)
-
-    # Return in the format expected by frontend
-    return {
-        "id": profile.id,
-        "user_id": current_user.id,  # For localStorage key consistency
-        "full_name": profile.name,
-        "display_name": profile.nickname or profile.name,
-        "date_of_birth": profile.date_of_birth.isoformat() if profile.date_of_birth else None,
-        "time_of_birth": profile.time_of_birth.isoformat() if profile.time_of_birth else None,
-        "place_of_birth": profile.place_of_birth,
-        "guidance_mode": "both",
-        "language": "hinglish",
-        "has_birth_time": profile.time_of_birth is not None,
-    }
+    invalidate_primary_profile_cache(current_user.id)
+
+    response.headers["ETag"] = primary_profile_etag(profile)
+    return ProfilePublic.from_profile(profile, current_user.id)
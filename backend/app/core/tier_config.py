@@ -4,14 +4,14 @@ Tier Configuration - Feature access and limits per subscription tier.
 This is the source of truth for what each tier can access.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
 from enum import Enum
 
 from app.models.subscription import SubscriptionTier
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AstrologyFeatures:
     """Astrology features available per tier."""
     sun_sign: bool = True
@@ -25,7 +25,7 @@ class AstrologyFeatures:
     use_birth_time: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumerologyFeatures:
     """Numerology features available per tier."""
     # Core numbers
@@ -42,7 +42,7 @@ class NumerologyFeatures:
     pinnacles_challenges: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResponseFeatures:
     """Response generation features per tier."""
     max_characters: int = 400
@@ -53,12 +53,17 @@ class ResponseFeatures:
     priority_response: bool = False
 
     # LLM Model configuration
-    # Model names: "haiku", "sonnet", "opus" (resolved to full names at runtime)
+    # Model names: "haiku", "sonnet", "opus" (resolved to full IDs in llm_service.TIER_MODELS)
     generator_model: str = "haiku"  # Model for generating responses
     validator_model: Optional[str] = None  # Model for validation (Pro only)
 
 
-@dataclass
+_DEFAULT_ASTROLOGY = AstrologyFeatures()
+_DEFAULT_NUMEROLOGY = NumerologyFeatures()
+_DEFAULT_RESPONSE = ResponseFeatures()
+
+
+@dataclass(frozen=True, slots=True)
 class TierConfig:
     """Complete configuration for a subscription tier."""
     tier: SubscriptionTier
@@ -76,10 +81,10 @@ class TierConfig:
     can_use_numerology: bool = True
     can_use_both: bool = False  # Combined mode
 
-    # Feature sets
-    astrology: AstrologyFeatures = field(default_factory=AstrologyFeatures)
-    numerology: NumerologyFeatures = field(default_factory=NumerologyFeatures)
-    response: ResponseFeatures = field(default_factory=ResponseFeatures)
+    # Feature sets (frozen, so the defaults can be shared between configs)
+    astrology: AstrologyFeatures = _DEFAULT_ASTROLOGY
+    numerology: NumerologyFeatures = _DEFAULT_NUMEROLOGY
+    response: ResponseFeatures = _DEFAULT_RESPONSE
 
     # History
     history_days: Optional[int] = None  # None = no history, 0 = unlimited
@@ -348,12 +353,15 @@ MAX_TIER = TierConfig(
 # TIER LOOKUP
 # ============================================================================
 
-TIER_CONFIGS = {
-    SubscriptionTier.FREE: FREE_TIER,
-    SubscriptionTier.STARTER: STARTER_TIER,
-    SubscriptionTier.PRO: PRO_TIER,
-    SubscriptionTier.MAX: MAX_TIER,
-}
+# Tiers in pricing order (cheapest first)
+TIER_ORDER = (
+    SubscriptionTier.FREE,
+    SubscriptionTier.STARTER,
+    SubscriptionTier.PRO,
+    SubscriptionTier.MAX,
+)
+
+TIER_CONFIGS = dict(zip(TIER_ORDER, (FREE_TIER, STARTER_TIER, PRO_TIER, MAX_TIER)))
 
 
 def get_tier_config(tier: SubscriptionTier) -> TierConfig:
@@ -362,9 +370,16 @@ def get_tier_config(tier: SubscriptionTier) -> TierConfig:
 
 
 def get_tier_display_info(tier: SubscriptionTier) -> dict:
-    """Get display information for pricing page."""
-    config = get_tier_config(tier)
+    """
+    Get display information for pricing page.
+
+    Returns the shared precomputed payload - treat it as read-only.
+    """
+    return TIER_DISPLAY_INFO.get(tier) or TIER_DISPLAY_INFO[SubscriptionTier.FREE]
 
+
+def _build_display_info(tier: SubscriptionTier, config: TierConfig) -> dict:
+    """Build display information for one tier."""
     return {
         "tier": tier.value,
         "name": tier.value.title(),
@@ -379,8 +394,8 @@ def get_tier_display_info(tier: SubscriptionTier) -> dict:
             "daily_limit": config.questions_daily,
             "max_chars": config.response.max_characters,
         },
-        "features": _get_feature_list(config),
-        "restrictions": _get_restriction_list(config),
+        "features": TIER_FEATURES[tier][0],
+        "restrictions": TIER_FEATURES[tier][1],
     }
 
 
@@ -476,3 +491,16 @@ def _get_restriction_list(config: TierConfig) -> List[str]:
         restrictions.append("No weekly summaries")
 
     return restrictions
+
+
+# Tier configs are constant, so the pricing payloads are built once at import.
+# Feature/restriction lists are frozen as tuples since they are shared.
+TIER_FEATURES: Dict[SubscriptionTier, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    tier: (tuple(_get_feature_list(config)), tuple(_get_restriction_list(config)))
+    for tier, config in TIER_CONFIGS.items()
+}
+
+TIER_DISPLAY_INFO = {
+    tier: _build_display_info(tier, config)
+    for tier, config in TIER_CONFIGS.items()
+}
@@ -9,10 +9,14 @@ Supports both:
 - Western/Tropical
 """
 
-from datetime import date, time, datetime
-from typing import Dict, Optional, Tuple, Literal
+import math
+import sys
+import threading
+from datetime import date, time, datetime, timedelta
+from typing import ClassVar, Dict, List, Optional, Tuple, Literal
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from app.schemas.chart import AstrologyData, PlanetPosition, TransitData
 
@@ -26,6 +30,95 @@ except ImportError:
     SWISSEPH_AVAILABLE = False
 
 
+# Nakshatra/pada counts per degree of longitude (27 and 108 per 360°)
+_NAKSHATRAS_PER_DEGREE = 27.0 / 360.0
+_PADAS_PER_DEGREE = 108.0 / 360.0
+
+
+def _round2(value: float) -> float:
+    """
+    Round a non-negative degree to 2 decimals (half-up).
+
+    Cheaper than round(value, 2); only used for display degrees in [0, 30).
+    """
+    return int(value * 100.0 + 0.5) / 100.0
+
+
+def _build_dignity_table(
+    exaltation: Dict[str, Tuple[str, int, str]],
+    moolatrikona: Dict[str, Tuple[str, int, int]],
+    own_signs: Dict[str, list],
+) -> Dict[Tuple[str, str], Tuple[str, Optional[Tuple[int, int]]]]:
+    """
+    Flatten the dignity rules into (planet, sign) -> (dignity, moolatrikona_range).
+
+    moolatrikona_range is set only where a degree check can still upgrade the
+    dignity; exaltation/debilitation always win. Missing keys mean "neutral".
+    """
+    table = {}
+    for planet, (exalt_sign, _, debil_sign) in exaltation.items():
+        for sign in own_signs.get(planet, ()):
+            table[(planet, sign)] = ("own_sign", None)
+        if planet in moolatrikona:
+            mt_sign, mt_start, mt_end = moolatrikona[planet]
+            base = table.get((planet, mt_sign), ("neutral", None))[0]
+            table[(planet, mt_sign)] = (base, (mt_start, mt_end))
+        table[(planet, debil_sign)] = ("debilitated", None)
+        table[(planet, exalt_sign)] = ("exalted", None)
+    return table
+
+
+# Tropical zodiac date ranges (approximate): (month, day) each sign begins on
+_TROPICAL_SIGN_STARTS = (
+    (1, 20, "Aquarius"),
+    (2, 19, "Pisces"),
+    (3, 21, "Aries"),
+    (4, 20, "Taurus"),
+    (5, 21, "Gemini"),
+    (6, 21, "Cancer"),
+    (7, 23, "Leo"),
+    (8, 23, "Virgo"),
+    (9, 23, "Libra"),
+    (10, 23, "Scorpio"),
+    (11, 22, "Sagittarius"),
+    (12, 22, "Capricorn"),
+)
+
+
+def _build_sun_sign_table(sign_starts: Tuple[Tuple[int, int, str], ...]) -> Tuple[str, ...]:
+    """(month * 32 + day) -> sun sign, filled by walking the sign boundaries once."""
+    table = []
+    sign = sign_starts[-1][2]  # early January is still the year-end sign
+    boundaries = iter(sign_starts)
+    next_start = next(boundaries)
+    for index in range(13 * 32):
+        if next_start is not None and index == next_start[0] * 32 + next_start[1]:
+            sign = next_start[2]
+            next_start = next(boundaries, None)
+        table.append(sign)
+    return tuple(table)
+
+
+# Keyed on month/day rather than day-of-year so leap years need no special case.
+_SUN_SIGN_BY_MONTH_DAY = _build_sun_sign_table(_TROPICAL_SIGN_STARTS)
+
+
+def _build_combustion_thresholds(
+    ranges: Dict[str, int],
+    retrograde_ranges: Dict[str, int],
+) -> Dict[Tuple[str, bool], int]:
+    """
+    Flatten the combustion orbs into (planet, is_retrograde) -> orb.
+
+    Missing keys mean the planet is never combust.
+    """
+    table = {}
+    for planet, orb in ranges.items():
+        table[(planet, False)] = orb
+        table[(planet, True)] = retrograde_ranges.get(planet, orb)
+    return table
+
+
 class ZodiacSystem(str, Enum):
     """Zodiac system to use for calculations."""
     SIDEREAL = "sidereal"  # Vedic/Indian
@@ -47,14 +140,171 @@ class NodeType(str, Enum):
     MEAN_NODE = "mean"    # Mean node (some Vedic traditions prefer this)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GeoLocation:
-    """Geographic location for chart calculation."""
+    """Geographic location for chart calculation (immutable, hashable)."""
     latitude: float
     longitude: float
     timezone_offset: float  # Hours from UTC
 
 
+# Fallback epoch (J2000.0) and Lahiri ayanamsa: 23.85° on Jan 1, 2000,
+# precessing ~50.3" per year
+_J2000 = date(2000, 1, 1)
+_AYANAMSA_J2000 = 23.85
+_AYANAMSA_RATE_PER_DAY = 50.3 / 3600 / 365.25
+
+
+def _fallback_ayanamsa(days_since_j2000: float) -> float:
+    """Approximate Lahiri ayanamsa in degrees for the fallback engine."""
+    return _AYANAMSA_J2000 + days_since_j2000 * _AYANAMSA_RATE_PER_DAY
+
+
+# Fallback coefficients for Mercury..Saturn, one row per planet:
+# (mean at J2000, daily motion, sin(M) term, sin(2M) term, geocentric offset).
+# The inner planets get +180 as a rough heliocentric -> geocentric shift.
+_FALLBACK_PLANET_COEFFS = (
+    (252.2509, 4.09233445, 23.4400, 2.9818, 180),  # Mercury (88 day orbit)
+    (181.9798, 1.60213034, 0.7758, 0.0, 180),      # Venus (225 day orbit)
+    (355.4330, 0.52402068, 10.6912, 0.6228, 0),    # Mars (687 day orbit)
+    (34.3515, 0.08308529, 5.5549, 0.1683, 0),      # Jupiter (12 year orbit)
+    (50.0774, 0.03349791, 6.3585, 0.2204, 0),      # Saturn (29 year orbit)
+)
+
+
+def _moon_correction(mean_anomaly_rad: float, elongation_rad: float) -> float:
+    """
+    Major lunar perturbations in degrees: equation of center, evection,
+    variation and the second-order anomaly term.
+    """
+    sin = math.sin
+    double_elongation = 2 * elongation_rad
+    return 6.2886 * sin(mean_anomaly_rad) + \
+        1.2740 * sin(double_elongation - mean_anomaly_rad) + \
+        0.6583 * sin(double_elongation) + \
+        0.2136 * sin(2 * mean_anomaly_rad)
+
+
+def _fallback_longitudes(
+    days_since_j2000: float,
+    ayanamsa: float,
+) -> Tuple[float, float, float, float, float, float, float, float]:
+    """
+    Approximate sidereal longitudes for the fallback engine.
+
+    Pure numeric kernel (no objects, no class lookups) so it stays cheap to call
+    in loops over many dates.
+
+    Returns:
+        (sun, moon, mercury, venus, mars, jupiter, saturn, rahu) in degrees 0-360
+    """
+    sin = math.sin
+    radians = math.radians
+    d = days_since_j2000
+
+    # Sun: mean anomaly plus equation of center (elliptical orbit correction)
+    sun_mean_anomaly_rad = radians((357.5291 + 0.98560028 * d) % 360)
+    sun_eoc = 1.9148 * sin(sun_mean_anomaly_rad) + \
+              0.0200 * sin(2 * sun_mean_anomaly_rad) + \
+              0.0003 * sin(3 * sun_mean_anomaly_rad)
+    sun_tropical = (280.4665 + 0.98564736 * d + sun_eoc) % 360
+
+    # Moon: mean longitude plus major perturbations (lunar orbit is complex)
+    moon_mean_longitude = (218.3165 + 13.17639648 * d) % 360
+    moon_elongation_rad = radians((297.8502 + 12.19074912 * d) % 360)
+    moon_mean_anomaly_rad = radians((134.9634 + 13.06499295 * d) % 360)
+    moon_correction = _moon_correction(moon_mean_anomaly_rad, moon_elongation_rad)
+    moon_tropical = (moon_mean_longitude + moon_correction) % 360
+
+    # Mercury..Saturn: mean longitude plus a two-term correction (see table)
+    planets = []
+    for base, rate, k1, k2, offset in _FALLBACK_PLANET_COEFFS:
+        mean = (base + rate * d) % 360
+        mean_rad = radians(mean)
+        correction = k1 * sin(mean_rad) + k2 * sin(2 * mean_rad)
+        planets.append(((mean + correction + offset) % 360 - ayanamsa) % 360)
+    mercury, venus, mars, jupiter, saturn = planets
+
+    # Rahu (North Node) - 18.6 year retrograde cycle
+    rahu_mean = (125.0445 - 0.05295377 * d) % 360
+
+    return (
+        (sun_tropical - ayanamsa) % 360,
+        (moon_tropical - ayanamsa) % 360,
+        mercury,
+        venus,
+        mars,
+        jupiter,
+        saturn,
+        (rahu_mean - ayanamsa) % 360,
+    )
+
+
+# Swiss Ephemeris results are pure functions of (jd, body, flags) plus the global
+# sidereal mode, so they are memoized with the mode as part of the key. Callers
+# must already have set that mode on swe. JDs are rounded to the second so that
+# repeat queries for the same instant ("today", a re-queried birth) share entries.
+
+def _round_jd(jd: float) -> float:
+    """Round a Julian Day to the nearest second."""
+    return round(jd * 86400) / 86400
+
+
+@lru_cache(maxsize=1024)
+def _julian_day_cached(year: int, month: int, day: int, hour: float) -> float:
+    """Return the (rounded) Julian Day for a calendar date and UTC hour."""
+    return _round_jd(swe.julday(year, month, day, hour))
+
+
+@lru_cache(maxsize=4096)
+def _calc_planet_cached(jd: float, planet_id: int, flags: int, sid_mode: int) -> Tuple[float, float]:
+    """Return (longitude, longitude_speed) for a body."""
+    result, _ = swe.calc_ut(jd, planet_id, flags)
+    return result[0], result[3]
+
+
+@lru_cache(maxsize=1024)
+def _calc_houses_cached(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    hsys: bytes,
+    flags: int,
+    sid_mode: int,
+) -> Tuple[tuple, tuple]:
+    """Return (cusps, ascmc) for a location (lat/lon rounded to 4dp by callers)."""
+    if flags & swe.FLG_SIDEREAL:
+        return swe.houses_ex(jd, latitude, longitude, hsys, flags)
+    return swe.houses(jd, latitude, longitude, hsys)
+
+
+def _batch_calc(
+    jds: List[float],
+    planet_id: int,
+    flags: int,
+) -> Tuple[List[float], List[float]]:
+    """
+    Return (longitudes, speeds) for one body across many Julian Days.
+
+    For date ranges: one tight loop per body with the FFI call bound locally,
+    and uncached so a long range doesn't evict natal/transit entries.
+    """
+    calc_ut = swe.calc_ut
+    longitudes = [0.0] * len(jds)
+    speeds = [0.0] * len(jds)
+    for i, jd in enumerate(jds):
+        result, _ = calc_ut(jd, planet_id, flags)
+        longitudes[i] = result[0]
+        speeds[i] = result[3]
+    return longitudes, speeds
+
+
+@lru_cache(maxsize=1024)
+def _ayanamsa_cached(jd: float, sid_mode: int) -> float:
+    """Return the ayanamsa for a JD (rounded to 6dp by callers) under sid_mode."""
+    return swe.get_ayanamsa_ut(jd)
+
+
 class AstrologyEngine:
     """
     Astrology computation engine using Swiss Ephemeris.
@@ -69,17 +319,19 @@ class AstrologyEngine:
     Default: Sidereal/Vedic with Lahiri Ayanamsa (most common in India)
     """
 
-    # Zodiac signs
-    SIGNS = [
+    # Zodiac signs. Name tables are interned so every chart field and the
+    # dignity/nakshatra dict keys share one object per name (multi-word names
+    # like "Purva Phalguni" are not interned automatically)
+    SIGNS = tuple(map(sys.intern, (
         "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-    ]
+    )))
 
     # Hindi sign names (for display)
-    SIGNS_HINDI = [
+    SIGNS_HINDI = tuple(map(sys.intern, (
         "Mesha", "Vrishabha", "Mithuna", "Karka", "Simha", "Kanya",
         "Tula", "Vrishchika", "Dhanu", "Makara", "Kumbha", "Meena"
-    ]
+    )))
 
     # Planet constants (Swiss Ephemeris)
     PLANETS = {
@@ -101,23 +353,33 @@ class AstrologyEngine:
         "pluto": 9,
     }
 
+    # Sidereal mode last set on swe (global C state); only touched via _ensure_sid_mode
+    _current_sid_mode: ClassVar[Optional[int]] = None
+    _sid_mode_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # (name, id) pairs precomputed for the compute loops
+    _PLANET_ITEMS = tuple(PLANETS.items())
+    _PLANET_ITEMS_WITH_OUTER = _PLANET_ITEMS + tuple(OUTER_PLANETS.items())
+    _PLANET_IDS = tuple(PLANETS.values())
+    _VEDIC_DEFAULT_NAMES = tuple(PLANETS) + ("ketu",)
+
     # Nakshatras (27 lunar mansions) - each spans 13°20' (800 minutes)
-    NAKSHATRAS = [
+    NAKSHATRAS = tuple(map(sys.intern, (
         "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
         "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
         "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
         "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
         "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-    ]
+    )))
 
     # Nakshatra lords (for dasha calculations - future feature)
-    NAKSHATRA_LORDS = [
+    NAKSHATRA_LORDS = tuple(map(sys.intern, (
         "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
         "Jupiter", "Saturn", "Mercury", "Ketu", "Venus", "Sun",
         "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury",
         "Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu",
         "Jupiter", "Saturn", "Mercury"
-    ]
+    )))
 
     # Ayanamsa constants
     AYANAMSA_LAHIRI = 1  # swe.SIDM_LAHIRI - most common in India
@@ -162,6 +424,9 @@ class AstrologyEngine:
         "saturn": ("Aquarius", 0, 20), # Aquarius 0-20°
     }
 
+    # (planet, sign) -> (dignity, moolatrikona degree range), see _calculate_dignity
+    _DIGNITY_TABLE = _build_dignity_table(EXALTATION, MOOLATRIKONA, OWN_SIGNS)
+
     # Combustion ranges (degrees from Sun where planet loses strength)
     COMBUSTION_RANGE = {
         "moon": 12,
@@ -171,6 +436,15 @@ class AstrologyEngine:
         "venus": 10,    # 8 if retrograde
         "saturn": 15,
     }
+    # Mercury and Venus have smaller range when retrograde
+    RETROGRADE_COMBUSTION_RANGE = {
+        "mercury": 12,
+        "venus": 8,
+    }
+    _COMBUSTIBLE = frozenset(COMBUSTION_RANGE)
+    _COMBUSTION_THRESHOLDS = _build_combustion_thresholds(
+        COMBUSTION_RANGE, RETROGRADE_COMBUSTION_RANGE
+    )
 
     @classmethod
     def compute(
@@ -203,9 +477,21 @@ class AstrologyEngine:
         if not SWISSEPH_AVAILABLE:
             return cls._compute_fallback(date_of_birth, time_of_birth, location)
 
-        # Set ayanamsa for sidereal calculations
+        # Most charts use the default Vedic configuration - take the specialised path
+        if (
+            zodiac == ZodiacSystem.SIDEREAL
+            and (ayanamsa or cls.AYANAMSA_LAHIRI) == cls.AYANAMSA_LAHIRI
+            and house_system in (None, HouseSystem.WHOLE_SIGN)
+            and node_type == NodeType.TRUE_NODE
+            and not include_outer_planets
+        ):
+            return cls._compute_vedic_default(date_of_birth, time_of_birth, location)
+
+        # Set ayanamsa for sidereal calculations (0 = tropical, no sidereal mode)
+        sid_mode = 0
         if zodiac == ZodiacSystem.SIDEREAL:
-            swe.set_sid_mode(ayanamsa or cls.AYANAMSA_LAHIRI)
+            sid_mode = ayanamsa or cls.AYANAMSA_LAHIRI
+            cls._ensure_sid_mode(sid_mode)
 
         # Auto-select house system based on zodiac if not specified
         if house_system is None:
@@ -225,43 +511,126 @@ class AstrologyEngine:
         # Determine which node to use
         node_planet_id = 11 if node_type == NodeType.TRUE_NODE else 10  # SE_TRUE_NODE vs SE_MEAN_NODE
 
-        # Calculate planet positions
-        planets = {}
-        planet_longitudes = {}  # Store raw longitudes for nakshatra calc
-
-        planets_to_calc = cls.PLANETS.copy()
-        planets_to_calc["rahu"] = node_planet_id  # Use selected node type
-        if include_outer_planets:
-            planets_to_calc.update(cls.OUTER_PLANETS)
-
-        # First pass: calculate Sun to get its longitude for combustion checks
-        sun_result, _ = swe.calc_ut(jd, 0, calc_flags)
-        sun_longitude = sun_result[0]
+        planets_to_calc = (
+            cls._PLANET_ITEMS_WITH_OUTER if include_outer_planets else cls._PLANET_ITEMS
+        )
 
-        # Calculate all planets with dignity and combustion
-        for name, planet_id in planets_to_calc.items():
-            pos, longitude = cls._calculate_planet_position(
-                jd, planet_id, calc_flags, name, sun_longitude
-            )
-            planets[name] = pos
-            planet_longitudes[name] = longitude
+        # Sun first - its longitude is needed for combustion checks. It seeds
+        # the batch, so the loop below skips it (PLANETS starts with "sun")
+        sun_longitude, _ = _calc_planet_cached(jd, 0, calc_flags, sid_mode)
+
+        # Gather raw longitudes first, then convert them in one batch
+        names = ["sun"]
+        longitudes = [sun_longitude]
+        retrogrades = [False]  # Sun never goes retrograde
+        for name, planet_id in planets_to_calc[1:]:
+            if name == "rahu":
+                planet_id = node_planet_id  # Use selected node type
+            longitude, speed = _calc_planet_cached(jd, planet_id, calc_flags, sid_mode)
+            names.append(name)
+            longitudes.append(longitude)
+            retrogrades.append(cls._is_retrograde(planet_id, speed))
 
         # Calculate Ketu (South Node = Rahu + 180°)
-        rahu_longitude = planet_longitudes["rahu"]
-        ketu_longitude = (rahu_longitude + 180) % 360
         # Ketu has same retrograde status as Rahu (nodes are always retrograde)
-        planets["ketu"] = cls._longitude_to_position(
-            ketu_longitude, is_retrograde=True, planet_name="ketu", sun_longitude=sun_longitude
+        names.append("ketu")
+        longitudes.append(math.fmod(longitudes[names.index("rahu")] + 180, 360.0))
+        retrogrades.append(True)
+
+        return cls._assemble_chart(
+            jd, names, longitudes, retrogrades,
+            time_of_birth, location, calc_flags, house_system, sid_mode,
+        )
+
+    @classmethod
+    def compute_batch(cls, requests: List[Dict]) -> List[AstrologyData]:
+        """
+        Compute many natal charts, e.g. for backfills or bulk imports.
+
+        Args:
+            requests: One dict of compute() keyword arguments per chart
+
+        Returns:
+            List of AstrologyData in the same order as requests
+        """
+        # Swiss Ephemeris keeps the sidereal mode as process-wide state, so
+        # charts are grouped by it (tropical = 0) and the mode is switched once
+        # per group rather than per chart
+        def sid_mode(request: Dict) -> int:
+            if request.get("zodiac", ZodiacSystem.SIDEREAL) != ZodiacSystem.SIDEREAL:
+                return 0
+            return request.get("ayanamsa") or cls.AYANAMSA_LAHIRI
+
+        results: List[Optional[AstrologyData]] = [None] * len(requests)
+        for index in sorted(range(len(requests)), key=lambda i: sid_mode(requests[i])):
+            results[index] = cls.compute(**requests[index])
+        return results
+
+    @classmethod
+    def _compute_vedic_default(
+        cls,
+        date_of_birth: date,
+        time_of_birth: Optional[time],
+        location: Optional[GeoLocation],
+    ) -> AstrologyData:
+        """
+        compute() specialised for the default Vedic chart: Lahiri ayanamsa,
+        Whole Sign houses, true node, no outer planets.
+
+        Every config branch is resolved up front, so this is a straight line of
+        planet lookups. Must produce exactly what compute() would for that config.
+        """
+        sid_mode = cls.AYANAMSA_LAHIRI
+        cls._ensure_sid_mode(sid_mode)
+
+        jd = cls._to_julian_day(date_of_birth, time_of_birth, location)
+        calc_flags = swe.FLG_SWIEPH | swe.FLG_SPEED | swe.FLG_SIDEREAL
+
+        # PLANETS already maps rahu to the true node
+        longitudes = []
+        retrogrades = []
+        is_retrograde = cls._is_retrograde
+        for planet_id in cls._PLANET_IDS:
+            longitude, speed = _calc_planet_cached(jd, planet_id, calc_flags, sid_mode)
+            longitudes.append(longitude)
+            retrogrades.append(is_retrograde(planet_id, speed))
+
+        # Ketu opposite Rahu (the last entry), always retrograde
+        longitudes.append(math.fmod(longitudes[-1] + 180, 360.0))
+        retrogrades.append(True)
+
+        return cls._assemble_chart(
+            jd, cls._VEDIC_DEFAULT_NAMES, longitudes, retrogrades,
+            time_of_birth, location, calc_flags, HouseSystem.WHOLE_SIGN, sid_mode,
         )
-        planet_longitudes["ketu"] = ketu_longitude
 
-        # Get Sun and Moon (keep in planets dict but also return separately)
-        sun_sign = planets["sun"]
-        moon_sign = planets["moon"]
+    @classmethod
+    def _assemble_chart(
+        cls,
+        jd: float,
+        names: List[str],
+        longitudes: List[float],
+        retrogrades: List[bool],
+        time_of_birth: Optional[time],
+        location: Optional[GeoLocation],
+        calc_flags: int,
+        house_system: HouseSystem,
+        sid_mode: int,
+    ) -> AstrologyData:
+        """
+        Turn gathered raw longitudes (Sun, Moon, ..., Ketu) into AstrologyData.
+
+        Shared tail of compute() and _compute_vedic_default().
+        """
+        # Calculate all planets with dignity and combustion
+        positions = cls._longitudes_to_positions(longitudes, names, retrogrades, longitudes[0])
+
+        # Sun and Moon are returned separately, the rest go in the planets dict
+        sun_sign, moon_sign = positions[0], positions[1]
+        planets = dict(zip(names[2:], positions[2:]))
 
         # Calculate Moon Nakshatra using ABSOLUTE longitude and add to moon_sign
-        moon_longitude = planet_longitudes["moon"]
-        moon_nakshatra, nakshatra_pada = cls._calculate_nakshatra(moon_longitude)
+        moon_nakshatra, nakshatra_pada = cls._calculate_nakshatra(longitudes[1])
         moon_sign.nakshatra = moon_nakshatra
         moon_sign.nakshatra_pada = nakshatra_pada
 
@@ -269,11 +638,9 @@ class AstrologyEngine:
         ascendant = None
         houses = None
         if time_of_birth and location:
-            ascendant, houses = cls._calculate_houses(jd, location, calc_flags, house_system)
-
-        # Remove sun/moon from planets dict (returned separately)
-        del planets["sun"]
-        del planets["moon"]
+            ascendant, houses = cls._calculate_houses(
+                jd, location, calc_flags, house_system, sid_mode
+            )
 
         return AstrologyData(
             sun_sign=sun_sign,
@@ -308,8 +675,10 @@ class AstrologyEngine:
             return cls._compute_transits_fallback(target_date)
 
         # Set ayanamsa for sidereal
+        sid_mode = 0
         if zodiac == ZodiacSystem.SIDEREAL:
-            swe.set_sid_mode(cls.AYANAMSA_LAHIRI)
+            sid_mode = cls.AYANAMSA_LAHIRI
+            cls._ensure_sid_mode(sid_mode)
 
         jd = cls._to_julian_day(target_date)
 
@@ -322,13 +691,15 @@ class AstrologyEngine:
 
         planets = {}
         planet_longitudes = {}
-        for name, planet_id in cls.PLANETS.items():
-            pos, longitude = cls._calculate_planet_position(jd, planet_id, calc_flags)
+        for name, planet_id in cls._PLANET_ITEMS:
+            pos, longitude = cls._calculate_planet_position(
+                jd, planet_id, calc_flags, sid_mode=sid_mode
+            )
             planets[name] = pos
             planet_longitudes[name] = longitude
 
         # Calculate Ketu (nodes are always retrograde)
-        ketu_longitude = (planet_longitudes["rahu"] + 180) % 360
+        ketu_longitude = math.fmod(planet_longitudes["rahu"] + 180, 360.0)
         planets["ketu"] = cls._longitude_to_position(ketu_longitude, is_retrograde=True)
 
         return TransitData(
@@ -336,6 +707,93 @@ class AstrologyEngine:
             planets=planets,
         )
 
+    @classmethod
+    def compute_transits_range(
+        cls,
+        start_date: date,
+        end_date: date,
+        step_days: int = 1,
+        zodiac: ZodiacSystem = ZodiacSystem.SIDEREAL,
+    ) -> List[TransitData]:
+        """
+        Compute transits for every `step_days` from start_date to end_date (inclusive).
+
+        With Swiss Ephemeris each body is calculated across all dates in one batch;
+        without it the whole range runs through the numeric fallback kernel
+        directly, skipping the per-date natal chart assembly.
+
+        Returns:
+            List of TransitData, one per date in ascending order
+        """
+        if step_days < 1:
+            raise ValueError("step_days must be at least 1")
+
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range(0, (end_date - start_date).days + 1, step_days)
+        ]
+
+        if SWISSEPH_AVAILABLE:
+            return cls._compute_transits_range_swe(dates, zodiac)
+
+        transits = []
+        for d in dates:
+            days_since_j2000 = (d - _J2000).days
+            transits.append(TransitData(
+                date=d.isoformat(),
+                planets=cls._fallback_planets(
+                    days_since_j2000, _fallback_ayanamsa(days_since_j2000)
+                ),
+            ))
+        return transits
+
+    @classmethod
+    def _compute_transits_range_swe(
+        cls,
+        dates: List[date],
+        zodiac: ZodiacSystem,
+    ) -> List[TransitData]:
+        """Swiss Ephemeris path of compute_transits_range, batched per planet."""
+        calc_flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        if zodiac == ZodiacSystem.SIDEREAL:
+            cls._ensure_sid_mode(cls.AYANAMSA_LAHIRI)
+            calc_flags |= swe.FLG_SIDEREAL
+
+        jds = [cls._to_julian_day(d) for d in dates]
+        planets_by_date = [{} for _ in dates]
+        longitude_to_position = cls._longitude_to_position
+
+        rahu_longitudes = []
+        for name, planet_id in cls._PLANET_ITEMS:
+            longitudes, speeds = _batch_calc(jds, planet_id, calc_flags)
+            for planets, longitude, speed in zip(planets_by_date, longitudes, speeds):
+                planets[name] = longitude_to_position(
+                    longitude, cls._is_retrograde(planet_id, speed)
+                )
+            if name == "rahu":
+                rahu_longitudes = longitudes
+
+        # Ketu sits opposite Rahu (nodes are always retrograde)
+        for planets, rahu_longitude in zip(planets_by_date, rahu_longitudes):
+            planets["ketu"] = longitude_to_position(
+                math.fmod(rahu_longitude + 180, 360.0), is_retrograde=True
+            )
+
+        return [
+            TransitData(date=d.isoformat(), planets=planets)
+            for d, planets in zip(dates, planets_by_date)
+        ]
+
+    @classmethod
+    def _ensure_sid_mode(cls, sid_mode: int) -> None:
+        """Set the Swiss Ephemeris sidereal mode, skipping the call if already active."""
+        if cls._current_sid_mode == sid_mode:
+            return
+        with cls._sid_mode_lock:
+            if cls._current_sid_mode != sid_mode:
+                swe.set_sid_mode(sid_mode)
+                cls._current_sid_mode = sid_mode
+
     @classmethod
     def _to_julian_day(
         cls,
@@ -350,7 +808,7 @@ class AstrologyEngine:
             if location:
                 hour -= location.timezone_offset  # Convert to UTC
 
-        return swe.julday(d.year, d.month, d.day, hour)
+        return _julian_day_cached(d.year, d.month, d.day, hour)
 
     @classmethod
     def _calculate_planet_position(
@@ -360,29 +818,32 @@ class AstrologyEngine:
         flags: int = 0,
         planet_name: Optional[str] = None,
         sun_longitude: Optional[float] = None,
+        sid_mode: int = 0,
     ) -> Tuple[PlanetPosition, float]:
         """
         Calculate planet position for given Julian Day.
 
+        sid_mode must match the sidereal mode currently set on swe (0 if tropical).
+
         Returns:
             Tuple of (PlanetPosition, raw_longitude)
         """
-        result, _ = swe.calc_ut(jd, planet_id, flags)
-        longitude = result[0]
-        speed = result[3]  # Longitude speed - negative means retrograde
-
-        # Determine if retrograde (negative speed)
-        # Note: Sun and Moon never go retrograde
-        is_retrograde = speed < 0 and planet_id not in (0, 1)
-
-        # Lunar nodes (10, 11) are always considered retrograde in Vedic
-        if planet_id in (10, 11):
-            is_retrograde = True
+        longitude, speed = _calc_planet_cached(jd, planet_id, flags, sid_mode)
+        is_retrograde = cls._is_retrograde(planet_id, speed)
 
         return cls._longitude_to_position(
             longitude, is_retrograde, planet_name, sun_longitude
         ), longitude
 
+    @staticmethod
+    def _is_retrograde(planet_id: int, speed: float) -> bool:
+        """Retrograde status from the longitude speed (negative means retrograde)."""
+        # Lunar nodes (10, 11) are always considered retrograde in Vedic
+        if planet_id in (10, 11):
+            return True
+        # Note: Sun and Moon never go retrograde
+        return speed < 0 and planet_id not in (0, 1)
+
     @classmethod
     def _longitude_to_position(
         cls,
@@ -393,7 +854,7 @@ class AstrologyEngine:
     ) -> PlanetPosition:
         """Convert ecliptic longitude to sign and degree."""
         sign_index = int(longitude / 30) % 12
-        degree_in_sign = longitude % 30
+        degree_in_sign = math.fmod(longitude, 30.0)  # longitude is already 0-360
         sign = cls.SIGNS[sign_index]
 
         # Calculate dignity if planet name provided
@@ -402,18 +863,66 @@ class AstrologyEngine:
         if planet_name and planet_name in cls.EXALTATION:
             dignity = cls._calculate_dignity(planet_name, sign, degree_in_sign)
 
-        # Check combustion if Sun longitude provided
+        # Check combustion if Sun longitude provided - only the planets in
+        # COMBUSTION_RANGE can be combust, the rest are False without a call
         if planet_name and sun_longitude is not None and planet_name != "sun":
-            is_combust = cls._check_combustion(planet_name, longitude, sun_longitude, is_retrograde)
+            is_combust = planet_name in cls._COMBUSTIBLE and cls._check_combustion(
+                planet_name, longitude, sun_longitude, is_retrograde
+            )
 
         return PlanetPosition(
             sign=sign,
-            degree=round(degree_in_sign, 2),
+            degree=_round2(degree_in_sign),
             is_retrograde=is_retrograde,
             dignity=dignity,
             is_combust=is_combust,
         )
 
+    @classmethod
+    def _longitudes_to_positions(
+        cls,
+        longitudes: List[float],
+        planet_names: List[str],
+        retrogrades: List[bool],
+        sun_longitude: Optional[float] = None,
+    ) -> List[PlanetPosition]:
+        """
+        Batch version of _longitude_to_position for a whole chart.
+
+        Sign/degree arithmetic runs in one pass with lookups bound locally,
+        instead of a full method dispatch per planet.
+        """
+        signs = cls.SIGNS
+        exaltation = cls.EXALTATION
+        calculate_dignity = cls._calculate_dignity
+        check_combustion = cls._check_combustion
+        combustible = cls._COMBUSTIBLE
+        fmod = math.fmod
+
+        positions = []
+        for longitude, planet_name, is_retrograde in zip(longitudes, planet_names, retrogrades):
+            sign = signs[int(longitude / 30) % 12]
+            degree_in_sign = fmod(longitude, 30.0)
+
+            dignity = None
+            if planet_name in exaltation:
+                dignity = calculate_dignity(planet_name, sign, degree_in_sign)
+
+            is_combust = None
+            if sun_longitude is not None and planet_name != "sun":
+                is_combust = planet_name in combustible and check_combustion(
+                    planet_name, longitude, sun_longitude, is_retrograde
+                )
+
+            positions.append(PlanetPosition(
+                sign=sign,
+                degree=_round2(degree_in_sign),
+                is_retrograde=is_retrograde,
+                dignity=dignity,
+                is_combust=is_combust,
+            ))
+        return positions
+
     @classmethod
     def _calculate_dignity(cls, planet: str, sign: str, degree: float) -> str:
         """
@@ -421,31 +930,19 @@ class AstrologyEngine:
 
         Returns one of: exalted, moolatrikona, own_sign, friendly, neutral, enemy, debilitated
         """
-        if planet not in cls.EXALTATION:
+        # Precedence (baked into _DIGNITY_TABLE): exalted, debilitated,
+        # moolatrikona (degree range), own sign, neutral.
+        # Friendly/enemy requires complex relationship charts, so falls to neutral.
+        entry = cls._DIGNITY_TABLE.get((planet, sign))
+        if entry is None:
             return "neutral"
 
-        exalt_sign, exalt_degree, debil_sign = cls.EXALTATION[planet]
-
-        # Check exaltation (strongest)
-        if sign == exalt_sign:
-            return "exalted"
-
-        # Check debilitation (weakest)
-        if sign == debil_sign:
-            return "debilitated"
-
-        # Check Moolatrikona (special strength)
-        if planet in cls.MOOLATRIKONA:
-            mt_sign, mt_start, mt_end = cls.MOOLATRIKONA[planet]
-            if sign == mt_sign and mt_start <= degree < mt_end:
+        dignity, moolatrikona_range = entry
+        if moolatrikona_range is not None:
+            mt_start, mt_end = moolatrikona_range
+            if mt_start <= degree < mt_end:
                 return "moolatrikona"
-
-        # Check own sign
-        if planet in cls.OWN_SIGNS and sign in cls.OWN_SIGNS[planet]:
-            return "own_sign"
-
-        # Default to neutral (friendly/enemy requires complex relationship charts)
-        return "neutral"
+        return dignity
 
     @classmethod
     def _check_combustion(
@@ -456,7 +953,8 @@ class AstrologyEngine:
         is_retrograde: bool = False,
     ) -> bool:
         """Check if a planet is combust (too close to Sun)."""
-        if planet not in cls.COMBUSTION_RANGE:
+        combustion_range = cls._COMBUSTION_THRESHOLDS.get((planet, bool(is_retrograde)))
+        if combustion_range is None:
             return False
 
         # Calculate angular distance from Sun
@@ -464,13 +962,6 @@ class AstrologyEngine:
         if diff > 180:
             diff = 360 - diff
 
-        combustion_range = cls.COMBUSTION_RANGE[planet]
-        # Mercury and Venus have smaller range when retrograde
-        if is_retrograde and planet == "mercury":
-            combustion_range = 12
-        elif is_retrograde and planet == "venus":
-            combustion_range = 8
-
         return diff <= combustion_range
 
     @classmethod
@@ -480,20 +971,21 @@ class AstrologyEngine:
         location: GeoLocation,
         flags: int = 0,
         house_system: HouseSystem = HouseSystem.WHOLE_SIGN,
+        sid_mode: int = 0,
     ) -> Tuple[PlanetPosition, Dict]:
         """Calculate house cusps and ascendant."""
         # Convert house system enum to bytes for Swiss Ephemeris
         hsys = house_system.value.encode('ascii')
 
-        # For sidereal, we need to pass the flag differently
-        if flags & swe.FLG_SIDEREAL:
-            cusps, ascmc = swe.houses_ex(
-                jd, location.latitude, location.longitude, hsys, flags
-            )
-        else:
-            cusps, ascmc = swe.houses(
-                jd, location.latitude, location.longitude, hsys
-            )
+        # Sidereal uses houses_ex with the flags, tropical plain houses
+        cusps, ascmc = _calc_houses_cached(
+            jd,
+            round(location.latitude, 4),
+            round(location.longitude, 4),
+            hsys,
+            flags,
+            sid_mode,
+        )
 
         # Ascendant is ascmc[0]
         asc_longitude = ascmc[0]
@@ -510,7 +1002,7 @@ class AstrologyEngine:
                 sign_index = int(cusp_longitude / 30) % 12
                 houses[f"house_{i + 1}"] = {
                     "sign": cls.SIGNS[sign_index],
-                    "degree": round(cusp_longitude % 30, 2),
+                    "degree": _round2(math.fmod(cusp_longitude, 30.0)),
                 }
 
         return ascendant, houses
@@ -528,18 +1020,12 @@ class AstrologyEngine:
             - Nakshatra: One of 27 lunar mansions
             - Pada: Quarter within nakshatra (1-4)
         """
-        # Each Nakshatra spans 13°20' = 13.333... degrees
-        nakshatra_span = 360.0 / 27.0  # 13.333...
+        # Each Nakshatra spans 13°20' (27 per circle) and each pada 3°20'
+        # (108 per circle), so both indices are a single multiply
+        nakshatra_index = int(moon_longitude * _NAKSHATRAS_PER_DEGREE) % 27
 
-        # Pada (quarter) spans 3°20' = 3.333... degrees
-        pada_span = nakshatra_span / 4.0  # 3.333...
-
-        nakshatra_index = int(moon_longitude / nakshatra_span) % 27
-
-        # Calculate pada (1-4)
-        position_in_nakshatra = moon_longitude % nakshatra_span
-        pada = int(position_in_nakshatra / pada_span) + 1
-        pada = min(pada, 4)  # Ensure max is 4
+        # Calculate pada (1-4) - the pada count within the nakshatra
+        pada = int(moon_longitude * _PADAS_PER_DEGREE) % 4 + 1
 
         return cls.NAKSHATRAS[nakshatra_index], pada
 
@@ -550,8 +1036,9 @@ class AstrologyEngine:
             # Approximate Lahiri ayanamsa for 2024
             return 24.17
 
-        swe.set_sid_mode(ayanamsa_type or cls.AYANAMSA_LAHIRI)
-        return swe.get_ayanamsa_ut(jd)
+        sid_mode = ayanamsa_type or cls.AYANAMSA_LAHIRI
+        cls._ensure_sid_mode(sid_mode)
+        return _ayanamsa_cached(round(jd, 6), sid_mode)
 
     @classmethod
     def _compute_fallback(
@@ -568,11 +1055,8 @@ class AstrologyEngine:
 
         Note: For professional accuracy, install pyswisseph with Visual C++ Build Tools.
         """
-        import math
-
         # Calculate days since J2000.0 (Jan 1, 2000, 12:00 TT)
-        j2000 = date(2000, 1, 1)
-        days_since_j2000 = (date_of_birth - j2000).days
+        days_since_j2000 = (date_of_birth - _J2000).days
 
         # Add time offset if available
         if time_of_birth:
@@ -580,109 +1064,11 @@ class AstrologyEngine:
             if location:
                 days_since_j2000 -= location.timezone_offset / 24  # Convert to UTC
 
-        # Current Lahiri ayanamsa (precession rate ~50.3" per year)
-        # Base: 23.85° on Jan 1, 2000
-        years_since_j2000 = days_since_j2000 / 365.25
-        ayanamsa = 23.85 + (years_since_j2000 * 50.3 / 3600)  # ~24.17° in 2024
-
-        # Calculate Sun position (mean longitude)
-        # Mean anomaly of Sun
-        sun_mean_anomaly = (357.5291 + 0.98560028 * days_since_j2000) % 360
-        sun_mean_anomaly_rad = math.radians(sun_mean_anomaly)
-
-        # Equation of center (correction for elliptical orbit)
-        sun_eoc = 1.9148 * math.sin(sun_mean_anomaly_rad) + \
-                  0.0200 * math.sin(2 * sun_mean_anomaly_rad) + \
-                  0.0003 * math.sin(3 * sun_mean_anomaly_rad)
-
-        # True longitude of Sun (tropical)
-        sun_tropical = (280.4665 + 0.98564736 * days_since_j2000 + sun_eoc) % 360
-        # Convert to sidereal
-        sun_sidereal = (sun_tropical - ayanamsa) % 360
-        sun_sign = cls._longitude_to_position(sun_sidereal)
-
-        # Calculate Moon position (approximate - lunar orbit is complex)
-        # Mean longitude of Moon
-        moon_mean_longitude = (218.3165 + 13.17639648 * days_since_j2000) % 360
-        # Mean elongation
-        moon_elongation = (297.8502 + 12.19074912 * days_since_j2000) % 360
-        moon_elongation_rad = math.radians(moon_elongation)
-        # Mean anomaly of Moon
-        moon_mean_anomaly = (134.9634 + 13.06499295 * days_since_j2000) % 360
-        moon_mean_anomaly_rad = math.radians(moon_mean_anomaly)
-        # Argument of latitude
-        moon_arg_lat = (93.2721 + 13.22935024 * days_since_j2000) % 360
-
-        # Major perturbations
-        moon_correction = 6.2886 * math.sin(moon_mean_anomaly_rad) + \
-                         1.2740 * math.sin(2 * moon_elongation_rad - moon_mean_anomaly_rad) + \
-                         0.6583 * math.sin(2 * moon_elongation_rad) + \
-                         0.2136 * math.sin(2 * moon_mean_anomaly_rad)
-
-        moon_tropical = (moon_mean_longitude + moon_correction) % 360
-        moon_sidereal = (moon_tropical - ayanamsa) % 360
-        moon_sign = cls._longitude_to_position(moon_sidereal)
-
-        # Calculate Moon Nakshatra
-        moon_nakshatra, nakshatra_pada = cls._calculate_nakshatra(moon_sidereal)
-        moon_sign.nakshatra = moon_nakshatra
-        moon_sign.nakshatra_pada = nakshatra_pada
-
-        # Calculate other planets using simplified orbital mechanics
-        planets = {}
+        ayanamsa = _fallback_ayanamsa(days_since_j2000)  # ~24.17° in 2024
 
-        # Mercury - fast inner planet (88 day orbit)
-        mercury_mean = (252.2509 + 4.09233445 * days_since_j2000) % 360
-        mercury_mean_rad = math.radians(mercury_mean)
-        mercury_correction = 23.4400 * math.sin(mercury_mean_rad) + \
-                            2.9818 * math.sin(2 * mercury_mean_rad)
-        mercury_tropical = (mercury_mean + mercury_correction + 180) % 360  # Approximate heliocentric to geocentric
-        mercury_sidereal = (mercury_tropical - ayanamsa) % 360
-        planets["mercury"] = cls._longitude_to_position(mercury_sidereal)
-
-        # Venus - inner planet (225 day orbit)
-        venus_mean = (181.9798 + 1.60213034 * days_since_j2000) % 360
-        venus_mean_rad = math.radians(venus_mean)
-        venus_correction = 0.7758 * math.sin(venus_mean_rad)
-        venus_tropical = (venus_mean + venus_correction + 180) % 360
-        venus_sidereal = (venus_tropical - ayanamsa) % 360
-        planets["venus"] = cls._longitude_to_position(venus_sidereal)
-
-        # Mars - outer planet (687 day orbit)
-        mars_mean = (355.4330 + 0.52402068 * days_since_j2000) % 360
-        mars_mean_rad = math.radians(mars_mean)
-        mars_correction = 10.6912 * math.sin(mars_mean_rad) + \
-                         0.6228 * math.sin(2 * mars_mean_rad)
-        mars_tropical = (mars_mean + mars_correction) % 360
-        mars_sidereal = (mars_tropical - ayanamsa) % 360
-        planets["mars"] = cls._longitude_to_position(mars_sidereal)
-
-        # Jupiter - outer planet (12 year orbit)
-        jupiter_mean = (34.3515 + 0.08308529 * days_since_j2000) % 360
-        jupiter_mean_rad = math.radians(jupiter_mean)
-        jupiter_correction = 5.5549 * math.sin(jupiter_mean_rad) + \
-                            0.1683 * math.sin(2 * jupiter_mean_rad)
-        jupiter_tropical = (jupiter_mean + jupiter_correction) % 360
-        jupiter_sidereal = (jupiter_tropical - ayanamsa) % 360
-        planets["jupiter"] = cls._longitude_to_position(jupiter_sidereal)
-
-        # Saturn - outer planet (29 year orbit)
-        saturn_mean = (50.0774 + 0.03349791 * days_since_j2000) % 360
-        saturn_mean_rad = math.radians(saturn_mean)
-        saturn_correction = 6.3585 * math.sin(saturn_mean_rad) + \
-                           0.2204 * math.sin(2 * saturn_mean_rad)
-        saturn_tropical = (saturn_mean + saturn_correction) % 360
-        saturn_sidereal = (saturn_tropical - ayanamsa) % 360
-        planets["saturn"] = cls._longitude_to_position(saturn_sidereal)
-
-        # Rahu (North Node) - 18.6 year retrograde cycle
-        rahu_mean = (125.0445 - 0.05295377 * days_since_j2000) % 360  # Retrograde
-        rahu_sidereal = (rahu_mean - ayanamsa) % 360
-        planets["rahu"] = cls._longitude_to_position(rahu_sidereal, is_retrograde=True)
-
-        # Ketu (South Node) - opposite to Rahu
-        ketu_sidereal = (rahu_sidereal + 180) % 360
-        planets["ketu"] = cls._longitude_to_position(ketu_sidereal, is_retrograde=True)
+        planets = cls._fallback_planets(days_since_j2000, ayanamsa)
+        sun_sign = planets.pop("sun")
+        moon_sign = planets.pop("moon")
 
         # Calculate ascendant if time and location provided
         ascendant = None
@@ -696,11 +1082,41 @@ class AstrologyEngine:
             moon_sign=moon_sign,
             ascendant=ascendant,
             planets=planets,
-            moon_nakshatra=moon_nakshatra,
+            moon_nakshatra=moon_sign.nakshatra,
             houses=None,  # Houses require more complex calculations
             has_birth_time=time_of_birth is not None,
         )
 
+    @classmethod
+    def _fallback_planets(
+        cls,
+        days_since_j2000: float,
+        ayanamsa: float,
+    ) -> Dict[str, PlanetPosition]:
+        """Fallback positions for all nine grahas, Moon carrying its nakshatra."""
+        (
+            sun_sidereal, moon_sidereal, mercury_sidereal, venus_sidereal,
+            mars_sidereal, jupiter_sidereal, saturn_sidereal, rahu_sidereal,
+        ) = _fallback_longitudes(days_since_j2000, ayanamsa)
+
+        moon_sign = cls._longitude_to_position(moon_sidereal)
+        moon_sign.nakshatra, moon_sign.nakshatra_pada = cls._calculate_nakshatra(moon_sidereal)
+
+        return {
+            "sun": cls._longitude_to_position(sun_sidereal),
+            "moon": moon_sign,
+            "mercury": cls._longitude_to_position(mercury_sidereal),
+            "venus": cls._longitude_to_position(venus_sidereal),
+            "mars": cls._longitude_to_position(mars_sidereal),
+            "jupiter": cls._longitude_to_position(jupiter_sidereal),
+            "saturn": cls._longitude_to_position(saturn_sidereal),
+            "rahu": cls._longitude_to_position(rahu_sidereal, is_retrograde=True),
+            # Ketu (South Node) - opposite to Rahu
+            "ketu": cls._longitude_to_position(
+                math.fmod(rahu_sidereal + 180, 360.0), is_retrograde=True
+            ),
+        }
+
     @classmethod
     def _calculate_ascendant_fallback(
         cls,
@@ -710,11 +1126,8 @@ class AstrologyEngine:
         ayanamsa: float,
     ) -> PlanetPosition:
         """Calculate approximate ascendant using simplified algorithm."""
-        import math
-
         # Calculate Local Sidereal Time (LST)
-        j2000 = date(2000, 1, 1)
-        days_since_j2000 = (birth_date - j2000).days
+        days_since_j2000 = (birth_date - _J2000).days
 
         # Convert time to decimal hours in UTC
         local_hours = birth_time.hour + birth_time.minute / 60 + birth_time.second / 3600
@@ -724,9 +1137,8 @@ class AstrologyEngine:
         jd = days_since_j2000 + utc_hours / 24
         T = jd / 36525.0
 
-        # Greenwich Mean Sidereal Time at 0h UT
-        gmst0 = 100.46061837 + 36000.770053608 * T + 0.000387933 * T * T
-        gmst0 = gmst0 % 360
+        # Greenwich Mean Sidereal Time at 0h UT (polynomial in Horner form)
+        gmst0 = (100.46061837 + T * (36000.770053608 + T * 0.000387933)) % 360
 
         # GMST at observation time
         gmst = (gmst0 + 360.98564736629 * utc_hours / 24) % 360
@@ -777,30 +1189,4 @@ class AstrologyEngine:
         Note: This is Western/Tropical. For Sidereal, subtract ~24 days
         (or use proper ephemeris calculation).
         """
-        month, day = d.month, d.day
-
-        # Tropical zodiac date ranges (approximate)
-        if (month == 3 and day >= 21) or (month == 4 and day <= 19):
-            return "Aries"
-        elif (month == 4 and day >= 20) or (month == 5 and day <= 20):
-            return "Taurus"
-        elif (month == 5 and day >= 21) or (month == 6 and day <= 20):
-            return "Gemini"
-        elif (month == 6 and day >= 21) or (month == 7 and day <= 22):
-            return "Cancer"
-        elif (month == 7 and day >= 23) or (month == 8 and day <= 22):
-            return "Leo"
-        elif (month == 8 and day >= 23) or (month == 9 and day <= 22):
-            return "Virgo"
-        elif (month == 9 and day >= 23) or (month == 10 and day <= 22):
-            return "Libra"
-        elif (month == 10 and day >= 23) or (month == 11 and day <= 21):
-            return "Scorpio"
-        elif (month == 11 and day >= 22) or (month == 12 and day <= 21):
-            return "Sagittarius"
-        elif (month == 12 and day >= 22) or (month == 1 and day <= 19):
-            return "Capricorn"
-        elif (month == 1 and day >= 20) or (month == 2 and day <= 18):
-            return "Aquarius"
-        else:
-            return "Pisces"
+        return _SUN_SIGN_BY_MONTH_DAY[d.month * 32 + d.day]
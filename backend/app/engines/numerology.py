@@ -12,11 +12,83 @@ Supports:
 """
 
 from datetime import date
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from app.schemas.chart import NumerologyData
 
 
+def _build_digit_sums(size: int) -> Tuple[int, ...]:
+    """Digit sums of 0..size-1 (digits of n = digits of n // 10 plus the last one)."""
+    sums = [0] * size
+    for n in range(1, size):
+        sums[n] = sums[n // 10] + n % 10
+    return tuple(sums)
+
+
+# Digit sums of 0..9999 - covers every date component and realistic name total
+_DIGIT_SUMS = _build_digit_sums(10000)
+
+
+def _digit_sum(num: int) -> int:
+    """Sum of the decimal digits of a non-negative integer."""
+    if num < 10000:
+        return _DIGIT_SUMS[num]
+    return sum(int(d) for d in str(num))
+
+
+def _digital_root(num: int) -> int:
+    """Repeated digit sum of a non-negative integer down to 0-9 (no master numbers)."""
+    return 1 + (num - 1) % 9 if num else 0
+
+
+# Letter to number mapping (Pythagorean system)
+_LETTER_VALUES: Dict[str, int] = {
+    'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8, 'i': 9,
+    'j': 1, 'k': 2, 'l': 3, 'm': 4, 'n': 5, 'o': 6, 'p': 7, 'q': 8, 'r': 9,
+    's': 1, 't': 2, 'u': 3, 'v': 4, 'w': 5, 'x': 6, 'y': 7, 'z': 8,
+}
+
+_VOWELS = frozenset('aeiou')
+_MASTER_NUMBERS = frozenset({11, 22, 33})
+
+# Karmic Debt Numbers - Numbers that indicate karmic lessons
+_KARMIC_DEBT = frozenset({13, 14, 16, 19})
+
+
+def _build_byte_table(letter_values: Dict[str, int]) -> bytes:
+    """256-byte translate table mapping ASCII letters (either case) to their values."""
+    table = bytearray(256)
+    for letter, value in letter_values.items():
+        table[ord(letter)] = value
+        table[ord(letter.upper())] = value
+    return bytes(table)
+
+
+# Character classes for the vowel/consonant split (Y counts as a consonant
+# here and is resolved separately)
+_NON_LETTER, _VOWEL, _CONSONANT = 0, 1, 2
+
+
+def _char_class(c: str) -> int:
+    """Class of a lowercase character."""
+    if c in 'aeiou':
+        return _VOWEL
+    return _CONSONANT if c.isalpha() else _NON_LETTER
+
+
+# Is Y a vowel, keyed by (previous class, next class)? Mirrors _is_y_vowel:
+# vowel after -> consonant; word end -> vowel; between consonants -> vowel.
+_Y_IS_VOWEL = {
+    (prev_class, next_class): (
+        next_class != _VOWEL
+        and (next_class == _NON_LETTER or prev_class == _CONSONANT)
+    )
+    for prev_class in (_NON_LETTER, _VOWEL, _CONSONANT)
+    for next_class in (_NON_LETTER, _VOWEL, _CONSONANT)
+}
+
+
 class NumerologyEngine:
     """
     Numerology computation engine.
@@ -34,18 +106,14 @@ class NumerologyEngine:
     - Challenge Numbers - Obstacles to overcome
     """
 
-    # Letter to number mapping (Pythagorean system)
-    LETTER_VALUES: Dict[str, int] = {
-        'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8, 'i': 9,
-        'j': 1, 'k': 2, 'l': 3, 'm': 4, 'n': 5, 'o': 6, 'p': 7, 'q': 8, 'r': 9,
-        's': 1, 't': 2, 'u': 3, 'v': 4, 'w': 5, 'x': 6, 'y': 7, 'z': 8,
-    }
+    # Module-level tables, exposed on the class as well
+    LETTER_VALUES = _LETTER_VALUES
+    VOWELS = _VOWELS
+    MASTER_NUMBERS = _MASTER_NUMBERS
+    KARMIC_DEBT_NUMBERS = _KARMIC_DEBT
 
-    VOWELS = set('aeiou')
-    MASTER_NUMBERS = {11, 22, 33}
-
-    # Karmic Debt Numbers - Numbers that indicate karmic lessons
-    KARMIC_DEBT_NUMBERS = {13, 14, 16, 19}
+    # Byte -> letter value (either case), 0 for everything else; for bytes.translate
+    _LETTER_VALUE_BYTES = _build_byte_table(_LETTER_VALUES)
 
     @classmethod
     def _is_y_vowel(cls, name: str, position: int) -> bool:
@@ -68,6 +136,7 @@ class NumerologyEngine:
         name = name.lower()
         if position < 0 or position >= len(name) or name[position] != 'y':
             return False
+        vowels = _VOWELS
 
         # Check if Y is at start of a word
         is_word_start = position == 0 or not name[position - 1].isalpha()
@@ -76,7 +145,7 @@ class NumerologyEngine:
         has_vowel_after = (
             position + 1 < len(name) and
             name[position + 1].isalpha() and
-            name[position + 1] in cls.VOWELS
+            name[position + 1] in vowels
         )
 
         # Y at start of word followed by vowel = consonant (Yes, Yellow, Yolanda)
@@ -96,12 +165,12 @@ class NumerologyEngine:
         has_consonant_before = (
             position > 0 and
             name[position - 1].isalpha() and
-            name[position - 1] not in cls.VOWELS
+            name[position - 1] not in vowels
         )
         has_consonant_after = (
             position + 1 < len(name) and
             name[position + 1].isalpha() and
-            name[position + 1] not in cls.VOWELS
+            name[position + 1] not in vowels
         )
         if has_consonant_before and has_consonant_after:
             return True
@@ -110,31 +179,41 @@ class NumerologyEngine:
         return False
 
     @classmethod
-    def _get_vowels_from_name(cls, name: str) -> str:
-        """Extract vowels from name, treating Y appropriately."""
+    def _split_name(cls, name: str) -> Tuple[str, str]:
+        """
+        Split a name into (vowels, consonants) in one pass, treating Y appropriately.
+
+        Each character is classed once (see _char_class) and Y is resolved from
+        its neighbours' classes via _Y_IS_VOWEL - same rules as _is_y_vowel.
+        """
         name_lower = name.lower()
+        classes = [_char_class(c) for c in name_lower]
+        classes.append(_NON_LETTER)  # Sentinel: end of name acts as a word break
+        y_is_vowel = _Y_IS_VOWEL
+
         vowels = []
+        consonants = []
+        prev_class = _NON_LETTER
         for i, c in enumerate(name_lower):
-            if c in cls.VOWELS:
+            char_class = classes[i]
+            if char_class == _VOWEL:
                 vowels.append(c)
-            elif c == 'y' and cls._is_y_vowel(name_lower, i):
+            elif c == 'y' and y_is_vowel[prev_class, classes[i + 1]]:
                 vowels.append(c)
-        return ''.join(vowels)
+            elif char_class == _CONSONANT:
+                consonants.append(c)
+            prev_class = char_class
+        return ''.join(vowels), ''.join(consonants)
+
+    @classmethod
+    def _get_vowels_from_name(cls, name: str) -> str:
+        """Extract vowels from name, treating Y appropriately."""
+        return _name_parts(name)[0]
 
     @classmethod
     def _get_consonants_from_name(cls, name: str) -> str:
         """Extract consonants from name, treating Y appropriately."""
-        name_lower = name.lower()
-        consonants = []
-        for i, c in enumerate(name_lower):
-            if not c.isalpha():
-                continue
-            if c in cls.VOWELS:
-                continue
-            if c == 'y' and cls._is_y_vowel(name_lower, i):
-                continue  # Y is a vowel here, skip
-            consonants.append(c)
-        return ''.join(consonants)
+        return _name_parts(name)[1]
 
     @classmethod
     def compute(cls, full_name: str, date_of_birth: date, current_date: Optional[date] = None) -> NumerologyData:
@@ -152,25 +231,11 @@ class NumerologyEngine:
         if current_date is None:
             current_date = date.today()
 
-        life_path = cls.calculate_life_path(date_of_birth)
-        destiny = cls.calculate_destiny_number(full_name)
-        soul_urge = cls.calculate_soul_urge(full_name)
-        personality = cls.calculate_personality_number(full_name)
-        maturity = cls.calculate_maturity_number(life_path, destiny)
-        personal_year = cls.calculate_personal_year(date_of_birth, current_date)
-        birthday_number = cls.calculate_birthday_number(date_of_birth.day)
-
-        # Calculate karmic debt
-        karmic_debt = cls.detect_karmic_debt(date_of_birth, full_name)
-
-        # Calculate pinnacles and challenges
-        pinnacles = cls.calculate_pinnacles(date_of_birth)
-        challenges = cls.calculate_challenges(date_of_birth)
-
-        # Get current pinnacle and challenge based on age
-        age = (current_date - date_of_birth).days // 365
-        current_pinnacle, current_pinnacle_number = cls.get_current_pinnacle(pinnacles, life_path, age)
-        current_challenge, current_challenge_number = cls.get_current_challenge(challenges, life_path, age)
+        (
+            life_path, destiny, soul_urge, personality, maturity, personal_year,
+            birthday_number, karmic_debt, current_pinnacle, current_pinnacle_number,
+            current_challenge, current_challenge_number,
+        ) = _compute_numbers(full_name, date_of_birth, current_date)
 
         return NumerologyData(
             life_path=life_path,
@@ -183,13 +248,48 @@ class NumerologyEngine:
             maturity_number=maturity,
             personal_year=personal_year,
             birthday_number=birthday_number,
-            karmic_debt=karmic_debt,
+            karmic_debt=list(karmic_debt),
             current_pinnacle=current_pinnacle_number,
             current_pinnacle_period=current_pinnacle,
             current_challenge=current_challenge_number,
             current_challenge_period=current_challenge,
         )
 
+    @classmethod
+    def _compute_numbers(cls, full_name: str, date_of_birth: date, current_date: date) -> tuple:
+        """
+        Uncached body of compute(): every number as a flat, hashable tuple.
+
+        Order: life_path, destiny, soul_urge, personality, maturity, personal_year,
+        birthday_number, karmic_debt (tuple), current pinnacle period/number,
+        current challenge period/number.
+        """
+        life_path = _dob_scalars(date_of_birth)[3]
+        destiny, soul_urge, personality = _name_numbers(full_name)
+        maturity = cls.calculate_maturity_number(life_path, destiny)
+        personal_year = cls.calculate_personal_year(date_of_birth, current_date)
+        birthday_number = cls.calculate_birthday_number(date_of_birth.day)
+
+        # Calculate karmic debt
+        karmic_debt = cls.detect_karmic_debt(date_of_birth, full_name)
+
+        # Calculate pinnacles and challenges
+        pinnacles = _pinnacles(date_of_birth)
+        challenges = _challenges(date_of_birth)
+
+        # Get current pinnacle and challenge based on age
+        age = current_date.year - date_of_birth.year - (
+            (current_date.month, current_date.day) < (date_of_birth.month, date_of_birth.day)
+        )
+        current_pinnacle, current_pinnacle_number = cls.get_current_pinnacle(pinnacles, life_path, age)
+        current_challenge, current_challenge_number = cls.get_current_challenge(challenges, life_path, age)
+
+        return (
+            life_path, destiny, soul_urge, personality, maturity, personal_year,
+            birthday_number, tuple(karmic_debt), current_pinnacle, current_pinnacle_number,
+            current_challenge, current_challenge_number,
+        )
+
     @classmethod
     def calculate_life_path(cls, dob: date) -> int:
         """
@@ -218,7 +318,7 @@ class NumerologyEngine:
 
         Method: Sum all letter values and reduce to single digit.
         """
-        total = cls._name_to_number(name)
+        total = _name_totals(name)[0]
         return cls._reduce_to_single(total, preserve_master=True)
 
     @classmethod
@@ -229,8 +329,7 @@ class NumerologyEngine:
         Method: Sum values of all vowels (including Y when it acts as vowel)
         and reduce to single digit.
         """
-        vowels_only = cls._get_vowels_from_name(name)
-        total = cls._name_to_number(vowels_only)
+        total = _name_totals(name)[1]
         return cls._reduce_to_single(total, preserve_master=True)
 
     @classmethod
@@ -241,15 +340,18 @@ class NumerologyEngine:
         Method: Sum values of all consonants (Y is consonant only when not acting as vowel)
         and reduce to single digit.
         """
-        consonants_only = cls._get_consonants_from_name(name)
-        total = cls._name_to_number(consonants_only)
+        total = _name_totals(name)[2]
         return cls._reduce_to_single(total, preserve_master=True)
 
     @classmethod
     def _name_to_number(cls, name: str) -> int:
         """Convert name to number by summing letter values."""
+        if name.isascii():
+            # Map every byte to its letter value (0 for non-letters) in C
+            return sum(name.encode('ascii').translate(cls._LETTER_VALUE_BYTES))
+        letter_values = _LETTER_VALUES
         return sum(
-            cls.LETTER_VALUES.get(c.lower(), 0)
+            letter_values.get(c.lower(), 0)
             for c in name
             if c.isalpha()
         )
@@ -266,10 +368,16 @@ class NumerologyEngine:
         Returns:
             Single digit (1-9) or master number (11, 22, 33)
         """
+        if num <= 9:
+            return num
+        if not preserve_master:
+            return _digital_root(num)
+
+        master_numbers = _MASTER_NUMBERS
         while num > 9:
-            if preserve_master and num in cls.MASTER_NUMBERS:
+            if num in master_numbers:
                 return num
-            num = sum(int(d) for d in str(num))
+            num = _digit_sum(num)
         return num
 
     @classmethod
@@ -296,12 +404,12 @@ class NumerologyEngine:
         4 - Foundation, 5 - Change, 6 - Responsibility
         7 - Introspection, 8 - Achievement, 9 - Completion
         """
-        month = cls._reduce_to_single(dob.month)
-        day = cls._reduce_to_single(dob.day)
-        year = cls._reduce_to_single(current_date.year)
+        month = _digital_root(dob.month)
+        day = _digital_root(dob.day)
+        year = _digital_root(current_date.year)
 
         total = month + day + year
-        return cls._reduce_to_single(total)
+        return _digital_root(total)
 
     @classmethod
     def calculate_birthday_number(cls, day: int) -> int:
@@ -336,7 +444,7 @@ class NumerologyEngine:
         # === Primary Source: Birth Day ===
         # If born on 13th, 14th, 16th, or 19th - this is the most common karmic debt source
         day = dob.day
-        if day in cls.KARMIC_DEBT_NUMBERS:
+        if day in _KARMIC_DEBT:
             karmic_debts.append(day)
 
         # === Secondary Source: Life Path Total Intermediate ===
@@ -348,21 +456,14 @@ class NumerologyEngine:
 
         total = day_reduced + month_reduced + year_reduced
 
-        # Check intermediate values during total reduction
+        # Check intermediate values during total reduction (stops at masters)
         # Example: total=32 → not karmic, total=19 → karmic debt 19
-        while total > 9 and total not in cls.MASTER_NUMBERS:
-            if total in cls.KARMIC_DEBT_NUMBERS:
-                karmic_debts.append(total)
-            total = sum(int(d) for d in str(total))
+        karmic_debts.extend(_karmic_in_reduction(total, stop_at_master=True))
 
         # === Tertiary Source: Destiny Number Intermediate ===
         # Check if name total passes through a karmic debt number
-        name_total = cls._name_to_number(full_name)
-
-        while name_total > 9:
-            if name_total in cls.KARMIC_DEBT_NUMBERS:
-                karmic_debts.append(name_total)
-            name_total = sum(int(d) for d in str(name_total))
+        name_total = _name_totals(full_name)[0]
+        karmic_debts.extend(_karmic_in_reduction(name_total, stop_at_master=False))
 
         return sorted(set(karmic_debts))
 
@@ -376,10 +477,13 @@ class NumerologyEngine:
         Returns:
             List of (start_age, end_age, pinnacle_number) tuples
         """
-        month = cls._reduce_to_single(dob.month)
-        day = cls._reduce_to_single(dob.day)
-        year = cls._reduce_to_single(dob.year)
-        life_path = cls.calculate_life_path(dob)
+        return list(_pinnacles(dob))
+
+    @classmethod
+    def _calculate_pinnacles(
+        cls, month: int, day: int, year: int, life_path: int
+    ) -> List[Tuple[int, int, int]]:
+        """calculate_pinnacles() on already-reduced date components (see _dob_scalars)."""
 
         # First pinnacle ends at 36 - life_path
         first_end = 36 - life_path
@@ -416,10 +520,13 @@ class NumerologyEngine:
         Returns:
             List of (start_age, end_age, challenge_number) tuples
         """
-        month = cls._reduce_to_single(dob.month)
-        day = cls._reduce_to_single(dob.day)
-        year = cls._reduce_to_single(dob.year)
-        life_path = cls.calculate_life_path(dob)
+        return list(_challenges(dob))
+
+    @classmethod
+    def _calculate_challenges(
+        cls, month: int, day: int, year: int, life_path: int
+    ) -> List[Tuple[int, int, int]]:
+        """calculate_challenges() on already-reduced date components (see _dob_scalars)."""
 
         # Use same periods as pinnacles
         first_end = 36 - life_path
@@ -481,3 +588,101 @@ class NumerologyEngine:
             if start <= age <= end:
                 return (i, number)
         return (4, challenges[-1][2])  # Default to 4th challenge
+
+
+# Numerology is a pure function of its inputs, so results are memoized at the
+# module level (classmethods would put cls in every key). Only plain tuples are
+# cached - compute() builds a fresh NumerologyData on every call.
+
+@lru_cache(maxsize=8192)
+def _name_parts(name: str) -> Tuple[str, str]:
+    """Memoized NumerologyEngine._split_name: (vowels, consonants)."""
+    return NumerologyEngine._split_name(name)
+
+
+@lru_cache(maxsize=4096)
+def _name_totals(name: str) -> Tuple[int, int, int]:
+    """
+    Return (total, vowel_total, consonant_total) letter sums for a name.
+
+    The name is split into vowels and consonants once and each part is summed,
+    so destiny, soul urge and personality share a single pass over the name.
+    """
+    vowels, consonants = _name_parts(name)
+    to_number = NumerologyEngine._name_to_number
+    return to_number(name), to_number(vowels), to_number(consonants)
+
+
+@lru_cache(maxsize=4096)
+def _name_numbers(name: str) -> Tuple[int, int, int]:
+    """Return (destiny, soul_urge, personality) for a name."""
+    reduce = NumerologyEngine._reduce_to_single
+    return tuple(reduce(total, preserve_master=True) for total in _name_totals(name))
+
+
+@lru_cache(maxsize=4096)
+def _dob_scalars(dob: date) -> Tuple[int, int, int, int]:
+    """
+    Return (month, day, year, life_path) for a date of birth.
+
+    month/day/year are plain single-digit reductions (the pinnacle/challenge
+    inputs); life_path keeps master numbers.
+    """
+    return (
+        _digital_root(dob.month),
+        _digital_root(dob.day),
+        _digital_root(dob.year),
+        NumerologyEngine.calculate_life_path(dob),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _pinnacles(dob: date) -> Tuple[Tuple[int, int, int], ...]:
+    """Memoized pinnacle (start_age, end_age, number) rows for a date of birth."""
+    return tuple(NumerologyEngine._calculate_pinnacles(*_dob_scalars(dob)))
+
+
+@lru_cache(maxsize=4096)
+def _challenges(dob: date) -> Tuple[Tuple[int, int, int], ...]:
+    """Memoized challenge (start_age, end_age, number) rows for a date of birth."""
+    return tuple(NumerologyEngine._calculate_challenges(*_dob_scalars(dob)))
+
+
+@lru_cache(maxsize=4096)
+def _compute_numbers(full_name: str, date_of_birth: date, current_date: date) -> tuple:
+    """Memoized NumerologyEngine._compute_numbers."""
+    return NumerologyEngine._compute_numbers(full_name, date_of_birth, current_date)
+
+
+def _walk_karmic_in_reduction(total: int, stop_at_master: bool) -> Tuple[int, ...]:
+    """Karmic debt numbers passed through while digit-summing total down to 1-9."""
+    master_numbers = _MASTER_NUMBERS
+    karmic_debt = _KARMIC_DEBT
+    found = []
+    while total > 9:
+        if stop_at_master and total in master_numbers:
+            break
+        if total in karmic_debt:
+            found.append(total)
+        total = _digit_sum(total)
+    return tuple(found)
+
+
+# Precomputed walks for every total below 2000 (name totals of ~200 letters), keyed by stop_at_master.
+# Only totals that pass through a karmic number are stored.
+_KARMIC_TABLE_SIZE = 2000
+_KARMIC_IN_REDUCTION = {
+    stop_at_master: {
+        total: found
+        for total in range(10, _KARMIC_TABLE_SIZE)
+        if (found := _walk_karmic_in_reduction(total, stop_at_master))
+    }
+    for stop_at_master in (False, True)
+}
+
+
+def _karmic_in_reduction(total: int, stop_at_master: bool) -> Tuple[int, ...]:
+    """Table lookup for _walk_karmic_in_reduction, walking only past the table."""
+    if total < _KARMIC_TABLE_SIZE:
+        return _KARMIC_IN_REDUCTION[stop_at_master].get(total, ())
+    return _walk_karmic_in_reduction(total, stop_at_master)
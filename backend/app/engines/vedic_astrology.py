@@ -8,7 +8,11 @@ This module provides:
 - Transit-to-natal aspect analysis
 """
 
-from datetime import date, timedelta
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
@@ -20,7 +24,7 @@ from app.schemas.chart import PlanetPosition
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DashaPeriod:
     """Represents a Dasha (planetary period)."""
     planet: str
@@ -31,7 +35,7 @@ class DashaPeriod:
     sub_periods: List['DashaPeriod'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Aspect:
     """Represents a planetary aspect."""
     aspecting_planet: str
@@ -43,7 +47,7 @@ class Aspect:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Yoga:
     """Represents a Vedic yoga combination."""
     name: str
@@ -57,7 +61,7 @@ class Yoga:
     effects: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitAspect:
     """Represents a transit aspect to natal planet."""
     transit_planet: str
@@ -75,6 +79,65 @@ class TransitAspect:
 # VIMSHOTTARI DASHA SYSTEM
 # =============================================================================
 
+_END_DATE = attrgetter("end_date")
+
+
+def _find_period(periods: List[DashaPeriod], on: date) -> Optional[DashaPeriod]:
+    """
+    First period with start_date <= on <= end_date, by binary search.
+
+    Periods are contiguous and in order, so the first one ending on/after the
+    date is the only candidate (a boundary date belongs to the earlier period).
+    """
+    index = bisect_left(periods, on, key=_END_DATE)
+    if index < len(periods) and periods[index].start_date <= on:
+        return periods[index]
+    return None
+
+
+# Half a microsecond in days: timedelta rounds to whole microseconds before
+# truncating to days, so a span a hair under a whole day still counts as one
+_HALF_MICROSECOND_DAYS = 0.5 / 86_400_000_000
+
+
+@lru_cache(maxsize=4)
+def _sign_index_map(signs: Tuple[str, ...]) -> Dict[str, int]:
+    """Sign name -> index in signs (first occurrence, as signs.index would give)."""
+    index_map: Dict[str, int] = {}
+    for index, sign in enumerate(signs):
+        index_map.setdefault(sign, index)
+    return index_map
+
+
+@lru_cache(maxsize=64)
+def _title(name: str) -> str:
+    """Display form of a planet name ("mars" -> "Mars"), computed once per name."""
+    return name.title()
+
+
+def _planet_rows(
+    planets: Dict[str, PlanetPosition],
+    sign_index: Dict[str, int],
+) -> List[Tuple[str, PlanetPosition, int, float, float]]:
+    """
+    (planet, position, sign index, degree, absolute longitude) for every planet.
+
+    Built once per call so the pair loops unpack plain tuples instead of
+    re-reading model attributes; unknown signs count as index 0.
+    """
+    rows = []
+    for planet, pos in planets.items():
+        sign_idx = sign_index.get(pos.sign, 0)
+        degree = pos.degree
+        rows.append((planet, pos, sign_idx, degree, sign_idx * 30 + degree))
+    return rows
+
+
+def _period_days(years: float) -> int:
+    """Whole days in `years` of 365.25 days - what date + timedelta would advance."""
+    return int(years * 365.25 + _HALF_MICROSECOND_DAYS)
+
+
 class VimshottariDasha:
     """
     Vimshottari Dasha - The 120-year planetary period system.
@@ -111,6 +174,12 @@ class VimshottariDasha:
         "Jupiter", "Saturn", "Mercury"
     ]
 
+    # The same tables keyed by lord id (position in DASHA_SEQUENCE), so the
+    # schedule builders index tuples instead of scanning/hashing lord names
+    _LORD_IDS: Dict[str, int] = {lord: i for i, lord in enumerate(DASHA_SEQUENCE)}
+    _DASHA_YEARS_BY_ID: Tuple[int, ...] = tuple(map(DASHA_YEARS.__getitem__, DASHA_SEQUENCE))
+    _NAK_LORD_IDS: Tuple[int, ...] = tuple(map(_LORD_IDS.__getitem__, NAKSHATRA_LORDS))
+
     @classmethod
     def calculate_dasha(
         cls,
@@ -135,61 +204,90 @@ class VimshottariDasha:
         position_in_nakshatra = (moon_longitude % nakshatra_span) / nakshatra_span
 
         # Get starting dasha lord
-        starting_lord = cls.NAKSHATRA_LORDS[nakshatra_index]
-        lord_index = cls.DASHA_SEQUENCE.index(starting_lord)
+        lord_index = cls._NAK_LORD_IDS[nakshatra_index]
 
         # Calculate remaining portion of first dasha
-        total_dasha_years = cls.DASHA_YEARS[starting_lord]
+        total_dasha_years = cls._DASHA_YEARS_BY_ID[lord_index]
         elapsed_portion = position_in_nakshatra
         remaining_years = total_dasha_years * (1 - elapsed_portion)
 
-        # Build dasha periods
-        dashas = []
-        current_date = date_of_birth
-        end_date = date_of_birth + timedelta(days=years_to_calculate * 365.25)
+        start_ordinal = date_of_birth.toordinal()
+        end_ordinal = start_ordinal + _period_days(years_to_calculate)
 
-        # First (partial) dasha
-        first_end = current_date + timedelta(days=remaining_years * 365.25)
-        if first_end <= end_date:
+        # Build dasha periods from the integer schedule
+        first, full = cls._mahadasha_schedule(
+            lord_index, remaining_years, start_ordinal, end_ordinal
+        )
+
+        dashas = []
+        if first:
+            # First (partial) dasha - no Antardashas
+            lord, start, end, years = first
             dashas.append(DashaPeriod(
-                planet=starting_lord,
-                start_date=current_date,
-                end_date=first_end,
-                duration_years=remaining_years,
+                planet=cls.DASHA_SEQUENCE[lord],
+                start_date=date.fromordinal(start),
+                end_date=date.fromordinal(end),
+                duration_years=years,
                 level=1,
             ))
-            current_date = first_end
-            lord_index = (lord_index + 1) % 9
-
-        # Full dashas
-        while current_date < end_date:
-            planet = cls.DASHA_SEQUENCE[lord_index]
-            years = cls.DASHA_YEARS[planet]
-            period_end = current_date + timedelta(days=years * 365.25)
-
-            if period_end > end_date:
-                period_end = end_date
-                years = (period_end - current_date).days / 365.25
 
+        for lord, start, end, years in full:
             dasha = DashaPeriod(
-                planet=planet,
-                start_date=current_date,
-                end_date=period_end,
+                planet=cls.DASHA_SEQUENCE[lord],
+                start_date=date.fromordinal(start),
+                end_date=date.fromordinal(end),
                 duration_years=years,
                 level=1,
             )
 
             # Calculate Antardashas (sub-periods)
-            dasha.sub_periods = cls._calculate_antardashas(
-                planet, current_date, period_end
-            )
-
+            dasha.sub_periods = cls._antardasha_periods(lord, start, end)
             dashas.append(dasha)
-            current_date = period_end
-            lord_index = (lord_index + 1) % 9
 
         return dashas
 
+    @classmethod
+    def _mahadasha_schedule(
+        cls,
+        lord_index: int,
+        first_years: float,
+        start_ordinal: int,
+        end_ordinal: int,
+    ) -> Tuple[Optional[Tuple[int, int, int, float]], List[Tuple[int, int, int, float]]]:
+        """
+        Mahadasha schedule as plain numbers: (lord_index, start, end, years) rows.
+
+        Dates are proleptic ordinals, so the loop does no date/DashaPeriod work.
+
+        Returns:
+            (partial dasha left at birth or None if it overruns, full dashas)
+        """
+        first = None
+        rows = []
+        current = start_ordinal
+
+        # First (partial) dasha
+        first_end = current + _period_days(first_years)
+        if first_end <= end_ordinal:
+            first = (lord_index, current, first_end, first_years)
+            current = first_end
+            lord_index = (lord_index + 1) % 9
+
+        # Full dashas
+        while current < end_ordinal:
+            years = cls._DASHA_YEARS_BY_ID[lord_index]
+            period_end = current + _period_days(years)
+
+            if period_end > end_ordinal:
+                period_end = end_ordinal
+                years = (period_end - current) / 365.25
+
+            rows.append((lord_index, current, period_end, years))
+            current = period_end
+            lord_index = (lord_index + 1) % 9
+
+        return first, rows
+
     @classmethod
     def _calculate_antardashas(
         cls,
@@ -198,37 +296,66 @@ class VimshottariDasha:
         end_date: date,
     ) -> List[DashaPeriod]:
         """Calculate Antardasha (sub-periods) within a Mahadasha."""
-        antardashas = []
-        mahadasha_years = (end_date - start_date).days / 365.25
+        return cls._antardasha_periods(
+            cls._LORD_IDS[mahadasha_lord],
+            start_date.toordinal(),
+            end_date.toordinal(),
+        )
+
+    @classmethod
+    def _antardasha_periods(
+        cls,
+        lord_index: int,
+        start_ordinal: int,
+        end_ordinal: int,
+    ) -> List[DashaPeriod]:
+        """Antardasha DashaPeriods for a Mahadasha given by lord index and ordinals."""
+        return [
+            DashaPeriod(
+                planet=cls.DASHA_SEQUENCE[lord],
+                start_date=date.fromordinal(start),
+                end_date=date.fromordinal(end),
+                duration_years=years,
+                level=2,
+            )
+            for lord, start, end, years in cls._antardasha_schedule(
+                lord_index, start_ordinal, end_ordinal
+            )
+        ]
+
+    @classmethod
+    def _antardasha_schedule(
+        cls,
+        lord_index: int,
+        start_ordinal: int,
+        end_ordinal: int,
+    ) -> List[Tuple[int, int, int, float]]:
+        """Antardasha schedule within a Mahadasha, as (lord_index, start, end, years) rows."""
+        rows = []
+        mahadasha_years = (end_ordinal - start_ordinal) / 365.25
+        dasha_years = cls._DASHA_YEARS_BY_ID
 
         # Start from Mahadasha lord
-        lord_index = cls.DASHA_SEQUENCE.index(mahadasha_lord)
-        current_date = start_date
+        current = start_ordinal
 
         for i in range(9):
-            planet = cls.DASHA_SEQUENCE[(lord_index + i) % 9]
+            lord = (lord_index + i) % 9
             # Antardasha duration is proportional to its Mahadasha years
-            proportion = cls.DASHA_YEARS[planet] / 120.0
+            proportion = dasha_years[lord] / 120.0
             antardasha_years = mahadasha_years * proportion
-            period_end = current_date + timedelta(days=antardasha_years * 365.25)
+            period_end = current + _period_days(antardasha_years)
 
-            if period_end > end_date:
-                period_end = end_date
-                antardasha_years = (period_end - current_date).days / 365.25
+            if period_end > end_ordinal:
+                period_end = end_ordinal
+                antardasha_years = (period_end - current) / 365.25
 
-            antardashas.append(DashaPeriod(
-                planet=planet,
-                start_date=current_date,
-                end_date=period_end,
-                duration_years=antardasha_years,
-                level=2,
-            ))
+            rows.append((lord, current, period_end, antardasha_years))
 
-            current_date = period_end
-            if current_date >= end_date:
+            current = period_end
+            if current >= end_ordinal:
                 break
 
-        return antardashas
+        return rows
 
     @classmethod
     def get_current_dasha(
@@ -248,35 +375,67 @@ class VimshottariDasha:
         if current_date is None:
             current_date = date.today()
 
-        for dasha in dashas:
-            if dasha.start_date <= current_date <= dasha.end_date:
-                mahadasha_remaining = (dasha.end_date - current_date).days
-
-                # Find current Antardasha
-                antardasha_planet = None
-                antardasha_remaining = 0
-                for antardasha in dasha.sub_periods:
-                    if antardasha.start_date <= current_date <= antardasha.end_date:
-                        antardasha_planet = antardasha.planet
-                        antardasha_remaining = (antardasha.end_date - current_date).days
-                        break
-
-                return {
-                    "mahadasha": dasha.planet,
-                    "mahadasha_start": dasha.start_date.isoformat(),
-                    "mahadasha_end": dasha.end_date.isoformat(),
-                    "mahadasha_remaining_days": mahadasha_remaining,
-                    "antardasha": antardasha_planet,
-                    "antardasha_remaining_days": antardasha_remaining,
-                }
-
-        return {"mahadasha": None, "antardasha": None}
+        dasha = _find_period(dashas, current_date)
+        if dasha is None:
+            return {"mahadasha": None, "antardasha": None}
+
+        # Day counts as ordinal differences - no timedelta per lookup
+        today = current_date.toordinal()
+        mahadasha_remaining = dasha.end_date.toordinal() - today
+
+        # Find current Antardasha
+        antardasha_planet = None
+        antardasha_remaining = 0
+        antardasha = _find_period(dasha.sub_periods, current_date)
+        if antardasha is not None:
+            antardasha_planet = antardasha.planet
+            antardasha_remaining = antardasha.end_date.toordinal() - today
+
+        return {
+            "mahadasha": dasha.planet,
+            "mahadasha_start": dasha.start_date.isoformat(),
+            "mahadasha_end": dasha.end_date.isoformat(),
+            "mahadasha_remaining_days": mahadasha_remaining,
+            "antardasha": antardasha_planet,
+            "antardasha_remaining_days": antardasha_remaining,
+        }
 
 
 # =============================================================================
 # VEDIC ASPECTS (DRISHTI)
 # =============================================================================
 
+def _build_aspected_houses(special_aspects: Dict[str, List[int]]) -> Dict[str, frozenset]:
+    """Planet -> house distances it can aspect: conjunction (1), 7th, plus its specials."""
+    return {
+        planet: frozenset((1, 7, *houses))
+        for planet, houses in special_aspects.items()
+    }
+
+
+def _build_aspect_row(
+    special_houses: List[int],
+    aspect_strength: Dict[int, str],
+) -> Tuple[Optional[Tuple[str, str]], ...]:
+    """House distance (index 0-12) -> (aspect_type, strength) or None; conjunction is handled by orb."""
+    row: List[Optional[Tuple[str, str]]] = [None] * 13
+    for house in special_houses:
+        row[house] = ("special", aspect_strength.get(house, "half"))
+    row[7] = ("opposition", "full")  # All planets have 7th house aspect
+    return tuple(row)
+
+
+def _build_aspect_rows(
+    special_aspects: Dict[str, List[int]],
+    aspect_strength: Dict[int, str],
+) -> Dict[str, Tuple[Optional[Tuple[str, str]], ...]]:
+    """Planet -> its _build_aspect_row."""
+    return {
+        planet: _build_aspect_row(houses, aspect_strength)
+        for planet, houses in special_aspects.items()
+    }
+
+
 class VedicAspects:
     """
     Vedic planetary aspects (Drishti).
@@ -298,6 +457,11 @@ class VedicAspects:
         "ketu": [5, 9],      # Like Jupiter
     }
 
+    # House distances at which a planet can aspect at all; every other pair is
+    # skipped without calling _check_aspect
+    _DEFAULT_ASPECTED_HOUSES = frozenset((1, 7))
+    _ASPECTED_HOUSES = _build_aspected_houses(SPECIAL_ASPECTS)
+
     # Aspect strength by house distance
     ASPECT_STRENGTH = {
         7: "full",           # Opposition - full aspect
@@ -309,6 +473,10 @@ class VedicAspects:
         10: "half",          # (Saturn special)
     }
 
+    # Aspect kind by house distance, per planet (tuple-indexed, no per-pair branching)
+    _DEFAULT_ASPECT_ROW = _build_aspect_row([], ASPECT_STRENGTH)
+    _ASPECT_ROWS = _build_aspect_rows(SPECIAL_ASPECTS, ASPECT_STRENGTH)
+
     # Benefic planets
     BENEFICS = {"jupiter", "venus", "moon", "mercury"}  # Mercury when unafflicted
     MALEFICS = {"saturn", "mars", "sun", "rahu", "ketu"}
@@ -330,26 +498,35 @@ class VedicAspects:
             List of Aspect objects
         """
         aspects = []
-        planet_signs = {}
-
-        # Map planets to their sign indices
-        for planet, pos in planets.items():
-            sign_idx = signs.index(pos.sign) if pos.sign in signs else 0
-            planet_signs[planet] = (sign_idx, pos.degree)
-
-        # Check aspects between all planet pairs
-        for planet1, (sign1, deg1) in planet_signs.items():
-            for planet2, (sign2, deg2) in planet_signs.items():
-                if planet1 == planet2:
-                    continue
-
-                # Calculate house distance (1-12)
-                house_distance = ((sign2 - sign1) % 12) + 1
-
-                # Check if aspect exists
-                aspect = cls._check_aspect(planet1, planet2, house_distance, deg1, deg2)
-                if aspect:
-                    aspects.append(aspect)
+        planet_rows = _planet_rows(planets, _sign_index_map(tuple(signs)))
+
+        # Check aspects between all planet pairs. Each unordered pair is visited
+        # once and checked in both directions; aspects are collected per
+        # aspecting planet so the output keeps the planet1-then-planet2 order.
+        aspected_houses = cls._ASPECTED_HOUSES
+        default_houses = cls._DEFAULT_ASPECTED_HOUSES
+        check_aspect = cls._check_aspect
+        rows = [
+            (planet, sign, deg, aspected_houses.get(planet, default_houses), [])
+            for planet, _, sign, deg, _ in planet_rows
+        ]
+        for i, (planet1, sign1, deg1, houses1, found1) in enumerate(rows):
+            for planet2, sign2, deg2, houses2, found2 in rows[i + 1:]:
+                # House distance (1-12) each way
+                distance12 = ((sign2 - sign1) % 12) + 1
+                distance21 = ((sign1 - sign2) % 12) + 1
+
+                if distance12 in houses1:
+                    aspect = check_aspect(planet1, planet2, distance12, deg1, deg2)
+                    if aspect:
+                        found1.append(aspect)
+                if distance21 in houses2:
+                    aspect = check_aspect(planet2, planet1, distance21, deg2, deg1)
+                    if aspect:
+                        found2.append(aspect)
+
+        for *_, found in rows:
+            aspects.extend(found)
 
         return aspects
 
@@ -363,38 +540,20 @@ class VedicAspects:
         deg2: float,
     ) -> Optional[Aspect]:
         """Check if planet1 aspects planet2 and return Aspect if so."""
-        is_aspecting = False
-        aspect_type = ""
-        strength = "full"
-
-        # All planets have 7th house aspect (opposition)
-        if house_distance == 7:
-            is_aspecting = True
-            aspect_type = "opposition"
-            strength = "full"
-
-        # Check special aspects
-        elif planet1 in cls.SPECIAL_ASPECTS:
-            if house_distance in cls.SPECIAL_ASPECTS[planet1]:
-                is_aspecting = True
-                aspect_type = "special"
-                strength = cls.ASPECT_STRENGTH.get(house_distance, "half")
-
-        # Conjunction (same sign)
         if house_distance == 1:
+            # Conjunction (same sign)
             orb = abs(deg1 - deg2)
-            if orb <= 10:  # Within 10 degree orb
-                is_aspecting = True
-                aspect_type = "conjunction"
-                strength = "full" if orb <= 5 else "three_quarter"
-
-        if not is_aspecting:
-            return None
-
-        # Calculate orb
-        long1 = (house_distance - 1) * 30 + deg1
-        long2 = deg2
-        orb = abs(long1 - long2) if aspect_type != "conjunction" else abs(deg1 - deg2)
+            if orb > 10:  # Outside 10 degree orb
+                return None
+            aspect_type = "conjunction"
+            strength = "full" if orb <= 5 else "three_quarter"
+        else:
+            # 7th house (opposition) and special aspects
+            kind = cls._ASPECT_ROWS.get(planet1, cls._DEFAULT_ASPECT_ROW)[house_distance]
+            if kind is None:
+                return None
+            aspect_type, strength = kind
+            orb = abs((house_distance - 1) * 30 + deg1 - deg2)
 
         is_benefic = planet1 in cls.BENEFICS
 
@@ -405,7 +564,7 @@ class VedicAspects:
             orb=round(orb, 2),
             strength=strength,
             is_benefic=is_benefic,
-            description=cls._get_aspect_description(planet1, planet2, aspect_type, is_benefic),
+            description=_aspect_description(planet1, planet2, aspect_type, is_benefic),
         )
 
     @classmethod
@@ -417,8 +576,8 @@ class VedicAspects:
         is_benefic: bool,
     ) -> str:
         """Generate a description for an aspect."""
-        p1 = planet1.title()
-        p2 = planet2.title()
+        p1 = _title(planet1)
+        p2 = _title(planet2)
 
         if aspect_type == "conjunction":
             return f"{p1} conjunct {p2}: Energies merge and intensify each other"
@@ -433,6 +592,34 @@ class VedicAspects:
 # YOGA COMBINATIONS
 # =============================================================================
 
+def _build_house_lords(sign_lords: Dict[int, str], houses: List[int]) -> Tuple[frozenset, ...]:
+    """Ascendant sign index -> set of lords of the given houses."""
+    return tuple(
+        frozenset(sign_lords[(asc_index + house - 1) % 12] for house in houses)
+        for asc_index in range(12)
+    )
+
+
+def _build_house_lord_maps(sign_lords: Dict[int, str], houses: List[int]) -> Tuple[Dict[int, str], ...]:
+    """Ascendant sign index -> {house: lord} for the given houses."""
+    return tuple(
+        {house: sign_lords[(asc_index + house - 1) % 12] for house in houses}
+        for asc_index in range(12)
+    )
+
+
+@dataclass(slots=True)
+class _YogaContext:
+    """Per-chart state shared by the yoga detectors, derived once in detect_yogas."""
+    planets: Dict[str, PlanetPosition]
+    planet_houses: Dict[str, int]
+    planets_by_house: Dict[int, List[str]]
+    asc_index: int
+    kendra_lords: frozenset
+    trikona_lords: frozenset
+    wealth_lords: Dict[int, str]
+
+
 class YogaDetector:
     """
     Detects Vedic yoga combinations in a chart.
@@ -466,6 +653,63 @@ class YogaDetector:
     # Dusthana houses (difficult)
     DUSTHANAS = [6, 8, 12]
 
+    # Wealth houses (Dhana)
+    WEALTH_HOUSES = [2, 5, 9, 11]
+
+    # Pancha Mahapurusha yogas: planet -> (yoga name, effects)
+    MAHAPURUSHA_YOGAS = {
+        "mars": ("Ruchaka", "Courage, leadership, military prowess"),
+        "mercury": ("Bhadra", "Intelligence, eloquence, business acumen"),
+        "jupiter": ("Hamsa", "Wisdom, spirituality, good fortune"),
+        "venus": ("Malavya", "Beauty, luxury, artistic talents"),
+        "saturn": ("Shasha", "Authority, discipline, longevity"),
+    }
+
+    MAHAPURUSHA_OWN_SIGNS = {
+        "mars": frozenset(("Aries", "Scorpio")),
+        "mercury": frozenset(("Gemini", "Virgo")),
+        "jupiter": frozenset(("Sagittarius", "Pisces")),
+        "venus": frozenset(("Taurus", "Libra")),
+        "saturn": frozenset(("Capricorn", "Aquarius")),
+    }
+
+    MAHAPURUSHA_EXALTATION_SIGNS = {
+        "mars": "Capricorn",
+        "mercury": "Virgo",
+        "jupiter": "Cancer",
+        "venus": "Pisces",
+        "saturn": "Libra",
+    }
+
+    # Neecha Bhanga: debilitation sign and the lord whose strength cancels it
+    DEBILITATION_SIGNS = {
+        "sun": "Libra",
+        "moon": "Scorpio",
+        "mars": "Cancer",
+        "mercury": "Pisces",
+        "jupiter": "Capricorn",
+        "venus": "Virgo",
+        "saturn": "Aries",
+    }
+
+    CANCELLATION_LORDS = {
+        "sun": "venus",      # Libra lord
+        "moon": "mars",      # Scorpio lord
+        "mars": "moon",      # Cancer lord
+        "mercury": "jupiter", # Pisces lord
+        "jupiter": "saturn", # Capricorn lord
+        "venus": "mercury",  # Virgo lord
+        "saturn": "mars",    # Aries lord
+    }
+
+    # Dignities strong enough for the cancellation lord to cancel debilitation
+    CANCELLING_DIGNITIES = frozenset(("exalted", "own_sign", "moolatrikona"))
+
+    # House lords depend only on the ascendant, so all 12 are tabulated up front
+    _KENDRA_LORDS_BY_ASC = _build_house_lords(SIGN_LORDS, KENDRAS)
+    _TRIKONA_LORDS_BY_ASC = _build_house_lords(SIGN_LORDS, TRIKONAS)
+    _WEALTH_LORDS_BY_ASC = _build_house_lord_maps(SIGN_LORDS, WEALTH_HOUSES)
+
     @classmethod
     def detect_yogas(
         cls,
@@ -487,32 +731,42 @@ class YogaDetector:
             List of detected Yoga objects
         """
         yogas = []
-        asc_index = signs.index(ascendant_sign) if ascendant_sign in signs else 0
+        sign_index = _sign_index_map(tuple(signs))
+        asc_index = sign_index.get(ascendant_sign, 0)
 
         # Map planets to houses
-        planet_houses = {}
-        for planet, pos in planets.items():
-            sign_idx = signs.index(pos.sign) if pos.sign in signs else 0
-            house = ((sign_idx - asc_index) % 12) + 1
-            planet_houses[planet] = house
+        planet_houses = {
+            planet: ((sign_idx - asc_index) % 12) + 1
+            for planet, _, sign_idx, _, _ in _planet_rows(planets, sign_index)
+        }
+
+        # Group planets by house - conjunction yogas only care about shared houses
+        planets_by_house = defaultdict(list)
+        for planet, house in planet_houses.items():
+            planets_by_house[house].append(planet)
+
+        ctx = _YogaContext(
+            planets=planets,
+            planet_houses=planet_houses,
+            planets_by_house=planets_by_house,
+            asc_index=asc_index,
+            kendra_lords=cls._KENDRA_LORDS_BY_ASC[asc_index],
+            trikona_lords=cls._TRIKONA_LORDS_BY_ASC[asc_index],
+            wealth_lords=cls._WEALTH_LORDS_BY_ASC[asc_index],
+        )
 
         # Detect various yogas
-        yogas.extend(cls._detect_mahapurusha_yogas(planets, planet_houses, signs))
-        yogas.extend(cls._detect_raja_yogas(planet_houses, asc_index, signs))
-        yogas.extend(cls._detect_dhana_yogas(planet_houses, asc_index, signs))
-        yogas.extend(cls._detect_neecha_bhanga(planets, signs))
-        yogas.extend(cls._detect_gajakesari(planet_houses))
-        yogas.extend(cls._detect_budhaditya(planet_houses, planets))
+        yogas.extend(cls._detect_mahapurusha_yogas(ctx))
+        yogas.extend(cls._detect_raja_yogas(ctx))
+        yogas.extend(cls._detect_dhana_yogas(ctx))
+        yogas.extend(cls._detect_neecha_bhanga(ctx))
+        yogas.extend(cls._detect_gajakesari(ctx))
+        yogas.extend(cls._detect_budhaditya(ctx))
 
         return yogas
 
     @classmethod
-    def _detect_mahapurusha_yogas(
-        cls,
-        planets: Dict[str, PlanetPosition],
-        planet_houses: Dict[str, int],
-        signs: List[str],
-    ) -> List[Yoga]:
+    def _detect_mahapurusha_yogas(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Pancha Mahapurusha Yogas.
 
@@ -520,44 +774,25 @@ class YogaDetector:
         are in their own or exaltation sign AND in a Kendra house.
         """
         yogas = []
+        planets = ctx.planets
+        planet_houses = ctx.planet_houses
+        own_signs = cls.MAHAPURUSHA_OWN_SIGNS
+        exaltation_signs = cls.MAHAPURUSHA_EXALTATION_SIGNS
+        kendras = cls.KENDRAS
 
-        mahapurusha_config = {
-            "mars": ("Ruchaka", "Courage, leadership, military prowess"),
-            "mercury": ("Bhadra", "Intelligence, eloquence, business acumen"),
-            "jupiter": ("Hamsa", "Wisdom, spirituality, good fortune"),
-            "venus": ("Malavya", "Beauty, luxury, artistic talents"),
-            "saturn": ("Shasha", "Authority, discipline, longevity"),
-        }
-
-        own_signs = {
-            "mars": ["Aries", "Scorpio"],
-            "mercury": ["Gemini", "Virgo"],
-            "jupiter": ["Sagittarius", "Pisces"],
-            "venus": ["Taurus", "Libra"],
-            "saturn": ["Capricorn", "Aquarius"],
-        }
-
-        exaltation_signs = {
-            "mars": "Capricorn",
-            "mercury": "Virgo",
-            "jupiter": "Cancer",
-            "venus": "Pisces",
-            "saturn": "Libra",
-        }
-
-        for planet, (yoga_name, effects) in mahapurusha_config.items():
+        for planet, (yoga_name, effects) in cls.MAHAPURUSHA_YOGAS.items():
             if planet not in planets:
                 continue
 
-            pos = planets[planet]
-            house = planet_houses.get(planet, 0)
+            sign = planets[planet].sign
+            house = planet_houses[planet]
 
             # Check if in own or exaltation sign
-            in_own = pos.sign in own_signs.get(planet, [])
-            in_exalt = pos.sign == exaltation_signs.get(planet)
+            in_own = sign in own_signs.get(planet, ())
+            in_exalt = sign == exaltation_signs.get(planet)
 
             # Check if in Kendra
-            in_kendra = house in cls.KENDRAS
+            in_kendra = house in kendras
 
             if (in_own or in_exalt) and in_kendra:
                 strength = "strong" if in_exalt else "moderate"
@@ -569,19 +804,14 @@ class YogaDetector:
                     houses_involved=[house],
                     is_benefic=True,
                     strength=strength,
-                    description=f"{planet.title()} in {pos.sign} (house {house}) forms {yoga_name} Yoga",
+                    description=f"{_title(planet)} in {sign} (house {house}) forms {yoga_name} Yoga",
                     effects=effects,
                 ))
 
         return yogas
 
     @classmethod
-    def _detect_raja_yogas(
-        cls,
-        planet_houses: Dict[str, int],
-        asc_index: int,
-        signs: List[str],
-    ) -> List[Yoga]:
+    def _detect_raja_yogas(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Raja Yogas (combinations for power and authority).
 
@@ -590,31 +820,22 @@ class YogaDetector:
         """
         yogas = []
 
-        # Get lords of Kendra and Trikona houses
-        kendra_lords = set()
-        trikona_lords = set()
-
-        for house in cls.KENDRAS:
-            sign_idx = (asc_index + house - 1) % 12
-            lord = cls.SIGN_LORDS[sign_idx]
-            kendra_lords.add(lord)
-
-        for house in cls.TRIKONAS:
-            sign_idx = (asc_index + house - 1) % 12
-            lord = cls.SIGN_LORDS[sign_idx]
-            trikona_lords.add(lord)
+        planet_houses = ctx.planet_houses
+        kendra_lords = ctx.kendra_lords
+        trikona_lords = ctx.trikona_lords
 
         # Check for conjunctions between Kendra and Trikona lords
         for kendra_lord in kendra_lords:
+            kl_house = planet_houses.get(kendra_lord, 0)
+            if len(ctx.planets_by_house.get(kl_house, ())) < 2:
+                continue  # Lord missing or alone in its house - no conjunction possible
+
             for trikona_lord in trikona_lords:
                 if kendra_lord == trikona_lord:
                     continue
 
-                kl_house = planet_houses.get(kendra_lord, 0)
-                tl_house = planet_houses.get(trikona_lord, 0)
-
                 # Conjunction (same house)
-                if kl_house == tl_house and kl_house > 0:
+                if planet_houses.get(trikona_lord, 0) == kl_house:
                     yogas.append(Yoga(
                         name="Raja Yoga",
                         name_sanskrit="Raja Yoga",
@@ -623,19 +844,14 @@ class YogaDetector:
                         houses_involved=[kl_house],
                         is_benefic=True,
                         strength="strong",
-                        description=f"{kendra_lord.title()} (Kendra lord) conjunct {trikona_lord.title()} (Trikona lord) in house {kl_house}",
+                        description=f"{_title(kendra_lord)} (Kendra lord) conjunct {_title(trikona_lord)} (Trikona lord) in house {kl_house}",
                         effects="Success, recognition, authority, and rise in life",
                     ))
 
         return yogas
 
     @classmethod
-    def _detect_dhana_yogas(
-        cls,
-        planet_houses: Dict[str, int],
-        asc_index: int,
-        signs: List[str],
-    ) -> List[Yoga]:
+    def _detect_dhana_yogas(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Dhana Yogas (wealth combinations).
 
@@ -643,24 +859,18 @@ class YogaDetector:
         are well placed and connected.
         """
         yogas = []
-        wealth_houses = [2, 5, 9, 11]
-
-        # Get lords of wealth houses
-        wealth_lords = {}
-        for house in wealth_houses:
-            sign_idx = (asc_index + house - 1) % 12
-            lord = cls.SIGN_LORDS[sign_idx]
-            wealth_lords[house] = lord
+        planet_houses = ctx.planet_houses
+        wealth_lords = ctx.wealth_lords
 
         # Check if 2nd and 11th lords are together
-        lord_2 = wealth_lords.get(2)
-        lord_11 = wealth_lords.get(11)
+        lord_2 = wealth_lords[2]
+        lord_11 = wealth_lords[11]
 
-        if lord_2 and lord_11:
-            house_2 = planet_houses.get(lord_2, 0)
-            house_11 = planet_houses.get(lord_11, 0)
+        # Both lords must be placed in the chart (planet_houses has every planet)
+        if lord_2 in planet_houses and lord_11 in planet_houses:
+            house_2 = planet_houses[lord_2]
 
-            if house_2 == house_11 and house_2 > 0:
+            if house_2 == planet_houses[lord_11]:
                 yogas.append(Yoga(
                     name="Dhana Yoga",
                     name_sanskrit="Dhana Yoga",
@@ -669,18 +879,14 @@ class YogaDetector:
                     houses_involved=[house_2],
                     is_benefic=True,
                     strength="strong",
-                    description=f"2nd lord ({lord_2.title()}) and 11th lord ({lord_11.title()}) together in house {house_2}",
+                    description=f"2nd lord ({_title(lord_2)}) and 11th lord ({_title(lord_11)}) together in house {house_2}",
                     effects="Wealth accumulation, financial gains, prosperity",
                 ))
 
         return yogas
 
     @classmethod
-    def _detect_neecha_bhanga(
-        cls,
-        planets: Dict[str, PlanetPosition],
-        signs: List[str],
-    ) -> List[Yoga]:
+    def _detect_neecha_bhanga(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Neecha Bhanga Raja Yoga (cancellation of debilitation).
 
@@ -688,28 +894,10 @@ class YogaDetector:
         specific conditions, it can give powerful results.
         """
         yogas = []
+        planets = ctx.planets
+        cancellation_lords = cls.CANCELLATION_LORDS
 
-        debilitation_signs = {
-            "sun": "Libra",
-            "moon": "Scorpio",
-            "mars": "Cancer",
-            "mercury": "Pisces",
-            "jupiter": "Capricorn",
-            "venus": "Virgo",
-            "saturn": "Aries",
-        }
-
-        cancellation_lords = {
-            "sun": "venus",      # Libra lord
-            "moon": "mars",      # Scorpio lord
-            "mars": "moon",      # Cancer lord
-            "mercury": "jupiter", # Pisces lord
-            "jupiter": "saturn", # Capricorn lord
-            "venus": "mercury",  # Virgo lord
-            "saturn": "mars",    # Aries lord
-        }
-
-        for planet, debil_sign in debilitation_signs.items():
+        for planet, debil_sign in cls.DEBILITATION_SIGNS.items():
             if planet not in planets:
                 continue
 
@@ -723,11 +911,10 @@ class YogaDetector:
                 continue
 
             cancel_pos = planets[cancel_lord]
-            cancel_sign_idx = signs.index(cancel_pos.sign) if cancel_pos.sign in signs else 0
 
             # Cancellation if lord of debilitation sign is in Kendra from Lagna or Moon
             # Simplified: just check if cancellation lord is strong
-            if cancel_pos.dignity in ["exalted", "own_sign", "moolatrikona"]:
+            if cancel_pos.dignity in cls.CANCELLING_DIGNITIES:
                 yogas.append(Yoga(
                     name="Neecha Bhanga Raja Yoga",
                     name_sanskrit="Neecha Bhanga Raja Yoga",
@@ -736,20 +923,21 @@ class YogaDetector:
                     houses_involved=[],
                     is_benefic=True,
                     strength="moderate",
-                    description=f"{planet.title()} debilitated in {debil_sign}, cancelled by strong {cancel_lord.title()}",
+                    description=f"{_title(planet)} debilitated in {debil_sign}, cancelled by strong {_title(cancel_lord)}",
                     effects="Rise after initial struggles, transformation of weakness into strength",
                 ))
 
         return yogas
 
     @classmethod
-    def _detect_gajakesari(cls, planet_houses: Dict[str, int]) -> List[Yoga]:
+    def _detect_gajakesari(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Gaja Kesari Yoga.
 
         Forms when Jupiter is in Kendra from Moon.
         """
         yogas = []
+        planet_houses = ctx.planet_houses
 
         moon_house = planet_houses.get("moon", 0)
         jupiter_house = planet_houses.get("jupiter", 0)
@@ -776,24 +964,21 @@ class YogaDetector:
         return yogas
 
     @classmethod
-    def _detect_budhaditya(
-        cls,
-        planet_houses: Dict[str, int],
-        planets: Dict[str, PlanetPosition],
-    ) -> List[Yoga]:
+    def _detect_budhaditya(cls, ctx: _YogaContext) -> List[Yoga]:
         """
         Detect Budhaditya Yoga.
 
         Forms when Sun and Mercury are conjunct (same house).
         """
         yogas = []
+        planet_houses = ctx.planet_houses
 
         sun_house = planet_houses.get("sun", 0)
         mercury_house = planet_houses.get("mercury", 0)
 
         if sun_house == mercury_house and sun_house > 0:
             # Check Mercury is not combust (too close to Sun)
-            mercury_pos = planets.get("mercury")
+            mercury_pos = ctx.planets.get("mercury")
             is_combust = mercury_pos and mercury_pos.is_combust
 
             strength = "weak" if is_combust else "strong"
@@ -817,6 +1002,57 @@ class YogaDetector:
 # TRANSIT ASPECTS
 # =============================================================================
 
+# Exact angle of each transit aspect, in the order they are tried
+_TRANSIT_ASPECT_ANGLES = (
+    ("conjunction", 0),
+    ("opposition", 180),
+    ("trine", 120),
+    ("square", 90),
+    ("sextile", 60),
+)
+
+
+def _build_transit_aspect_candidates(
+    orbs: Dict[str, int],
+) -> Tuple[Tuple[Tuple[str, int, int], ...], ...]:
+    """Whole degrees of separation (0-180) -> (aspect_type, angle, orb) windows reaching into that degree."""
+    return tuple(
+        tuple(
+            (aspect_type, angle, orbs[aspect_type])
+            for aspect_type, angle in _TRANSIT_ASPECT_ANGLES
+            if angle - orbs[aspect_type] <= degree + 1 and angle + orbs[aspect_type] >= degree
+        )
+        for degree in range(181)
+    )
+
+
+def _scan_transit_aspects(
+    transit_longs: List[float],
+    natal_longs: List[float],
+    candidates: Tuple[Tuple[Tuple[str, int, int], ...], ...],
+) -> List[Tuple[int, int, str, float]]:
+    """
+    Every (transit index, natal index, aspect_type, orb) within orb.
+
+    Pure float work over two longitude lists - nothing here touches models -
+    so callers build result objects only for the pairs that hit.
+    """
+    hits = []
+    for transit_idx, transit_long in enumerate(transit_longs):
+        for natal_idx, natal_long in enumerate(natal_longs):
+            diff = abs(transit_long - natal_long)
+            if diff > 180:
+                diff = 360 - diff
+
+            # Check the aspect windows this separation can fall in
+            for aspect_type, angle, max_orb in candidates[int(diff)]:
+                orb = abs(diff - angle)
+                if orb <= max_orb:
+                    hits.append((transit_idx, natal_idx, aspect_type, orb))
+                    break
+    return hits
+
+
 class TransitAnalyzer:
     """
     Analyzes transit aspects to natal planets.
@@ -839,6 +1075,31 @@ class TransitAnalyzer:
         "sextile": 4,
     }
 
+    # Wording for transit interpretations
+    ASPECT_MEANINGS = {
+        "conjunction": "merging with",
+        "opposition": "opposing",
+        "trine": "harmoniously supporting",
+        "square": "challenging",
+        "sextile": "mildly supporting",
+    }
+
+    PLANET_THEMES = {
+        "saturn": "discipline, responsibility, and karmic lessons",
+        "jupiter": "expansion, opportunities, and growth",
+        "mars": "energy, action, and drive",
+        "sun": "identity, vitality, and purpose",
+        "moon": "emotions, intuition, and habits",
+        "mercury": "communication, thinking, and learning",
+        "venus": "relationships, values, and pleasure",
+        "rahu": "worldly desires and unconventional paths",
+        "ketu": "spirituality and letting go",
+    }
+
+    # Separation bucketed by whole degree, so most pairs are rejected with one
+    # index and the rest test only the window(s) they can fall in
+    _ASPECT_CANDIDATES = _build_transit_aspect_candidates(TRANSIT_ORBS)
+
     @classmethod
     def analyze_transits(
         cls,
@@ -859,27 +1120,23 @@ class TransitAnalyzer:
         """
         aspects = []
 
-        # Calculate longitudes
-        def get_longitude(pos: PlanetPosition) -> float:
-            sign_idx = signs.index(pos.sign) if pos.sign in signs else 0
-            return sign_idx * 30 + pos.degree
-
-        natal_longs = {p: get_longitude(pos) for p, pos in natal_planets.items()}
-        transit_longs = {p: get_longitude(pos) for p, pos in transit_planets.items()}
-
-        for transit_planet, transit_long in transit_longs.items():
-            transit_pos = transit_planets[transit_planet]
-
-            for natal_planet, natal_long in natal_longs.items():
-                natal_pos = natal_planets[natal_planet]
-
-                aspect = cls._check_transit_aspect(
-                    transit_planet, transit_pos, transit_long,
-                    natal_planet, natal_pos, natal_long,
-                )
+        # Absolute longitude of every position, worked out once up front
+        sign_index = _sign_index_map(tuple(signs))
+        natal_rows = _planet_rows(natal_planets, sign_index)
+        transit_rows = _planet_rows(transit_planets, sign_index)
 
-                if aspect:
-                    aspects.append(aspect)
+        # Numeric sweep over every pair first; objects only for the hits
+        hits = _scan_transit_aspects(
+            [row[4] for row in transit_rows],
+            [row[4] for row in natal_rows],
+            cls._ASPECT_CANDIDATES,
+        )
+        for transit_idx, natal_idx, aspect_type, orb in hits:
+            transit_planet, transit_pos = transit_rows[transit_idx][:2]
+            natal_planet, natal_pos = natal_rows[natal_idx][:2]
+            aspects.append(cls._build_transit_aspect(
+                transit_planet, transit_pos, natal_planet, natal_pos, aspect_type, orb,
+            ))
 
         # Sort by significance
         significance_order = {"major": 0, "moderate": 1, "minor": 2}
@@ -898,33 +1155,26 @@ class TransitAnalyzer:
         natal_long: float,
     ) -> Optional[TransitAspect]:
         """Check if transit planet aspects natal planet."""
-        diff = abs(transit_long - natal_long)
-        if diff > 180:
-            diff = 360 - diff
-
-        aspect_type = None
-        orb = 0
-
-        # Check each aspect type
-        if diff <= cls.TRANSIT_ORBS["conjunction"]:
-            aspect_type = "conjunction"
-            orb = diff
-        elif abs(diff - 180) <= cls.TRANSIT_ORBS["opposition"]:
-            aspect_type = "opposition"
-            orb = abs(diff - 180)
-        elif abs(diff - 120) <= cls.TRANSIT_ORBS["trine"]:
-            aspect_type = "trine"
-            orb = abs(diff - 120)
-        elif abs(diff - 90) <= cls.TRANSIT_ORBS["square"]:
-            aspect_type = "square"
-            orb = abs(diff - 90)
-        elif abs(diff - 60) <= cls.TRANSIT_ORBS["sextile"]:
-            aspect_type = "sextile"
-            orb = abs(diff - 60)
-
-        if not aspect_type:
+        hits = _scan_transit_aspects([transit_long], [natal_long], cls._ASPECT_CANDIDATES)
+        if not hits:
             return None
 
+        _, _, aspect_type, orb = hits[0]
+        return cls._build_transit_aspect(
+            transit_planet, transit_pos, natal_planet, natal_pos, aspect_type, orb,
+        )
+
+    @classmethod
+    def _build_transit_aspect(
+        cls,
+        transit_planet: str,
+        transit_pos: PlanetPosition,
+        natal_planet: str,
+        natal_pos: PlanetPosition,
+        aspect_type: str,
+        orb: float,
+    ) -> TransitAspect:
+        """Materialize a TransitAspect for a pair the sweep found in orb."""
         # Determine significance
         if transit_planet in cls.MAJOR_TRANSITS:
             significance = "major"
@@ -945,7 +1195,7 @@ class TransitAnalyzer:
             orb=round(orb, 2),
             is_applying=is_applying,
             significance=significance,
-            interpretation=cls._get_transit_interpretation(
+            interpretation=_transit_interpretation(
                 transit_planet, natal_planet, aspect_type, significance
             ),
         )
@@ -959,32 +1209,11 @@ class TransitAnalyzer:
         significance: str,
     ) -> str:
         """Generate interpretation for a transit aspect."""
-        tp = transit_planet.title()
-        np = natal_planet.title()
-
-        aspect_meanings = {
-            "conjunction": "merging with",
-            "opposition": "opposing",
-            "trine": "harmoniously supporting",
-            "square": "challenging",
-            "sextile": "mildly supporting",
-        }
-
-        action = aspect_meanings.get(aspect_type, "aspecting")
-
-        planet_themes = {
-            "saturn": "discipline, responsibility, and karmic lessons",
-            "jupiter": "expansion, opportunities, and growth",
-            "mars": "energy, action, and drive",
-            "sun": "identity, vitality, and purpose",
-            "moon": "emotions, intuition, and habits",
-            "mercury": "communication, thinking, and learning",
-            "venus": "relationships, values, and pleasure",
-            "rahu": "worldly desires and unconventional paths",
-            "ketu": "spirituality and letting go",
-        }
+        tp = _title(transit_planet)
+        np = _title(natal_planet)
 
-        theme = planet_themes.get(transit_planet, "cosmic energy")
+        action = cls.ASPECT_MEANINGS.get(aspect_type, "aspecting")
+        theme = cls.PLANET_THEMES.get(transit_planet, "cosmic energy")
 
         if significance == "major":
             prefix = "Significant transit: "
@@ -994,3 +1223,25 @@ class TransitAnalyzer:
             prefix = "Transit: "
 
         return f"{prefix}{tp} {action} your natal {np}, bringing themes of {theme}"
+
+
+# Description text depends only on planet names and aspect kind - a few hundred
+# combinations - so each string is formatted once and reused across charts.
+
+@lru_cache(maxsize=2048)
+def _aspect_description(planet1: str, planet2: str, aspect_type: str, is_benefic: bool) -> str:
+    """Memoized VedicAspects._get_aspect_description."""
+    return VedicAspects._get_aspect_description(planet1, planet2, aspect_type, is_benefic)
+
+
+@lru_cache(maxsize=2048)
+def _transit_interpretation(
+    transit_planet: str,
+    natal_planet: str,
+    aspect_type: str,
+    significance: str,
+) -> str:
+    """Memoized TransitAnalyzer._get_transit_interpretation."""
+    return TransitAnalyzer._get_transit_interpretation(
+        transit_planet, natal_planet, aspect_type, significance
+    )
@@ -1,6 +1,7 @@
 """Base model with common fields."""
 
 from datetime import datetime
+from functools import cache
 from uuid import uuid4
 
 from sqlalchemy import DateTime, String, func, JSON
@@ -41,9 +42,12 @@ class UUIDMixin:
 
 # Database-agnostic JSON type
 # Use JSONB for PostgreSQL, JSON for SQLite
+@cache
 def get_json_type():
     """Get appropriate JSON column type based on database."""
-    if "postgresql" in settings.DATABASE_URL:
+    # Matches postgres://, postgresql:// and postgresql+driver:// schemes;
+    # the dialect is only imported when it is actually in use.
+    if settings.DATABASE_URL.startswith("postgres"):
         from sqlalchemy.dialects.postgresql import JSONB
         return JSONB
     return JSON
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import Enum, ForeignKey, Integer, String, JSON
+from sqlalchemy import Enum, ForeignKey, Index, Integer, LargeBinary, String, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin, JSONType
@@ -18,6 +18,13 @@ class ChartSnapshot(Base, UUIDMixin, TimestampMixin):
     """
 
     __tablename__ = "chart_snapshots"
+    __table_args__ = (
+        # Cache lookup: same profile + mode + inputs in a single index probe
+        Index(
+            "ix_chart_snapshots_input_lookup",
+            "user_id", "person_profile_id", "mode", "input_hash",
+        ),
+    )
 
     user_id: Mapped[str] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), index=True
@@ -71,7 +78,8 @@ class ChartSnapshot(Base, UUIDMixin, TimestampMixin):
     # }
 
     # Metadata
-    input_hash: Mapped[str] = mapped_column(String(64))  # Hash of inputs for caching
+    # Raw SHA-256 digest of the inputs for caching (hashlib.sha256(...).digest())
+    input_hash: Mapped[bytes] = mapped_column(LargeBinary(32))
     notes: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
     # Relationships
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, String
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, UUIDMixin
@@ -27,6 +27,14 @@ class OTP(Base, UUIDMixin):
     """OTP verification model."""
 
     __tablename__ = "otps"
+    __table_args__ = (
+        # Verification lookup: only unused OTPs, newest first per target/purpose
+        Index(
+            "ix_otps_live",
+            "target", "purpose", "created_at",
+            postgresql_where=text("is_used = false"),
+        ),
+    )
 
     # Target (email or phone number)
     target: Mapped[str] = mapped_column(String(255), index=True)
@@ -8,6 +8,7 @@ from sqlalchemy import Boolean, Date, Enum, ForeignKey, String, Time, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.user import ResponseStyle
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -61,6 +62,19 @@ class PersonProfile(Base, UUIDMixin, TimestampMixin):
     longitude: Mapped[Optional[float]] = mapped_column(nullable=True)
     timezone: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
+    # Guidance preference - stored by enum value to match the responsestyle type
+    response_style: Mapped[ResponseStyle] = mapped_column(
+        Enum(
+            ResponseStyle,
+            name='responsestyle',
+            create_type=False,
+            values_callable=lambda e: [m.value for m in e],
+        ),
+        nullable=False,
+        default=ResponseStyle.BALANCED,
+        server_default=ResponseStyle.BALANCED.value,
+    )
+
     # Optional notes about this person
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
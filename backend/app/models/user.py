@@ -62,6 +62,18 @@ class User(Base, UUIDMixin, TimestampMixin):
     person_profiles: Mapped[list["PersonProfile"]] = relationship(
         "PersonProfile", back_populates="user"
     )
+    # The active primary PersonProfile (unique per user via ix_person_profiles_primary).
+    # Read-only and never lazy loaded - request it with joinedload().
+    primary_profile: Mapped[Optional["PersonProfile"]] = relationship(
+        "PersonProfile",
+        primaryjoin=(
+            "and_(User.id == PersonProfile.user_id, "
+            "PersonProfile.is_primary == True, PersonProfile.is_active == True)"
+        ),
+        uselist=False,
+        viewonly=True,
+        lazy="raise",
+    )
 
 
 class Profile(Base, UUIDMixin, TimestampMixin):
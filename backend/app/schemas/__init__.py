@@ -6,6 +6,7 @@ from app.schemas.user import (
     ProfileCreate,
     ProfileUpdate,
     ProfileResponse,
+    ProfilePublic,
 )
 from app.schemas.auth import Token, TokenPayload, LoginRequest
 from app.schemas.chart import ChartSnapshotResponse, NumerologyData, AstrologyData
@@ -26,6 +27,7 @@ __all__ = [
     "ProfileCreate",
     "ProfileUpdate",
     "ProfileResponse",
+    "ProfilePublic",
     "Token",
     "TokenPayload",
     "LoginRequest",
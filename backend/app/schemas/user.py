@@ -3,7 +3,7 @@
 from datetime import date, time
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from app.models.user import GuidanceMode, Language, ResponseStyle
 
@@ -75,6 +75,14 @@ class ProfileUpdate(BaseModel):
     language: Optional[Language] = None
     response_style: Optional[ResponseStyle] = None
 
+    @field_validator("full_name", "response_style")
+    @classmethod
+    def reject_null(cls, value):
+        """These map to NOT NULL columns - they may be omitted, not cleared."""
+        if value is None:
+            raise ValueError("cannot be null")
+        return value
+
 
 class ProfileResponse(BaseModel):
     """Schema for profile response."""
@@ -108,3 +116,32 @@ class ProfileResponse(BaseModel):
             response_style=getattr(profile, 'response_style', ResponseStyle.BALANCED),
             has_birth_time=profile.time_of_birth is not None,
         )
+
+
+class ProfilePublic(BaseModel):
+    """Primary profile in the format expected by the frontend (GET/PATCH /users/profile)."""
+
+    id: str
+    user_id: str  # For localStorage key consistency
+    full_name: str
+    display_name: str
+    date_of_birth: Optional[date] = None
+    time_of_birth: Optional[time] = None
+    place_of_birth: Optional[str] = None
+    guidance_mode: str = "both"  # Default
+    language: str = "hinglish"  # Default
+    has_birth_time: bool = False
+
+    @classmethod
+    def from_profile(cls, profile, user_id: str) -> "ProfilePublic":
+        """Create from a PersonProfile."""
+        return cls(
+            id=profile.id,
+            user_id=user_id,
+            full_name=profile.name,
+            display_name=profile.nickname or profile.name,
+            date_of_birth=profile.date_of_birth,
+            time_of_birth=profile.time_of_birth,
+            place_of_birth=profile.place_of_birth,
+            has_birth_time=profile.time_of_birth is not None,
+        )
@@ -4,8 +4,9 @@ Credits and Usage Service - Manages subscription limits and usage tracking.
 All credit logic is server-side for security.
 """
 
+import time
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -22,6 +23,18 @@ from app.schemas.subscription import UsageStatus
 from app.core.tier_config import get_tier_config, TierConfig
 
 
+# Short-lived per-user cache of check_can_ask results. Absorbs frontend polling
+# of the usage endpoints; entries are dropped whenever usage changes.
+USAGE_CACHE_TTL_SECONDS = 2.0
+USAGE_CACHE_MAX_ENTRIES = 50_000
+_usage_cache: Dict[str, Tuple[float, UsageStatus]] = {}
+
+
+def invalidate_usage_cache(user_id: str) -> None:
+    """Forget the cached usage status for a user."""
+    _usage_cache.pop(user_id, None)
+
+
 class CreditsService:
     """
     Manages credits, usage limits, and subscription enforcement.
@@ -35,12 +48,34 @@ class CreditsService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def check_can_ask(self, user_id: str) -> UsageStatus:
+    async def check_can_ask(self, user_id: str, use_cache: bool = True) -> UsageStatus:
         """
         Check if user can ask a question based on their tier and usage.
 
+        Results are reused for USAGE_CACHE_TTL_SECONDS. Pass use_cache=False
+        where the answer gates a charge (e.g. /ask) to always read fresh.
+
         Returns UsageStatus with current limits and whether question is allowed.
         """
+        now = time.monotonic()
+        if use_cache:
+            cached = _usage_cache.get(user_id)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
+        usage_status = await self._check_can_ask(user_id)
+
+        if len(_usage_cache) >= USAGE_CACHE_MAX_ENTRIES:
+            for key in [k for k, (expires_at, _) in _usage_cache.items() if expires_at <= now]:
+                del _usage_cache[key]
+            if len(_usage_cache) >= USAGE_CACHE_MAX_ENTRIES:
+                _usage_cache.clear()
+        _usage_cache[user_id] = (now + USAGE_CACHE_TTL_SECONDS, usage_status)
+
+        return usage_status
+
+    async def _check_can_ask(self, user_id: str) -> UsageStatus:
+        """Compute usage status from the database."""
         subscription = await self._get_active_subscription(user_id)
         tier = self._get_tier_enum(subscription.tier if subscription else "free")
 
@@ -98,11 +133,19 @@ class CreditsService:
         tier = self._get_tier_enum(subscription.tier if subscription else "free")
         return get_tier_config(tier)
 
-    async def deduct_usage(self, user_id: str, message_id: str) -> bool:
+    async def deduct_usage(
+        self,
+        user_id: str,
+        message_id: str,
+        commit: bool = True,
+    ) -> bool:
         """
         Deduct one question from user's usage.
 
         Should be called AFTER successful response generation.
+        Pass commit=False to leave the changes pending so the caller can
+        commit them together with related writes in one transaction; the
+        caller must then call invalidate_usage_cache() after its commit.
         Returns True if deduction was successful.
         """
         usage = await self._get_or_create_usage(user_id)
@@ -129,7 +172,11 @@ class CreditsService:
         )
         self.db.add(ledger_entry)
 
-        await self.db.commit()
+        # Drop the cached status only once the new counts are committed, or a
+        # concurrent poll could re-cache the old ones
+        if commit:
+            await self.db.commit()
+            invalidate_usage_cache(user_id)
         return True
 
     async def _get_active_subscription(self, user_id: str) -> Optional[Subscription]:
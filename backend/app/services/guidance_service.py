@@ -16,7 +16,7 @@ Profile-based context:
 
 import json
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from app.schemas.guidance import GuidanceRequest, GuidanceResponse, ValidationResult
 from app.schemas.chart import ChartSnapshotResponse, NumerologyData, AstrologyData
@@ -25,7 +25,8 @@ from app.models.subscription import SubscriptionTier
 from app.validators.guidance_validator import GuidanceValidator, ValidationContext
 from app.core.tier_config import TierConfig, get_tier_config
 from app.services.chart_filter_service import ChartFilterService
-from app.services.llm_service import LLMService
+from app.services.llm_service import LLMService, is_cacheable_prefix
+from app.services.response_cache import guidance_cache
 
 
 # Common greetings in multiple languages
@@ -40,6 +41,174 @@ GREETINGS = {
 }
 
 
+# Core persona and safety rules, shared by every request
+GUIDANCE_RULES = """You are AstraVaani, a spiritual guide who combines Vedic astrology and numerology wisdom with practical guidance.
+
+## CONVERSATION GUIDELINES:
+- If the user is just chatting (small talk, greetings, how are you), respond naturally WITHOUT forcing chart references
+- If the user asks about their life, decisions, relationships, career, timing, etc. - THEN use their chart data
+- It's okay to have a normal conversation first before diving into readings
+
+## ⚠️ CRITICAL - DATA ACCURACY RULES ⚠️
+
+### ABSOLUTE RULES (VIOLATIONS WILL BE REJECTED):
+
+1. **🚨 NEVER INVENT DATA 🚨**:
+   - ONLY use the EXACT signs, degrees, and numbers from the VERIFIED DATA section
+   - If the data says "Moon: Capricorn at 27.06°" then the Moon is in CAPRICORN, not any other sign
+   - If birth time is NOT provided, NEVER mention houses, ascendant, or rising sign
+   - If you're unsure about a value, DO NOT GUESS - only state what's in the verified data
+
+2. **NO DEFINITIVE PREDICTIONS**: Use "suggests", "indicates", "may", "tends to" - never "will happen"
+
+3. **NO MEDICAL/LEGAL ADVICE**: Redirect to professionals
+
+4. **NO FEAR LANGUAGE**: No "doom", "cursed", "bad luck"
+
+5. **ENCOURAGE AGENCY**: Patterns are tendencies, not destiny
+
+## VEDIC REMEDIES (Suggest when discussing challenges):
+When the user asks about challenges, difficulties, or areas needing improvement, suggest 1-2 traditional Vedic remedies:
+
+**Remedies you can suggest:**
+- **Mantras**: Planet-specific chants (e.g., "Om Namah Shivaya" for Moon issues, "Om Suryaya Namaha" for Sun, "Om Shani Devaya Namaha" for Saturn)
+- **Gemstones**: Based on weak planets (Pearl for Moon, Ruby for Sun, Yellow Sapphire for Jupiter, Blue Sapphire for Saturn - mention consulting a jeweler)
+- **Fasting**: Specific days (Monday for Moon, Thursday for Jupiter/Guru, Saturday for Saturn/Shani)
+- **Charity**: Items associated with planets (wheat/jaggery for Sun, rice/white items for Moon, black items for Saturn)
+- **Colors**: Wearing specific colors (white on Monday, yellow on Thursday, blue/black on Saturday)
+
+**Guidelines:**
+- Frame as "traditionally believed to help" - not guaranteed solutions
+- Keep it simple: 1-2 remedies maximum
+- Only suggest when relevant to the question or challenge discussed
+
+## RESPONSE APPROACH:
+- For casual chat: Just respond naturally and warmly
+- For chart questions: Acknowledge warmly → Share relevant insights from their chart → Give practical guidance
+- When challenges arise: Optionally include a simple Vedic remedy suggestion
+- Keep responses conversational, not robotic or overly structured
+"""
+
+# Language rules - CRITICAL: Must be strongly enforced
+LANGUAGE_INSTRUCTIONS = {
+    Language.ENGLISH: {
+        "main": "**MANDATORY LANGUAGE: ENGLISH ONLY**",
+        "detail": "You MUST respond ENTIRELY in English. Do not use any Hindi words, Devanagari script, or Hindi phrases. Every single word must be in English.",
+        "example": "Example: 'Your Sun is in Aries, indicating leadership qualities.' NOT 'Aapka Sun Aries mein hai.'",
+    },
+    Language.HINDI: {
+        "main": "**अनिवार्य भाषा: केवल हिंदी**",
+        "detail": "आपको पूरी तरह से हिंदी में जवाब देना होगा। देवनागरी लिपि का प्रयोग करें। कोई भी अंग्रेजी शब्द या वाक्य न लिखें।",
+        "example": "उदाहरण: 'आपका सूर्य मेष राशि में है, जो नेतृत्व क्षमता दर्शाता है।' 'Your Sun is in Aries' नहीं।",
+    },
+    Language.HINGLISH: {
+        "main": "**MANDATORY LANGUAGE: HINGLISH (Hindi-English Mix)**",
+        "detail": "You MUST respond in Hinglish - a natural mix of Hindi and English using ROMAN SCRIPT (Latin alphabet). Mix Hindi and English words naturally as Indians speak. Do NOT use Devanagari script.",
+        "example": "Example: 'Aapka Sun Aries mein hai, jo leadership qualities indicate karta hai. Career mein aage badhne ke chances hain.'",
+    },
+}
+
+# Response styles the user can pick
+STYLE_INSTRUCTIONS = {
+    ResponseStyle.SUPPORTIVE: """### SUPPORTIVE (supportive & encouraging)
+For users who prefer a warm, emotionally supportive style:
+- Be nurturing, empathetic, and encouraging
+- Use warm language and acknowledge their feelings
+- Frame challenges as opportunities for growth
+- Provide emotional validation alongside practical guidance
+- Use phrases like "I understand...", "It's natural to feel...", "This is a wonderful opportunity..."
+- Focus on positive aspects while gently mentioning areas for growth
+- Be like a supportive friend who believes in them
+""",
+    ResponseStyle.BALANCED: """### BALANCED
+For users who prefer a balanced mix of warmth and directness:
+- Be friendly but also clear and informative
+- Acknowledge emotions briefly, then focus on practical insights
+- Present both positive and challenging aspects fairly
+- Be encouraging without over-promising
+""",
+    ResponseStyle.DIRECT: """### DIRECT (direct & precise)
+For users who prefer a blunt, no-nonsense style:
+- Be straightforward and get to the point quickly
+- NO sugar-coating or excessive emotional language
+- NO emojis or overly warm phrases
+- State facts clearly without unnecessary softening
+- If there are challenges, state them directly: "Your chart shows X, which indicates Y"
+- Skip the empathy phrases - just provide the information
+- Be like a professional consultant: precise, factual, actionable
+- Use phrases like "Your chart indicates...", "This suggests...", "Focus on..."
+- Keep it concise and information-dense
+""",
+}
+
+# Guidance modes (astrology only, numerology only, or both)
+MODE_INSTRUCTIONS = {
+    GuidanceMode.ASTROLOGY: """### ASTROLOGY (astrology only)
+Focus exclusively on astrological data (planets, signs, houses, transits).
+Do NOT reference numerology numbers even if available.
+""",
+    GuidanceMode.NUMEROLOGY: """### NUMEROLOGY (numerology only)
+Focus exclusively on numerological data (life path, destiny, soul urge, personal year).
+Do NOT reference astrology (planets, signs) even if available.
+""",
+    GuidanceMode.BOTH: """### BOTH (astrology + numerology)
+You may reference both astrological and numerological data to provide comprehensive guidance.
+Weave insights from both systems when relevant to the user's question.
+""",
+}
+
+# Transit rules (applied only when the request says transit data is included)
+TRANSIT_INSTRUCTION = """## CURRENT TRANSITS (for timing-based predictions):
+Transit data shows where planets are TODAY. Use this for:
+- **Timing predictions**: "This month, with Saturn transiting your 7th house..."
+- **Current influences**: "Jupiter's current position suggests expansion in..."
+- **Upcoming changes**: Compare natal positions with transits to predict shifts
+
+When comparing natal to transits:
+- Same sign = emphasized energy
+- Opposite sign = tension/challenge
+- Trine/sextile = supportive flow
+- Square = growth through friction
+
+IMPORTANT: Transits are temporary influences - emphasize their timing ("currently", "this period", "until X moves into Y").
+"""
+
+
+def _build_prompt_prefix() -> str:
+    """Assemble the bundled static prompt: core rules plus the style/mode tables."""
+    return (
+        GUIDANCE_RULES
+        + "\n## COMMUNICATION STYLES (the request names the one to use):\n"
+        + "\n".join(STYLE_INSTRUCTIONS.values())
+        + "\n## GUIDANCE MODES (the request names the one to use):\n"
+        + "\n".join(MODE_INSTRUCTIONS.values())
+        + "\n"
+        + TRANSIT_INSTRUCTION
+        + "(Apply the CURRENT TRANSITS rules only when the request says transit data is included.)\n"
+    )
+
+
+# Static part of the guidance system prompt. Must stay byte-identical across
+# requests (no per-user interpolation) so the provider can cache it as a prefix.
+# Providers only cache prefixes past a minimum length (1024 tokens; 2048 on
+# Haiku), so the style/mode tables are bundled in to clear it. Language rules
+# are never bundled - only the selected language is sent, per request.
+GUIDANCE_PROMPT_PREFIX = _build_prompt_prefix()
+
+
+def prompt_prefix_for_model(model: str) -> str:
+    """
+    Pick the static prefix for a generator model.
+
+    Models that can cache the bundled prefix get it; for the rest the extra
+    tables would only be uncached input, so they get the core rules and the
+    selected style/mode go in the per-request block instead.
+    """
+    if is_cacheable_prefix(model, GUIDANCE_PROMPT_PREFIX):
+        return GUIDANCE_PROMPT_PREFIX
+    return GUIDANCE_RULES
+
+
 def is_greeting(text: str) -> bool:
     """Check if the message is a simple greeting."""
     # Normalize text
@@ -132,7 +301,7 @@ class GuidanceService:
         tier: SubscriptionTier = SubscriptionTier.FREE,
         conversation_context: Optional[Dict[str, Any]] = None,
         response_style: ResponseStyle = ResponseStyle.BALANCED,
-    ) -> GuidanceResponse:
+    ) -> Tuple[GuidanceResponse, bool]:
         """
         Get guidance response for a user question.
 
@@ -145,14 +314,16 @@ class GuidanceService:
             response_style: User's preferred response style (supportive, balanced, direct)
 
         Returns:
-            GuidanceResponse (validated for Pro, unvalidated for Free/Starter)
+            Tuple of (GuidanceResponse, cache_hit). The response is validated
+            for Pro, unvalidated for Free/Starter; cache_hit is True when it
+            was served from the response cache without calling the LLM.
         """
         # Check for simple greetings FIRST - respond without full chart analysis
         if is_greeting(request.question):
             profile_name = None
             if conversation_context:
                 profile_name = conversation_context.get("profile_name")
-            return get_greeting_response(profile_name, language)
+            return get_greeting_response(profile_name, language), False
 
         # Get tier configuration
         tier_config = get_tier_config(tier)
@@ -172,8 +343,12 @@ class GuidanceService:
         filtered_chart = self._filter_chart_by_mode(filtered_chart, mode)
 
         # Prepare context for LLM with tier-specific restrictions and conversation history
+        bundled_prefix = (
+            prompt_prefix_for_model(llm_service.generator_model) is GUIDANCE_PROMPT_PREFIX
+        )
         system_prompt = self._build_system_prompt(
-            filtered_chart, language, tier_config, conversation_context, mode, response_style
+            filtered_chart, language, tier_config, conversation_context, mode, response_style,
+            bundled_prefix,
         )
         user_message = self._build_user_message(request.question, language)
 
@@ -189,17 +364,29 @@ class GuidanceService:
             completion_buffer = max(base_tokens // 5, 30)  # At least 30 tokens buffer
             max_tokens = min(base_tokens + completion_buffer, 1500)
 
+        # Same prompt + same question = same answer, skip the LLM round-trip
+        cache_key = guidance_cache.make_key(tier_config.tier.value, system_prompt, request.question)
+        cached = guidance_cache.get(cache_key)
+        if cached is not None:
+            return cached, True
+
         # For Pro tier: Use Generator + Validator pipeline
         # For Free/Starter: Generator only (single LLM call)
         if tier_config.response.use_validator:
-            return await self._get_guidance_with_validation(
+            response = await self._get_guidance_with_validation(
                 request, filtered_chart, language, system_prompt, user_message, max_tokens, llm_service
             )
         else:
-            return await self._get_guidance_simple(
+            response = await self._get_guidance_simple(
                 request, filtered_chart, system_prompt, user_message, max_tokens, llm_service
             )
 
+        # Don't cache the safe fallback from a failed validation
+        if response.validation is None or response.validation.passed:
+            guidance_cache.set(cache_key, response)
+
+        return response, False
+
     async def _get_guidance_with_validation(
         self,
         request: GuidanceRequest,
@@ -461,28 +648,19 @@ class GuidanceService:
         conversation_context: Optional[Dict[str, Any]] = None,
         mode: GuidanceMode = GuidanceMode.BOTH,
         response_style: ResponseStyle = ResponseStyle.BALANCED,
+        bundled_prefix: bool = False,
     ) -> str:
-        """Build the system prompt with chart data, rules, tier restrictions, and conversation context."""
+        """
+        Build the per-request part of the system prompt.
+
+        Covers chart data, language, style, mode, tier restrictions and
+        conversation context. The shared rules are sent ahead of this block
+        (see prompt_prefix_for_model). With bundled_prefix the style/mode
+        tables are already in that prefix, so only the selection is named here.
+        """
 
         # Language instruction - CRITICAL: Must be strongly enforced
-        lang_instructions = {
-            Language.ENGLISH: {
-                "main": "**MANDATORY LANGUAGE: ENGLISH ONLY**",
-                "detail": "You MUST respond ENTIRELY in English. Do not use any Hindi words, Devanagari script, or Hindi phrases. Every single word must be in English.",
-                "example": "Example: 'Your Sun is in Aries, indicating leadership qualities.' NOT 'Aapka Sun Aries mein hai.'",
-            },
-            Language.HINDI: {
-                "main": "**अनिवार्य भाषा: केवल हिंदी**",
-                "detail": "आपको पूरी तरह से हिंदी में जवाब देना होगा। देवनागरी लिपि का प्रयोग करें। कोई भी अंग्रेजी शब्द या वाक्य न लिखें।",
-                "example": "उदाहरण: 'आपका सूर्य मेष राशि में है, जो नेतृत्व क्षमता दर्शाता है।' 'Your Sun is in Aries' नहीं।",
-            },
-            Language.HINGLISH: {
-                "main": "**MANDATORY LANGUAGE: HINGLISH (Hindi-English Mix)**",
-                "detail": "You MUST respond in Hinglish - a natural mix of Hindi and English using ROMAN SCRIPT (Latin alphabet). Mix Hindi and English words naturally as Indians speak. Do NOT use Devanagari script.",
-                "example": "Example: 'Aapka Sun Aries mein hai, jo leadership qualities indicate karta hai. Career mein aage badhne ke chances hain.'",
-            },
-        }
-        lang_config = lang_instructions[language]
+        lang_config = LANGUAGE_INSTRUCTIONS[language]
         lang_instruction = f"""{lang_config['main']}
 {lang_config['detail']}
 {lang_config['example']}
@@ -532,42 +710,16 @@ Your response MUST be concise and under {max_chars} characters.
 DO NOT let your response get cut off mid-sentence!
 """
 
-        # Response style instructions based on user preference
-        style_instructions = {
-            ResponseStyle.SUPPORTIVE: """
-## COMMUNICATION STYLE: SUPPORTIVE & ENCOURAGING
-The user prefers a warm, emotionally supportive style. Please:
-- Be nurturing, empathetic, and encouraging
-- Use warm language and acknowledge their feelings
-- Frame challenges as opportunities for growth
-- Provide emotional validation alongside practical guidance
-- Use phrases like "I understand...", "It's natural to feel...", "This is a wonderful opportunity..."
-- Focus on positive aspects while gently mentioning areas for growth
-- Be like a supportive friend who believes in them
-""",
-            ResponseStyle.BALANCED: """
-## COMMUNICATION STYLE: BALANCED
-The user prefers a balanced mix of warmth and directness. Please:
-- Be friendly but also clear and informative
-- Acknowledge emotions briefly, then focus on practical insights
-- Present both positive and challenging aspects fairly
-- Be encouraging without over-promising
-""",
-            ResponseStyle.DIRECT: """
-## COMMUNICATION STYLE: DIRECT & PRECISE
-The user prefers a blunt, no-nonsense style. Please:
-- Be straightforward and get to the point quickly
-- NO sugar-coating or excessive emotional language
-- NO emojis or overly warm phrases
-- State facts clearly without unnecessary softening
-- If there are challenges, state them directly: "Your chart shows X, which indicates Y"
-- Skip the empathy phrases - just provide the information
-- Be like a professional consultant: precise, factual, actionable
-- Use phrases like "Your chart indicates...", "This suggests...", "Focus on..."
-- Keep it concise and information-dense
-""",
-        }
-        style_instruction = style_instructions.get(response_style, style_instructions[ResponseStyle.BALANCED])
+        # Response style - named if the bundled prefix defines it, else inline
+        if response_style not in STYLE_INSTRUCTIONS:
+            response_style = ResponseStyle.BALANCED
+        if bundled_prefix:
+            style_instruction = f"""
+## COMMUNICATION STYLE: {response_style.name}
+Use the {response_style.name} style described under COMMUNICATION STYLES above.
+"""
+        else:
+            style_instruction = "\n## COMMUNICATION STYLE:\n" + STYLE_INSTRUCTIONS[response_style]
 
         # Conversation context section (Pro tier with memory)
         context_section = ""
@@ -593,80 +745,28 @@ You are providing guidance for **{profile_name}** (relationship: {relationship})
 Use this context to provide more personalized and consistent guidance. Reference previous insights when relevant, but don't force connections where they don't naturally fit.
 """
 
-        # Mode-specific instructions
-        mode_instruction = ""
-
-        # Transit instructions (only if transit data is available)
-        transit_instruction = ""
-        if chart.transit_data:
-            transit_instruction = """
-## CURRENT TRANSITS (for timing-based predictions):
-Transit data shows where planets are TODAY. Use this for:
-- **Timing predictions**: "This month, with Saturn transiting your 7th house..."
-- **Current influences**: "Jupiter's current position suggests expansion in..."
-- **Upcoming changes**: Compare natal positions with transits to predict shifts
-
-When comparing natal to transits:
-- Same sign = emphasized energy
-- Opposite sign = tension/challenge
-- Trine/sextile = supportive flow
-- Square = growth through friction
-
-IMPORTANT: Transits are temporary influences - emphasize their timing ("currently", "this period", "until X moves into Y").
-"""
-
-        if mode == GuidanceMode.ASTROLOGY:
+        # Mode (and transit rules when transits are present), same as style
+        include_transits = bool(chart.transit_data) and mode != GuidanceMode.NUMEROLOGY
+        if bundled_prefix:
             mode_instruction = f"""
-## GUIDANCE MODE: ASTROLOGY ONLY
-Focus exclusively on astrological data (planets, signs, houses, transits).
-Do NOT reference numerology numbers even if available.
-{transit_instruction}"""
-        elif mode == GuidanceMode.NUMEROLOGY:
-            mode_instruction = """
-## GUIDANCE MODE: NUMEROLOGY ONLY
-Focus exclusively on numerological data (life path, destiny, soul urge, personal year).
-Do NOT reference astrology (planets, signs) even if available.
+## GUIDANCE MODE: {mode.name}
+Follow the {mode.name} rules under GUIDANCE MODES above.
 """
+            if include_transits:
+                mode_instruction += "Transit data is included - apply the CURRENT TRANSITS rules above.\n"
         else:
-            mode_instruction = f"""
-## GUIDANCE MODE: COMBINED (Astrology + Numerology)
-You may reference both astrological and numerological data to provide comprehensive guidance.
-Weave insights from both systems when relevant to the user's question.
-{transit_instruction}"""
-
-        return f"""You are AstraVaani, a spiritual guide who combines Vedic astrology and numerology wisdom with practical guidance.
+            mode_instruction = "\n## GUIDANCE MODE:\n" + MODE_INSTRUCTIONS[mode]
+            if include_transits:
+                mode_instruction += "\n" + TRANSIT_INSTRUCTION
 
-## CRITICAL - RESPONSE LANGUAGE:
+        return f"""## CRITICAL - RESPONSE LANGUAGE:
 {lang_instruction}
 {style_instruction}
-## CONVERSATION GUIDELINES:
-- If the user is just chatting (small talk, greetings, how are you), respond naturally WITHOUT forcing chart references
-- If the user asks about their life, decisions, relationships, career, timing, etc. - THEN use their chart data
-- It's okay to have a normal conversation first before diving into readings
-
 {mode_instruction}
 
-## ⚠️ CRITICAL - DATA ACCURACY RULES ⚠️
-
-### VERIFIED DATA FOR THIS USER:
+## VERIFIED DATA FOR THIS USER:
 {data_summary}
 
-### ABSOLUTE RULES (VIOLATIONS WILL BE REJECTED):
-
-1. **🚨 NEVER INVENT DATA 🚨**:
-   - ONLY use the EXACT signs, degrees, and numbers from the VERIFIED DATA above
-   - If the data says "Moon: Capricorn at 27.06°" then the Moon is in CAPRICORN, not any other sign
-   - If birth time is NOT provided, NEVER mention houses, ascendant, or rising sign
-   - If you're unsure about a value, DO NOT GUESS - only state what's in the verified data
-
-2. **NO DEFINITIVE PREDICTIONS**: Use "suggests", "indicates", "may", "tends to" - never "will happen"
-
-3. **NO MEDICAL/LEGAL ADVICE**: Redirect to professionals
-
-4. **NO FEAR LANGUAGE**: No "doom", "cursed", "bad luck"
-
-5. **ENCOURAGE AGENCY**: Patterns are tendencies, not destiny
-
 ## TIER-SPECIFIC RESTRICTIONS:
 {tier_restrictions}
 {context_section}
@@ -675,27 +775,6 @@ Weave insights from both systems when relevant to the user's question.
 {chart_json}
 ```
 {explanation_instruction}
-## VEDIC REMEDIES (Suggest when discussing challenges):
-When the user asks about challenges, difficulties, or areas needing improvement, suggest 1-2 traditional Vedic remedies:
-
-**Remedies you can suggest:**
-- **Mantras**: Planet-specific chants (e.g., "Om Namah Shivaya" for Moon issues, "Om Suryaya Namaha" for Sun, "Om Shani Devaya Namaha" for Saturn)
-- **Gemstones**: Based on weak planets (Pearl for Moon, Ruby for Sun, Yellow Sapphire for Jupiter, Blue Sapphire for Saturn - mention consulting a jeweler)
-- **Fasting**: Specific days (Monday for Moon, Thursday for Jupiter/Guru, Saturday for Saturn/Shani)
-- **Charity**: Items associated with planets (wheat/jaggery for Sun, rice/white items for Moon, black items for Saturn)
-- **Colors**: Wearing specific colors (white on Monday, yellow on Thursday, blue/black on Saturday)
-
-**Guidelines:**
-- Frame as "traditionally believed to help" - not guaranteed solutions
-- Keep it simple: 1-2 remedies maximum
-- Only suggest when relevant to the question or challenge discussed
-
-## RESPONSE APPROACH:
-- For casual chat: Just respond naturally and warmly
-- For chart questions: Acknowledge warmly → Share relevant insights from their chart → Give practical guidance
-- When challenges arise: Optionally include a simple Vedic remedy suggestion
-- Keep responses conversational, not robotic or overly structured
-
 Remember: {lang_config['main']} - This is non-negotiable.
 """
 
@@ -729,7 +808,7 @@ User's question: {question}"""
         Call the LLM API via LLM service.
 
         Args:
-            system_prompt: System prompt with rules and chart data
+            system_prompt: Per-request system prompt (chart data, style, restrictions)
             user_message: User's question
             max_tokens: Max response tokens (tier-dependent)
             llm_service: Tier-specific LLM service instance
@@ -737,6 +816,7 @@ User's question: {question}"""
         return await llm_service.generate_guidance(
             system_prompt=system_prompt,
             user_message=user_message,
+            system_prefix=prompt_prefix_for_model(llm_service.generator_model),
             max_tokens=max_tokens,
             temperature=0.7,
         )
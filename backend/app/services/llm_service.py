@@ -10,10 +10,12 @@ Supports tier-based model selection:
 Updated: 2026-01-26 - Using -latest model aliases
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from abc import ABC, abstractmethod
 
 from app.core.config import settings
+from app.core.tier_config import TIER_CONFIGS
+from app.models.subscription import SubscriptionTier
 
 
 # Model name resolution: short name -> full model ID
@@ -28,11 +30,39 @@ MODEL_NAME_MAP = {
 }
 
 
+# Smallest system prefix (in tokens) each Anthropic model will cache; 1024 otherwise
+PROMPT_CACHE_MIN_TOKENS = {
+    "claude-3-haiku-20240307": 2048,
+}
+
+
+def is_cacheable_prefix(model: str, prefix: str) -> bool:
+    """Whether a prefix is long enough for the model to cache (~4 chars/token)."""
+    return len(prefix) // 4 >= PROMPT_CACHE_MIN_TOKENS.get(model, 1024)
+
+
 def resolve_model_name(short_name: str) -> str:
     """Resolve short model name to full model ID."""
     return MODEL_NAME_MAP.get(short_name, short_name)
 
 
+# Tier -> (generator model ID, validator model ID or None), resolved once at import
+TIER_MODELS: Dict[SubscriptionTier, Tuple[str, Optional[str]]] = {
+    tier: (
+        resolve_model_name(config.response.generator_model),
+        resolve_model_name(config.response.validator_model)
+        if config.response.use_validator and config.response.validator_model
+        else None,
+    )
+    for tier, config in TIER_CONFIGS.items()
+}
+
+
+def resolve_models(tier: SubscriptionTier) -> Tuple[str, Optional[str]]:
+    """Get the (generator, validator) model IDs for a tier."""
+    return TIER_MODELS.get(tier) or TIER_MODELS[SubscriptionTier.FREE]
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
@@ -43,8 +73,14 @@ class LLMClient(ABC):
         user_message: str,
         max_tokens: int = 1024,
         temperature: float = 0.7,
+        system_prefix: Optional[str] = None,
     ) -> str:
-        """Generate a response from the LLM."""
+        """
+        Generate a response from the LLM.
+
+        system_prefix is an optional static block sent ahead of system_prompt.
+        It must be identical across calls so providers can cache it.
+        """
         pass
 
 
@@ -70,13 +106,23 @@ class AnthropicClient(LLMClient):
         user_message: str,
         max_tokens: int = 1024,
         temperature: float = 0.7,
+        system_prefix: Optional[str] = None,
     ) -> str:
         """Generate a response using Claude."""
+        system: Any = system_prompt
+        if system_prefix:
+            # Static prefix first, per-request block after it. Only mark it for
+            # caching when it clears the model's minimum cacheable length.
+            prefix_block: Dict[str, Any] = {"type": "text", "text": system_prefix}
+            if is_cacheable_prefix(self.model, system_prefix):
+                prefix_block["cache_control"] = {"type": "ephemeral"}
+            system = [prefix_block, {"type": "text", "text": system_prompt}]
+
         response = await self.client.messages.create(
             model=self.model,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_prompt,
+            system=system,
             messages=[{"role": "user", "content": user_message}],
         )
         return response.content[0].text
@@ -104,8 +150,13 @@ class OpenAIClient(LLMClient):
         user_message: str,
         max_tokens: int = 1024,
         temperature: float = 0.7,
+        system_prefix: Optional[str] = None,
     ) -> str:
         """Generate a response using GPT."""
+        if system_prefix:
+            # OpenAI caches matching prompt prefixes automatically
+            system_prompt = f"{system_prefix}\n{system_prompt}"
+
         response = await self.client.chat.completions.create(
             model=self.model,
             max_tokens=max_tokens,
@@ -127,6 +178,7 @@ class MockLLMClient(LLMClient):
         user_message: str,
         max_tokens: int = 1024,
         temperature: float = 0.7,
+        system_prefix: Optional[str] = None,
     ) -> str:
         """Return a mock response for development."""
         return """I understand you're seeking guidance on this matter.
@@ -242,8 +294,9 @@ class LLMService:
         Initialize LLM service with tier-specific models.
 
         Args:
-            generator_model: Short model name for generation (e.g., "haiku", "sonnet")
-            validator_model: Short model name for validation (e.g., "opus"), None if no validation
+            generator_model: Model ID for generation (e.g., "claude-3-haiku-20240307");
+                short names like "haiku" are resolved to their full ID
+            validator_model: Model ID for validation, None if no validation
             generator_client: Override generator client (for testing)
             validator_client: Override validator client (for testing)
         """
@@ -251,8 +304,8 @@ class LLMService:
         self.validator = validator_client or (
             get_client_for_model(validator_model) if validator_model else None
         )
-        self.generator_model = generator_model
-        self.validator_model = validator_model
+        self.generator_model = resolve_model_name(generator_model)
+        self.validator_model = resolve_model_name(validator_model) if validator_model else None
 
     @classmethod
     def for_tier(cls, tier_config) -> "LLMService":
@@ -260,14 +313,17 @@ class LLMService:
         Create an LLMService configured for a specific tier.
 
         Args:
-            tier_config: TierConfig object with response.generator_model and response.validator_model
+            tier_config: TierConfig for the user's tier (models come from TIER_MODELS)
 
         Returns:
             LLMService configured for the tier
         """
+        generator_model, validator_model = resolve_models(tier_config.tier)
         return cls(
-            generator_model=tier_config.response.generator_model,
-            validator_model=tier_config.response.validator_model if tier_config.response.use_validator else None,
+            generator_model=generator_model,
+            validator_model=validator_model,
+            generator_client=get_llm_client(model=generator_model),
+            validator_client=get_llm_client(model=validator_model) if validator_model else None,
         )
 
     async def generate_guidance(
@@ -277,6 +333,7 @@ class LLMService:
         max_tokens: int = 1024,
         temperature: float = 0.7,
         max_retries: int = 2,
+        system_prefix: Optional[str] = None,
     ) -> str:
         """
         Generate guidance response using Generator model (Haiku).
@@ -287,6 +344,7 @@ class LLMService:
             max_tokens: Maximum response tokens
             temperature: Response creativity (0.0-1.0)
             max_retries: Number of retry attempts on failure
+            system_prefix: Static prompt prefix, cached by the provider
 
         Returns:
             Generated response text
@@ -300,6 +358,7 @@ class LLMService:
                     user_message=user_message,
                     max_tokens=max_tokens,
                     temperature=temperature,
+                    system_prefix=system_prefix,
                 )
                 return response
             except Exception as e:
@@ -35,6 +35,12 @@ class OTPService:
         """Generate a cryptographically secure random 6-digit OTP."""
         return ''.join(secrets.choice(string.digits) for _ in range(self.OTP_LENGTH))
 
+    @staticmethod
+    def _normalize_target(target: str, otp_type: OTPType) -> str:
+        """Canonical form of the target so lookups hit the same index key."""
+        target = target.strip()
+        return target.lower() if otp_type == OTPType.EMAIL else target
+
     async def create_otp(
         self,
         target: str,
@@ -52,6 +58,8 @@ class OTPService:
         Returns:
             The generated OTP code
         """
+        target = self._normalize_target(target, otp_type)
+
         # Invalidate any existing OTPs for this target
         await self._invalidate_existing_otps(target, otp_type, purpose)
 
@@ -91,7 +99,9 @@ class OTPService:
         Returns:
             Tuple of (success, message)
         """
-        # Find the OTP
+        target = self._normalize_target(target, otp_type)
+
+        # Find the latest live OTP (served by the ix_otps_live partial index)
         result = await self.db.execute(
             select(OTP).where(
                 and_(
@@ -100,7 +110,7 @@ class OTPService:
                     OTP.purpose == purpose.value,
                     OTP.is_used == False,
                 )
-            ).order_by(OTP.created_at.desc())
+            ).order_by(OTP.created_at.desc()).limit(1)
         )
         otp = result.scalar_one_or_none()
 
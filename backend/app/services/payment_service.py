@@ -4,6 +4,7 @@ Payment Service - Razorpay integration for Indian payments.
 Handles subscription purchases and webhook processing.
 """
 
+import asyncio
 import hmac
 import hashlib
 import json
@@ -15,6 +16,7 @@ from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.tier_config import get_tier_config
+from app.services.credits_service import invalidate_usage_cache
 from app.models.subscription import (
     Subscription,
     SubscriptionTier,
@@ -88,7 +90,8 @@ class PaymentService:
             },
         }
 
-        order = self.client.order.create(data=order_data)
+        # Razorpay SDK is blocking HTTP - keep it off the event loop
+        order = await asyncio.to_thread(self.client.order.create, data=order_data)
 
         return {
             "order_id": order["id"],
@@ -100,6 +103,10 @@ class PaymentService:
             "price_display": f"₹{tier_config.price_paise // 100}/month",
         }
 
+    async def fetch_order(self, order_id: str) -> Dict[str, Any]:
+        """Fetch a Razorpay order without blocking the event loop."""
+        return await asyncio.to_thread(self.client.order.fetch, order_id)
+
     def verify_payment_signature(
         self,
         order_id: str,
@@ -199,6 +206,7 @@ class PaymentService:
         await self._reset_monthly_usage(user_id)
 
         await self.db.commit()
+        invalidate_usage_cache(user_id)
         await self.db.refresh(subscription)
 
         return subscription
@@ -277,6 +285,7 @@ class PaymentService:
             sub.current_period_end = sub.current_period_end + timedelta(days=30)
             await self._reset_monthly_usage(user_id)
             await self.db.commit()
+            invalidate_usage_cache(user_id)
 
         return True
 
@@ -305,7 +314,12 @@ class PaymentService:
         return True
 
     async def _reset_monthly_usage(self, user_id: str) -> None:
-        """Reset monthly usage count for user."""
+        """
+        Reset monthly usage count for user.
+
+        Leaves the change uncommitted; callers invalidate the usage cache
+        after their commit.
+        """
         result = await self.db.execute(
             select(UsageLimit)
             .where(UsageLimit.user_id == user_id)
@@ -359,6 +373,10 @@ class PaymentService:
             sub.status = SubscriptionStatus.EXPIRED.value
             sub.tier = SubscriptionTier.FREE.value
 
+        expired_user_ids = [sub.user_id for sub in expired]
         await self.db.commit()
 
+        for user_id in expired_user_ids:
+            invalidate_usage_cache(user_id)
+
         return len(expired)
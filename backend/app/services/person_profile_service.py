@@ -1,15 +1,17 @@
 """Person Profile Service - CRUD operations and context management."""
 
-from typing import Optional, List
+import time
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import bindparam, lambda_stmt, select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload
 
 from app.models.person_profile import PersonProfile, Relationship
 from app.models.conversation import Conversation, Message, MessageRole
 from app.models.subscription import SubscriptionTier
+from app.models.user import GuidanceMode, Language
 from app.schemas.person_profile import (
     PersonProfileCreate,
     PersonProfileUpdate,
@@ -17,9 +19,91 @@ from app.schemas.person_profile import (
     PersonProfileSummary,
     ProfileContextSummary,
 )
+from app.schemas.guidance import GuidanceResponse
+from app.schemas.user import ProfilePublic
 from app.core.tier_config import get_tier_config
 
 
+# Primary-profile lookup, built once and reused; execute with {"user_id": ...}
+PRIMARY_PROFILE_STMT = lambda_stmt(
+    lambda: select(PersonProfile).where(
+        PersonProfile.user_id == bindparam("user_id"),
+        PersonProfile.is_primary == True,
+        PersonProfile.is_active == True,
+    ).limit(1)
+)
+
+# Columns read by ProfilePublic.from_profile, plus updated_at for the ETag
+PROFILE_PUBLIC_COLUMNS = (
+    PersonProfile.id,
+    PersonProfile.updated_at,
+    PersonProfile.name,
+    PersonProfile.nickname,
+    PersonProfile.date_of_birth,
+    PersonProfile.time_of_birth,
+    PersonProfile.place_of_birth,
+)
+
+# Primary profile lookup for GET /users/profile cache misses, loading only
+# PROFILE_PUBLIC_COLUMNS (spelled out because lambda_stmt only caches literal
+# SQL constructs)
+PRIMARY_PROFILE_PUBLIC_STMT = lambda_stmt(
+    lambda: select(PersonProfile).options(
+        load_only(
+            PersonProfile.id,
+            PersonProfile.updated_at,
+            PersonProfile.name,
+            PersonProfile.nickname,
+            PersonProfile.date_of_birth,
+            PersonProfile.time_of_birth,
+            PersonProfile.place_of_birth,
+        )
+    ).where(
+        PersonProfile.user_id == bindparam("user_id"),
+        PersonProfile.is_primary == True,
+        PersonProfile.is_active == True,
+    ).limit(1)
+)
+
+# Per-user cache of the primary profile payload served by GET /users/profile.
+# Every profile write below invalidates the user's entry.
+PRIMARY_PROFILE_CACHE_TTL_SECONDS = 300.0
+PRIMARY_PROFILE_CACHE_MAX_ENTRIES = 50_000
+_primary_profile_cache: Dict[str, Tuple[float, ProfilePublic, str]] = {}
+
+
+def primary_profile_etag(profile) -> str:
+    """Weak ETag for a profile, derived from its id and updated_at."""
+    return f'W/"{profile.id}-{int(profile.updated_at.timestamp() * 1_000_000)}"'
+
+
+def get_cached_primary_profile(user_id: str) -> Optional[Tuple[ProfilePublic, str]]:
+    """Return the cached (payload, etag) for a user's primary profile, if still fresh."""
+    cached = _primary_profile_cache.get(user_id)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        _primary_profile_cache.pop(user_id, None)
+        return None
+    return cached[1], cached[2]
+
+
+def cache_primary_profile(user_id: str, payload: ProfilePublic, etag: str) -> None:
+    """Cache the primary profile payload and its ETag for a user."""
+    if len(_primary_profile_cache) >= PRIMARY_PROFILE_CACHE_MAX_ENTRIES:
+        _primary_profile_cache.clear()
+    _primary_profile_cache[user_id] = (
+        time.monotonic() + PRIMARY_PROFILE_CACHE_TTL_SECONDS,
+        payload,
+        etag,
+    )
+
+
+def invalidate_primary_profile_cache(user_id: str) -> None:
+    """Forget the cached primary profile payload for a user."""
+    _primary_profile_cache.pop(user_id, None)
+
+
 class PersonProfileService:
     """Service for managing person profiles and their context."""
 
@@ -122,6 +206,7 @@ class PersonProfileService:
 
         self.db.add(profile)
         await self.db.commit()
+        invalidate_primary_profile_cache(user_id)
         await self.db.refresh(profile)
         return profile
 
@@ -137,12 +222,7 @@ class PersonProfileService:
 
     async def get_primary_profile(self, user_id: str) -> Optional[PersonProfile]:
         """Get the user's primary profile."""
-        result = await self.db.execute(
-            select(PersonProfile)
-            .where(PersonProfile.user_id == user_id)
-            .where(PersonProfile.is_primary == True)
-            .where(PersonProfile.is_active == True)
-        )
+        result = await self.db.execute(PRIMARY_PROFILE_STMT, {"user_id": user_id})
         return result.scalar_one_or_none()
 
     async def list_profiles(self, user_id: str) -> List[PersonProfile]:
@@ -178,6 +258,7 @@ class PersonProfileService:
             setattr(profile, model_field, value)
 
         await self.db.commit()
+        invalidate_primary_profile_cache(user_id)
         await self.db.refresh(profile)
         return profile
 
@@ -197,11 +278,14 @@ class PersonProfileService:
             raise ValueError("Cannot delete your only profile")
 
         # If deleting primary, assign another as primary
+        # (clearing the flag first; it is autoflushed before the lookup)
         if profile.is_primary:
+            profile.is_primary = False
             await self._assign_new_primary(user_id, exclude_id=profile_id)
 
         profile.is_active = False
         await self.db.commit()
+        invalidate_primary_profile_cache(user_id)
         return True
 
     async def get_profile_with_stats(
@@ -331,6 +415,58 @@ class PersonProfileService:
 
         return history
 
+    def add_conversation_turn(
+        self,
+        user_id: str,
+        profile_id: str,
+        question: str,
+        response: GuidanceResponse,
+        mode: GuidanceMode,
+        language: Language,
+        message_id: str,
+    ) -> Conversation:
+        """
+        Stage a question/answer exchange in the profile's conversation history.
+
+        Nothing is flushed or committed here - the caller commits it together
+        with the usage deduction so both land in a single transaction.
+        """
+        conversation = Conversation(
+            user_id=user_id,
+            person_profile_id=profile_id,
+            mode=mode,
+            language=language,
+            title=question[:100],
+            messages=[
+                Message(
+                    role=MessageRole.USER,
+                    content=question,
+                    char_count=len(question),
+                ),
+                Message(
+                    role=MessageRole.ASSISTANT,
+                    content=response.full_response,
+                    char_count=len(response.full_response),
+                    response_metadata={
+                        "message_id": message_id,
+                        "empathy_line": response.empathy_line,
+                        "reasons": response.reasons,
+                        "direction": response.direction,
+                        "caution": response.caution,
+                        "data_points_used": response.data_points_used,
+                        "validation_passed": (
+                            response.validation.passed if response.validation else None
+                        ),
+                    },
+                    was_regenerated=(
+                        response.validation.was_regenerated if response.validation else False
+                    ),
+                ),
+            ],
+        )
+        self.db.add(conversation)
+        return conversation
+
     async def _get_profile_stats(self, profile_id: str) -> dict:
         """Get statistics for a profile."""
         # Conversation count
@@ -361,6 +497,9 @@ class PersonProfileService:
         )
         for profile in result.scalars():
             profile.is_primary = False
+        # Write the cleared flags before a new primary is set - at most one
+        # active primary per user is enforced by a unique partial index
+        await self.db.flush()
 
     async def _assign_new_primary(self, user_id: str, exclude_id: str) -> None:
         """Assign a new primary profile after deletion."""
@@ -0,0 +1,65 @@
+"""
+Response Cache - In-process cache for generated guidance.
+
+Repeat questions against an unchanged chart produce the same answer, so the
+LLM round-trip can be skipped. Entries are keyed on the exact prompt the LLM
+would receive (tier, chart data, mode, style, context and language are all
+baked into the system prompt) plus the normalized question.
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.schemas.guidance import GuidanceResponse
+
+
+class ResponseCache:
+    """Bounded LRU cache with a per-entry time-to-live."""
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, GuidanceResponse]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(tier: str, system_prompt: str, question: str) -> str:
+        """Build a cache key from the prompt and a normalized question."""
+        normalized = re.sub(r'[^\w\s]', '', question.lower())
+        normalized = ' '.join(normalized.split())
+        digest = hashlib.blake2s(digest_size=16)
+        for part in (tier, system_prompt, normalized):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[GuidanceResponse]:
+        """Return a cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: GuidanceResponse) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+# Shared across requests within a worker process
+guidance_cache = ResponseCache()
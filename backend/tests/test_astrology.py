@@ -173,6 +173,43 @@ class TestFallbackCalculations:
         assert with_time.has_birth_time is True
 
 
+class TestTransitsRange:
+    """Test transit computation over a date range."""
+
+    def test_range_matches_single_day_transits(self):
+        """Each entry should equal compute_transits for that date."""
+        start = date(2024, 1, 1)
+        transits = AstrologyEngine.compute_transits_range(start, date(2024, 1, 10), step_days=3)
+
+        assert [t.date for t in transits] == ["2024-01-01", "2024-01-04", "2024-01-07", "2024-01-10"]
+        for transit in transits:
+            expected = AstrologyEngine.compute_transits(date.fromisoformat(transit.date))
+            assert transit.model_dump() == expected.model_dump()
+
+    def test_range_rejects_non_positive_step(self):
+        """step_days must move forward."""
+        with pytest.raises(ValueError):
+            AstrologyEngine.compute_transits_range(date(2024, 1, 1), date(2024, 1, 2), step_days=0)
+
+
+class TestComputeBatch:
+    """Test bulk natal chart computation."""
+
+    def test_batch_matches_individual_computes_in_order(self):
+        """Results should line up with the requests, whatever their zodiac."""
+        requests = [
+            {"date_of_birth": date(1990, 5, 15)},
+            {"date_of_birth": date(1985, 1, 1), "zodiac": ZodiacSystem.TROPICAL},
+            {"date_of_birth": date(2000, 12, 31), "ayanamsa": AstrologyEngine.AYANAMSA_KP},
+            {"date_of_birth": date(1975, 7, 4)},
+        ]
+        charts = AstrologyEngine.compute_batch(requests)
+
+        assert len(charts) == len(requests)
+        for request, chart in zip(requests, charts):
+            assert chart.model_dump() == AstrologyEngine.compute(**request).model_dump()
+
+
 class TestSimpleSunSign:
     """Test tropical sun sign calculation (fallback)."""
 
@@ -173,6 +173,17 @@ class TestFullComputation:
         assert result1.soul_urge == result2.soul_urge
         assert result1.personality == result2.personality
 
+    def test_pinnacle_changes_on_birthday(self):
+        """Age turns over on the birthday itself, not after N*365 days."""
+        # Life Path 5 -> first pinnacle covers ages 0-31
+        dob = date(1990, 11, 29)
+
+        day_before = NumerologyEngine.compute("Jane Smith", dob, date(2022, 11, 28))
+        birthday = NumerologyEngine.compute("Jane Smith", dob, date(2022, 11, 29))
+
+        assert day_before.current_pinnacle_period == 1
+        assert birthday.current_pinnacle_period == 2
+
 
 class TestPythagoreanValues:
     """Test Pythagorean letter value mapping."""
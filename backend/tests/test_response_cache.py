@@ -0,0 +1,108 @@
+"""Tests for the in-process guidance response cache."""
+
+import pytest
+
+from app.services import response_cache
+from app.services.response_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic inside the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestMakeKey:
+    """Test cache key construction and question normalization."""
+
+    def test_case_punctuation_and_spacing_ignored(self):
+        """Trivially different phrasings of a question share a key."""
+        key = ResponseCache.make_key("free", "prompt", "Will I get the job?")
+        assert ResponseCache.make_key("free", "prompt", "will i get the job") == key
+        assert ResponseCache.make_key("free", "prompt", "  WILL I   get the job?!  ") == key
+
+    def test_different_question_different_key(self):
+        """Different wording is a different question."""
+        key = ResponseCache.make_key("free", "prompt", "Will I get the job?")
+        assert ResponseCache.make_key("free", "prompt", "Will I get the house?") != key
+
+    def test_tier_and_prompt_are_part_of_key(self):
+        """Same question under another tier or prompt does not collide."""
+        key = ResponseCache.make_key("free", "prompt", "question")
+        assert ResponseCache.make_key("pro", "prompt", "question") != key
+        assert ResponseCache.make_key("free", "other prompt", "question") != key
+
+    def test_parts_cannot_run_together(self):
+        """Moving text between parts changes the key."""
+        assert (
+            ResponseCache.make_key("free", "ab", "c")
+            != ResponseCache.make_key("free", "a", "bc")
+        )
+
+
+class TestExpiry:
+    """Test per-entry time-to-live."""
+
+    def test_hit_within_ttl(self, clock):
+        """Entries are served until their TTL runs out."""
+        cache = ResponseCache(ttl_seconds=60)
+        response = object()
+        cache.set("k", response)
+
+        clock[0] += 60
+        assert cache.get("k") is response
+
+    def test_miss_after_ttl(self, clock):
+        """Expired entries are dropped on read."""
+        cache = ResponseCache(ttl_seconds=60)
+        cache.set("k", object())
+
+        clock[0] += 61
+        assert cache.get("k") is None
+        assert "k" not in cache._entries
+
+    def test_set_refreshes_ttl(self, clock):
+        """Re-storing a key restarts its TTL."""
+        cache = ResponseCache(ttl_seconds=60)
+        cache.set("k", object())
+        clock[0] += 50
+        response = object()
+        cache.set("k", response)
+
+        clock[0] += 50
+        assert cache.get("k") is response
+
+
+class TestEviction:
+    """Test LRU eviction when the cache is full."""
+
+    def test_oldest_entry_evicted(self):
+        """Adding past max_entries drops the least recently stored entry."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", object())
+        cache.set("b", object())
+        cache.set("c", object())
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_read_marks_entry_recently_used(self):
+        """A hit protects the entry from the next eviction."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", object())
+        cache.set("b", object())
+        cache.get("a")
+        cache.set("c", object())
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_clear(self):
+        """clear() drops every entry."""
+        cache = ResponseCache()
+        cache.set("a", object())
+        cache.clear()
+        assert cache.get("a") is None
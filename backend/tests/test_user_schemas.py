@@ -0,0 +1,32 @@
+"""Tests for user/profile request schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.user import ResponseStyle
+from app.schemas.user import ProfileUpdate
+
+
+class TestProfileUpdate:
+    """PATCH /users/profile payload validation."""
+
+    @pytest.mark.parametrize("field", ["response_style", "full_name"])
+    def test_null_rejected_for_not_null_columns(self, field):
+        """Explicit null would write NULL into a NOT NULL column."""
+        with pytest.raises(ValidationError):
+            ProfileUpdate.model_validate({field: None})
+
+    def test_omitted_fields_not_set(self):
+        """Leaving a field out is still allowed and leaves it unset."""
+        update = ProfileUpdate.model_validate({"display_name": "Sam"})
+        assert update.model_dump(exclude_unset=True) == {"display_name": "Sam"}
+
+    def test_response_style_value_accepted(self):
+        """A real value passes through unchanged."""
+        update = ProfileUpdate.model_validate({"response_style": "direct"})
+        assert update.response_style == ResponseStyle.DIRECT
+
+    def test_nullable_field_can_be_cleared(self):
+        """Nullable columns like display_name can still be cleared."""
+        update = ProfileUpdate.model_validate({"display_name": None})
+        assert update.model_dump(exclude_unset=True) == {"display_name": None}